@@ -0,0 +1,57 @@
+"""
+Benchmarks of the energy yield of many designs (scaled power curves) at many sites and of the
+wind profile reconstruction and terrain constraint checks at many points.
+"""
+import numpy as np
+import pytest
+
+from awesio.analysis import PowerCurves, TerrainConstraints, WindResource, annual_energy_production
+
+from conftest import EXAMPLES_PATH, measure
+
+# (n_designs, n_sites)
+PAIRS = [(1, 1), (100, 100), (1000, 1000)]
+
+
+@pytest.fixture(scope="module")
+def example_power_curves():
+    return PowerCurves.from_document(EXAMPLES_PATH / "ground_gen" / "soft_kite_pumping_ground_gen_power_curves.yml")
+
+
+@pytest.fixture(scope="module")
+def example_wind_resource():
+    return WindResource.from_document(EXAMPLES_PATH / "wind_resource.yml")
+
+
+@pytest.mark.parametrize("n_designs, n_sites", PAIRS, ids=[f"{d}x{s}" for d, s in PAIRS])
+def bench_annual_energy_production(benchmark, example_power_curves, example_wind_resource, n_designs, n_sites):
+    rng = np.random.default_rng(0)
+    designs = [
+        PowerCurves(example_power_curves.profile_ids, example_power_curves.wind_speeds_m_s,
+                    example_power_curves.power_w * scale)
+        for scale in rng.uniform(0.5, 2.0, n_designs)
+    ]
+    sites = []
+    for _ in range(n_sites):
+        probability = example_wind_resource.probability * rng.uniform(0.5, 2.0, example_wind_resource.probability.shape)
+        sites.append(WindResource(example_wind_resource.cluster_ids, example_wind_resource.wind_speeds_m_s,
+                                  probability / probability.sum()))
+    measure(benchmark, annual_energy_production, designs, sites)
+
+
+@pytest.mark.parametrize("n_points", [10**3, 10**6], ids=["1e3", "1e6"])
+def bench_wind(benchmark, example_wind_resource, n_points):
+    rng = np.random.default_rng(0)
+    cluster_ids = rng.choice(example_wind_resource.cluster_ids, n_points)
+    altitudes = rng.uniform(0, 500, n_points)
+    reference_wind_speeds = rng.uniform(3, 25, n_points)
+    measure(benchmark, example_wind_resource.wind, cluster_ids, altitudes, reference_wind_speeds)
+
+
+@pytest.mark.parametrize("n_points", [10**3, 10**6], ids=["1e3", "1e6"])
+def bench_terrain_constraints(benchmark, n_points):
+    constraints = TerrainConstraints.from_document(
+        EXAMPLES_PATH / "ground_gen" / "soft_kite_pumping_ground_gen_operational_constraints.yml"
+    )
+    points = np.random.default_rng(0).uniform([-600, -600, 0], [600, 600, 600], (n_points, 3))
+    measure(benchmark, constraints.is_allowed, points)
@@ -0,0 +1,43 @@
+"""
+Benchmarks of loading, writing and validating the bundled example files.
+"""
+import pytest
+
+from awesio.validator import _validate_data_consistency, validate
+from awesio.yaml import load_yaml, write_yaml
+
+from conftest import EXAMPLES_PATH, example_files, measure
+
+EXAMPLE_FILES = example_files()
+EXAMPLE_IDS = [str(path.relative_to(EXAMPLES_PATH)) for path in EXAMPLE_FILES]
+
+
+@pytest.fixture(params=EXAMPLE_FILES, ids=EXAMPLE_IDS)
+def example(request):
+    return request.param
+
+
+@pytest.mark.parametrize("fast", [False, True], ids=["pure", "fast"])
+def bench_load_yaml(benchmark, example, fast):
+    measure(benchmark, load_yaml, example, fast=fast)
+
+
+@pytest.mark.parametrize("fast", [False, True], ids=["pure", "fast"])
+def bench_write_yaml(benchmark, example, tmp_path, fast):
+    data = load_yaml(example, fast=True)
+    measure(benchmark, write_yaml, data, tmp_path / example.name, fast=fast)
+
+
+@pytest.mark.parametrize(
+    "restrictive, defaults", [(True, False), (True, True), (False, False)],
+    ids=["restrictive", "defaults", "permissive"],
+)
+def bench_validate(benchmark, example, restrictive, defaults):
+    data = load_yaml(example, fast=True)
+    measure(benchmark, validate, data, restrictive=restrictive, defaults=defaults)
+
+
+def bench_consistency(benchmark, example):
+    data = load_yaml(example, fast=True)
+    schema_type = data["metadata"]["schema"].replace(".yml", "").replace(".yaml", "")
+    measure(benchmark, _validate_data_consistency, data, schema_type)
@@ -0,0 +1,77 @@
+"""
+Benchmarks of synthetic wind resource and power curves documents (see `awesio.generate`) scaled
+along each dimension (clusters, altitudes, wind speed bins and wind direction bins) to show how
+the costs grow.
+"""
+import pytest
+
+from awesio.generate import generate_power_curves, generate_wind_resource
+from awesio.validator import _validate_data_consistency, validate
+from awesio.yaml import _get_YAML, load_yaml, write_yaml
+
+from conftest import count_values, measure
+
+# (n_clusters, n_altitudes, n_wind_speed_bins, n_wind_direction_bins), the first one is the
+# size of examples/wind_resource.yml and the others scale one dimension each
+WIND_RESOURCE_SIZES = [
+    (8, 51, 50, 36),
+    (16, 51, 50, 36),
+    (32, 51, 50, 36),
+    (8, 204, 50, 36),
+    (8, 51, 100, 36),
+    (8, 51, 50, 72),
+]
+# (n_curves, n_altitudes, n_wind_speeds)
+POWER_CURVES_SIZES = [
+    (8, 51, 50),
+    (32, 51, 50),
+    (128, 51, 50),
+    (8, 204, 50),
+    (8, 51, 200),
+]
+
+
+DOCUMENTS = [("wind_resource", size) for size in WIND_RESOURCE_SIZES] + [
+    ("power_curves", size) for size in POWER_CURVES_SIZES
+]
+
+
+def _document_id(document):
+    kind, size = document
+    return f"{kind}-{'x'.join(map(str, size))}"
+
+
+@pytest.fixture(scope="module", params=DOCUMENTS, ids=_document_id)
+def document(request, tmp_path_factory):
+    kind, size = request.param
+    path = tmp_path_factory.mktemp("synthetic") / "document.yml"
+    generator = generate_wind_resource if kind == "wind_resource" else generate_power_curves
+    generator(path, *size)
+    return load_yaml(path, fast=True)
+
+
+@pytest.mark.parametrize("copy", [True, False], ids=["copy", "in_place"])
+@pytest.mark.parametrize("defaults", [False, True], ids=["restrictive", "defaults"])
+def bench_validate(benchmark, document, defaults, copy):
+    measure(benchmark, validate, document, defaults=defaults, copy=copy, n_values=count_values(document))
+
+
+def bench_consistency(benchmark, document):
+    schema_type = document["metadata"]["schema"].replace(".yml", "")
+    measure(
+        benchmark, _validate_data_consistency, document, schema_type, n_values=count_values(document)
+    )
+
+
+@pytest.mark.parametrize("fast", [False, True], ids=["pure", "fast"])
+def bench_write_yaml(benchmark, document, tmp_path, fast):
+    measure(
+        benchmark, write_yaml, document, tmp_path / "document.yml", fast=fast, n_values=count_values(document)
+    )
+
+
+@pytest.mark.parametrize("mode", ["lists", "numpy", "stream"])
+def bench_load_yaml(benchmark, document, tmp_path, mode):
+    write_yaml(document, tmp_path / "document.yml")
+    options = {"numpy": {"loader": _get_YAML(read_numpy=True, fast=True)}, "stream": {"stream": True}}.get(mode, {})
+    measure(benchmark, load_yaml, tmp_path / "document.yml", fast=True, n_values=count_values(document), **options)
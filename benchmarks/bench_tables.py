@@ -0,0 +1,38 @@
+"""
+Benchmarks of the columnar ``headers``/``data`` tables: converting row lists to structured arrays
+and reading a column from the rows against a view of the structured array.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from awesio.tables import to_table
+
+from conftest import measure
+
+HEADERS = ["id", "x", "y", "z", "type"]
+N_ROWS = [10**3, 10**5]
+
+
+def _rows(n_rows: int) -> list[list]:
+    rng = np.random.default_rng(0)
+    coordinates = rng.normal(size=(n_rows, 3)).tolist()
+    return [[i + 1, *xyz, "knot" if i % 2 else "pulley"] for i, xyz in enumerate(coordinates)]
+
+
+@pytest.mark.parametrize("n_rows", N_ROWS, ids=["1e3", "1e5"])
+def bench_to_table(benchmark, n_rows):
+    rows = _rows(n_rows)
+    measure(benchmark, to_table, HEADERS, rows, n_values=n_rows * len(HEADERS))
+
+
+@pytest.mark.parametrize("layout", ["rows", "table"])
+@pytest.mark.parametrize("n_rows", N_ROWS, ids=["1e3", "1e5"])
+def bench_column(benchmark, n_rows, layout):
+    rows = _rows(n_rows)
+    if layout == "rows":
+        measure(benchmark, lambda: np.array([row[1] for row in rows]))
+    else:
+        table = to_table(HEADERS, rows)
+        measure(benchmark, lambda: table["x"])
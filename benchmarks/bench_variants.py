@@ -0,0 +1,44 @@
+"""
+Benchmarks of parameter sweeps over the example system document: validated overlay variants
+against a deep copy and full validation of every variant.
+"""
+import copy
+
+import pytest
+
+from awesio.validator import validate
+from awesio.variants import ParameterSweep
+
+from conftest import EXAMPLES_PATH, measure
+
+SYSTEM_FILE = EXAMPLES_PATH / "ground_gen" / "soft_kite_pumping_ground_gen_system.yml"
+N_VARIANTS = 200
+
+
+@pytest.fixture(scope="module")
+def sweep():
+    return ParameterSweep(SYSTEM_FILE, {
+        "components.tether.structure.diameter_m": [0.01 + 1e-4 * i for i in range(N_VARIANTS // 4)],
+        "components.wing.structure.mass_kg": [40.0, 45.0, 50.0, 55.0],
+    })
+
+
+def _overlay_variants(sweep):
+    for variant in sweep:
+        variant.to_dict()
+
+
+def _copied_variants(sweep):
+    for index in range(len(sweep)):
+        data = copy.deepcopy(sweep.base)
+        for path, value in sweep.overrides(index).items():
+            parent = data
+            for key in path[:-1]:
+                parent = parent[key]
+            parent[path[-1]] = value
+        validate(data)
+
+
+@pytest.mark.parametrize("func", [_overlay_variants, _copied_variants], ids=["overlay", "deepcopy"])
+def bench_sweep_variants(benchmark, sweep, func):
+    measure(benchmark, func, sweep)
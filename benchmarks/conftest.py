@@ -0,0 +1,77 @@
+"""
+Shared helpers of the benchmark suite (run with ``pixi run bench``).
+
+Every benchmark records the peak memory of one extra (traced) run in ``extra_info`` and,
+for the synthetic documents, the throughput in numeric values per second, so that the
+saved results (``--benchmark-autosave``) can be compared between releases with
+``pytest-benchmark compare``.
+"""
+from __future__ import annotations
+
+import importlib.util
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from awesio.validator import warm_validator_cache
+
+
+def _load_test_helpers():
+    """Imports ``tests/conftest.py`` (under another name, as this module is also ``conftest``)."""
+    spec = importlib.util.spec_from_file_location("_tests_conftest", Path(__file__).parent.parent / "tests" / "conftest.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# The examples are shared with the test suite
+_test_helpers = _load_test_helpers()
+EXAMPLES_PATH = _test_helpers.EXAMPLES_PATH
+example_files = _test_helpers.example_files
+
+
+def measure(benchmark, func, *args, n_values: int | None = None, **kwargs):
+    """
+    Benchmarks ``func(*args, **kwargs)`` and records its peak memory and throughput.
+
+    Args:
+        benchmark: The pytest-benchmark fixture.
+        func (Callable): Function to benchmark.
+        n_values (int, optional): Number of numeric values processed per call, used to report
+            the throughput in ``extra_info["values_per_s"]``. Defaults to None.
+
+    Returns:
+        The result of ``func``.
+    """
+    tracemalloc.start()
+    try:
+        func(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["peak_memory_mb"] = round(peak / 2**20, 3)
+
+    result = benchmark(func, *args, **kwargs)
+    if n_values is not None and benchmark.stats:  # No stats with --benchmark-disable
+        benchmark.extra_info["n_values"] = n_values
+        benchmark.extra_info["values_per_s"] = n_values / benchmark.stats.stats.mean
+    return result
+
+
+def count_values(data) -> int:
+    """Returns the number of numeric values in ``data``."""
+    if isinstance(data, dict):
+        return sum(count_values(value) for value in data.values())
+    elif isinstance(data, list):
+        return sum(count_values(value) for value in data)
+    elif isinstance(data, np.ndarray):
+        return data.size
+    return int(isinstance(data, (int, float)) and not isinstance(data, bool))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_validators():
+    """Compiles the validators up front so that the validation benchmarks only time the validation."""
+    warm_validator_cache(restrictive=[True, False], defaults=[False, True])
@@ -0,0 +1,47 @@
+"""
+Benchmark the import time of the awesio modules and check that the heavy dependencies
+(NumPy, xarray, netCDF4) are not imported with them.
+
+Convenience wrapper around the check of ``tests/test_import_time.py`` (run by ``pixi run test``)
+which also reports the import times. Each import is timed in a fresh interpreter. The script
+exits with status 1 if a heavy dependency is imported or if an import is slower than the limit.
+
+Usage:
+    python benchmark_import_time.py [n_repeat] [max_seconds]
+"""
+
+import sys
+from pathlib import Path
+
+ROOT_PATH = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_PATH / "src"))
+sys.path.insert(0, str(ROOT_PATH / "tests"))
+
+from test_import_time import HEAVY_MODULES, MODULES, probe_import
+
+
+def import_time(module, n_repeat):
+    """Returns the best import time of ``module`` in ``n_repeat`` fresh interpreters and the heavy modules it imported."""
+    results = [probe_import(module) for _ in range(n_repeat)]
+    return min(result["time"] for result in results), results[-1]["heavy"]
+
+
+def main():
+    n_repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    max_seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 0.5
+
+    print(f"{'Module':<30} {'import [s]':>12}  heavy modules imported")
+    print(f"{'='*70}")
+    failed = False
+    for module in MODULES:
+        best, heavy = import_time(module, n_repeat)
+        status = "[FAIL]" if heavy or best > max_seconds else "[PASS]"
+        failed |= status == "[FAIL]"
+        print(f"{module:<30} {best:>12.4f}  {', '.join(heavy) or '-'} {status}")
+    print(f"{'='*70}")
+    print(f"Limit: {max_seconds} s, no heavy modules ({', '.join(HEAVY_MODULES)})")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
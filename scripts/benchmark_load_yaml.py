@@ -0,0 +1,54 @@
+"""
+Benchmark loading the example YAML files with the pure-python and the C (libyaml) parser.
+
+Usage:
+    python benchmark_load_yaml.py [n_repeat]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add src to path to import awesio
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from awesio.yaml import load_yaml
+
+
+EXAMPLES_PATH = Path(__file__).parent.parent / "examples"
+
+
+def best_time(filename, fast, n_repeat):
+    """Returns the best wall time of ``n_repeat`` loads of ``filename``."""
+    times = []
+    for _ in range(n_repeat):
+        tic = time.perf_counter()
+        load_yaml(filename, fast=fast)
+        times.append(time.perf_counter() - tic)
+    return min(times)
+
+
+def main():
+    n_repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    files = sorted(EXAMPLES_PATH.glob("**/*.yml"))
+
+    print(f"{'File':<70} {'pure [s]':>10} {'fast [s]':>10} {'speedup':>8}")
+    print(f"{'='*101}")
+    total_pure = total_fast = 0.0
+    for file_path in files:
+        # Make sure both modes give the same result before timing
+        if load_yaml(file_path) != load_yaml(file_path, fast=True):
+            print(f"[FAIL] Results differ for {file_path}")
+            sys.exit(1)
+        t_pure = best_time(file_path, False, n_repeat)
+        t_fast = best_time(file_path, True, n_repeat)
+        total_pure += t_pure
+        total_fast += t_fast
+        name = str(file_path.relative_to(EXAMPLES_PATH))
+        print(f"{name:<70} {t_pure:>10.4f} {t_fast:>10.4f} {t_pure/t_fast:>7.1f}x")
+    print(f"{'='*101}")
+    print(f"{'Total':<70} {total_pure:>10.4f} {total_fast:>10.4f} {total_pure/total_fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Compile the YAML schemas into the pre-parsed bundle loaded by the validator
+(``src/awesio/schemas/schemas_bundle.json``).
+
+The bundle holds every schema in its plain and restrictive variant, so a cold start does not
+parse any YAML. The YAML files stay the source of truth: an entry whose source changed since
+the bundle was built is ignored (and parsed from YAML) until the bundle is rebuilt.
+
+Usage:
+    python build_schema_bundle.py          # Rebuild the bundle
+    python build_schema_bundle.py --check  # Exit with status 1 if the bundle is out of date (CI)
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path to import awesio
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from awesio.schemas import BUNDLE_PATH, build_schema_bundle, stale_schemas, write_schema_bundle
+from awesio.validator import _build_validator
+
+
+def main():
+    if "--check" in sys.argv[1:]:
+        stale = stale_schemas()
+        if stale:
+            print(f"[FAIL] {BUNDLE_PATH.name} is out of date for: {', '.join(stale)}")
+            print("Rebuild it with: python scripts/build_schema_bundle.py")
+            sys.exit(1)
+        print(f"[PASS] {BUNDLE_PATH.name} is up to date")
+        return
+
+    for schema_type, entry in build_schema_bundle()["schemas"].items():
+        for variant in ["schema", "restrictive"]:
+            _build_validator(entry[variant])  # Check the schemas before bundling them
+        print(f"{schema_type:<35} {entry['source']}")
+    write_schema_bundle()
+    print(f"Written {BUNDLE_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,69 +1,26 @@
 """
-Validate YAML configuration files using awesIO schemas.
+Validate the example files with the ``awesio validate`` command (see `awesio.cli`).
 
 Usage:
-    Edit the FILES_TO_VALIDATE list below, then run:
-    python validate_yaml.py
+    python validate_yaml.py [awesio validate arguments]
+
+Without arguments, the awesIO documents of the examples folder are validated. Prefer calling
+``awesio validate`` directly.
 """
 
 import sys
 from pathlib import Path
 
-# Add src to path to import awesio
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from awesio.validator import validate
+ROOT_PATH = Path(__file__).parent.parent
 
+# Add src to path to import awesio
+sys.path.insert(0, str(ROOT_PATH / "src"))
 
-# ============================================================================
-# FILES TO VALIDATE - Edit this list to add/remove files
-# ============================================================================
-FILES_TO_VALIDATE = [
-    "examples/wind_resource.yml",
-    "examples/ground_gen/soft_kite_pumping_ground_gen_system.yml",
-    "examples/ground_gen/soft_kite_pumping_ground_gen_operational_constraints.yml",
-    "examples/ground_gen/soft_kite_pumping_ground_gen_power_curves.yml",
-]
-# ============================================================================
-
+from awesio.cli import main
 
-def main():
-    # Convert to Path objects
-    file_paths = [Path(f) for f in FILES_TO_VALIDATE]
-    
-    # Validate each file
-    results = []
-    for file_path in file_paths:
-        if not file_path.exists():
-            print(f"\n[FAIL] File not found: {file_path}")
-            results.append((file_path, False))
-            continue
-            
-        try:
-            print(f"\nValidating: {file_path}")
-            data = validate(file_path)
-            schema_name = data["metadata"]["schema"]
-            print(f"Schema: {schema_name}")
-            print(f"[PASS]")
-            results.append((file_path, True))
-        except Exception as e:
-            print(f"[FAIL]: {e}")
-            results.append((file_path, False))
-    
-    # Summary
-    print(f"\n{'='*70}")
-    passed = sum(1 for _, success in results if success)
-    failed = len(results) - passed
-    
-    for file_path, success in results:
-        status = "[PASS]" if success else "[FAIL]"
-        print(f"{status} {file_path.name}")
-    
-    print(f"\nTotal: {len(results)} | Passed: {passed} | Failed: {failed}")
-    print(f"{'='*70}")
-    
-    sys.exit(0 if failed == 0 else 1)
+# Examples validated when no path is given (examples/original_config_files are not awesIO documents)
+EXAMPLES = [str(ROOT_PATH / "examples" / "*.yml"), str(ROOT_PATH / "examples" / "ground_gen" / "*.yml")]
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main(["validate", *(sys.argv[1:] or EXAMPLES)]))
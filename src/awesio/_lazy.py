@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import importlib
+import sys
+
+
+class LazyModule:
+    """
+    Module proxy which only imports the module on first attribute access.
+
+    Used for the heavy dependencies (NumPy, xarray, netCDF4) so that ``import awesio.validator``
+    stays fast and they are only imported by the code paths that use them.
+    """
+
+    def __init__(self, name: str, requires: tuple[str, ...] = ()):
+        """
+        Args:
+            name (str): Name of the module.
+            requires (tuple[str, ...], optional): Modules to import before ``name``. Defaults to ().
+        """
+        self.__name = name
+        self.__requires = requires
+
+    def __getattr__(self, attr: str):
+        for name in self.__requires:
+            importlib.import_module(name)
+        module = importlib.import_module(self.__name)
+        # Cache the attributes on the proxy so that later lookups are plain attribute access
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+    @property
+    def loaded(self) -> bool:
+        """True if the module has been imported (by anyone). If not, no object can be an instance of its types."""
+        return self.__name in sys.modules
+
+    def __repr__(self) -> str:
+        return f"<lazy module {self.__name!r}>"
+
+
+np = LazyModule("numpy")
+# netCDF4 is imported first to avoid the warning: RuntimeWarning: numpy.ndarray size changed, may
+# indicate binary incompatibility. Expected 16 from C header, got 96 from PyObject
+xr = LazyModule("xarray", requires=("netCDF4",))
@@ -0,0 +1,754 @@
+"""
+Energy yield of AWE systems, wind profiles and terrain constraints from awesIO documents.
+
+The documents are loaded once into NumPy arrays (`PowerCurves` and `WindResource`). The power
+curves of all profiles (and of all designs sharing the same wind speed grid) are interpolated at
+once and the annual energy production of every design/site pair is a single tensor contraction
+over clusters and wind speed bins, so thousands of pairs are scored in seconds.
+
+Example:
+    >>> from awesio.analysis import PowerCurves, WindResource, annual_energy_production, capacity_factor
+    >>> power_curves = PowerCurves.from_document("examples/ground_gen/soft_kite_pumping_ground_gen_power_curves.yml")
+    >>> wind_resource = WindResource.from_document("examples/wind_resource.yml")
+    >>> annual_energy_production(power_curves, wind_resource)  # Wh
+    >>> capacity_factor(power_curves, [wind_resource, ...])  # One value per site
+    >>> speed, direction = wind_resource.wind(cluster_ids, altitudes, reference_wind_speeds)
+    >>> constraints = TerrainConstraints.from_document("operational_constraints.yml")
+    >>> constraints.is_allowed(flight_path)  # (n_points, 3) east, north, height above ground
+    >>> sweep_sites(power_curves, ["site_1.yml", "site_2.yml", ...], workers=8)  # One row per site
+"""
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import closing
+from multiprocessing import resource_tracker, shared_memory
+from pathlib import Path
+from typing import Sequence
+
+from ._lazy import np
+from .validator import _get_schema_type
+from .yaml import _is_netcdf, load, load_yaml
+
+HOURS_PER_YEAR = 8760.0
+
+
+def _load_document(input: dict | str | Path, schema_type: str) -> dict:
+    """Loads ``input`` (if it is a path) and checks that it is a ``schema_type`` document."""
+    data = input if isinstance(input, dict) else load(input)
+    if _get_schema_type(data) != schema_type:
+        raise ValueError(f"Expected a {schema_type}.yml document, got {data['metadata']['schema']}.")
+    return data
+
+
+def _stack(rows: list, name: str):
+    """Stacks equally long rows into a 2D float array."""
+    try:
+        return np.array([np.asarray(row, dtype=float) for row in rows], dtype=float)
+    except ValueError:
+        raise ValueError(f"All {name} must have the same length.") from None
+
+
+def _check_grid(values, name: str) -> None:
+    if values.ndim != 1 or len(values) < 2 or not np.all(np.diff(values) > 0):
+        raise ValueError(f"{name} must be a strictly increasing list of at least 2 values.")
+
+
+def _id_rows(ids, wanted, name: str):
+    """Returns the positions of the ``wanted`` ids (any shape) in ``ids``."""
+    wanted = np.asarray(wanted, dtype=int)
+    if len(ids) == 0:
+        raise ValueError(f"No {name} for the ids {np.unique(wanted).tolist()}.")
+    order = np.argsort(ids)
+    rows = order[np.clip(np.searchsorted(ids, wanted, sorter=order), 0, len(order) - 1)]
+    missing = ids[rows] != wanted
+    if missing.any():
+        raise ValueError(f"No {name} for the ids {np.unique(wanted[missing]).tolist()}.")
+    return rows
+
+
+def _interp(x, xp, fp):
+    """
+    Linearly interpolates every row of ``fp`` (sampled at ``xp``) at the points ``x``.
+
+    Unlike `numpy.interp` the rows are interpolated together: the intervals of ``x`` are searched
+    once. Outside of ``xp`` the result is 0 (below cut-in and above cut-out wind speed).
+
+    Returns:
+        np.ndarray: Array of shape ``fp.shape[:-1] + x.shape``.
+    """
+    x = np.asarray(x, dtype=float)
+    index = np.clip(np.searchsorted(xp, x, side="right") - 1, 0, len(xp) - 2)
+    weight = (x - xp[index]) / (xp[index + 1] - xp[index])
+    result = fp[..., index] * (1 - weight) + fp[..., index + 1] * weight
+    result[..., (x < xp[0]) | (x > xp[-1])] = 0.0
+    return result
+
+
+class PowerCurves:
+    """
+    Cycle power curves of all profiles of a power curves document (``power_curves_schema.yml``).
+
+    Attributes:
+        profile_ids (np.ndarray): Profile ids, matching the wind resource cluster ids (n_profiles).
+        wind_speeds_m_s (np.ndarray): Reference wind speeds of the power curves (n_wind_speeds).
+        power_w (np.ndarray): Cycle power per profile and wind speed (n_profiles x n_wind_speeds).
+        probability_weights (np.ndarray): Probability weight of each profile (n_profiles).
+        nominal_power_w (float | None): Nominal power of the system, used for the capacity factor.
+        reference_height_m (float | None): Height of the reference wind speeds.
+    """
+
+    def __init__(
+        self,
+        profile_ids,
+        wind_speeds_m_s,
+        power_w,
+        probability_weights=None,
+        nominal_power_w: float | None = None,
+        reference_height_m: float | None = None,
+    ):
+        self.profile_ids = np.asarray(profile_ids, dtype=int)
+        self.wind_speeds_m_s = np.asarray(wind_speeds_m_s, dtype=float)
+        self.power_w = np.asarray(power_w, dtype=float)
+        self.probability_weights = None if probability_weights is None else np.asarray(probability_weights, dtype=float)
+        self.nominal_power_w = nominal_power_w
+        self.reference_height_m = reference_height_m
+
+        _check_grid(self.wind_speeds_m_s, "reference_wind_speeds_m_s")
+        if self.power_w.shape != (len(self.profile_ids), len(self.wind_speeds_m_s)):
+            raise ValueError(
+                f"power_w must have the shape (n_profiles, n_wind_speeds) = "
+                f"{(len(self.profile_ids), len(self.wind_speeds_m_s))}, got {self.power_w.shape}."
+            )
+
+    @classmethod
+    def from_document(cls, input: dict | str | Path) -> PowerCurves:
+        """
+        Loads the power curves of a power curves document.
+
+        Args:
+            input (dict | str | Path): Document as a dictionary or a path to a YAML or NetCDF file.
+
+        Raises:
+            ValueError: If the document is not a power curves document or has no (or ragged)
+                ``cycle_power_w`` curves.
+        """
+        data = _load_document(input, "power_curves_schema")
+        curves = data["power_curves"]
+        if not all("cycle_power_w" in curve for curve in curves):
+            raise ValueError("All power curves must have cycle_power_w.")
+        metadata = data["metadata"]
+        return cls(
+            profile_ids=[curve["profile_id"] for curve in curves],
+            wind_speeds_m_s=data["reference_wind_speeds_m_s"],
+            power_w=_stack([curve["cycle_power_w"] for curve in curves], "cycle_power_w curves"),
+            probability_weights=[curve["probability_weight"] for curve in curves],
+            nominal_power_w=metadata.get("model_config", {}).get("nominal_power_w"),
+            reference_height_m=metadata.get("wind_resource", {}).get("reference_height_m"),
+        )
+
+    def power(self, wind_speeds_m_s, profile_ids=None):
+        """
+        Returns the cycle power of the profiles at arbitrary reference wind speeds.
+
+        Args:
+            wind_speeds_m_s (array_like): Reference wind speeds (any shape).
+            profile_ids (array_like, optional): Profiles to evaluate, in this order. Defaults to
+                None (all profiles in document order).
+
+        Raises:
+            ValueError: If a profile id is not in the power curves.
+
+        Returns:
+            np.ndarray: Power [W] of shape ``(n_profiles,) + wind_speeds_m_s.shape``, 0 outside of
+            the reference wind speed range.
+        """
+        return _interp(wind_speeds_m_s, self.wind_speeds_m_s, self.power_w[self._rows(profile_ids)])
+
+    def _rows(self, profile_ids) -> np.ndarray | slice:
+        """Returns the rows of ``power_w`` of the given profile ids."""
+        if profile_ids is None:
+            return slice(None)
+        return _id_rows(self.profile_ids, profile_ids, "power curves")
+
+
+class WindResource:
+    """
+    Wind speed distribution and wind profiles per cluster of a wind resource document (``wind_resource_schema.yml``).
+
+    The wind profiles of all clusters are kept as one (n_clusters x n_altitudes) array per component,
+    together with the slope of every altitude interval, so that `wind` and `wind_components`
+    reconstruct the wind at any number of (cluster, altitude, reference wind speed) points with a
+    few array operations.
+
+    Attributes:
+        cluster_ids (np.ndarray): Cluster ids (n_clusters).
+        wind_speeds_m_s (np.ndarray): Wind speed bin centers at the reference height (n_wind_speed_bins).
+        probability (np.ndarray): Probability of each cluster and wind speed bin, summed over the
+            wind directions and normalized to a total of 1 (n_clusters x n_wind_speed_bins).
+        reference_height_m (float | None): Height of the wind speeds.
+        altitudes_m (np.ndarray | None): Altitudes of the wind profiles (n_altitudes).
+        u_normalized (np.ndarray | None): Wind speed component along the reference wind direction,
+            normalized by the reference wind speed (n_clusters x n_altitudes).
+        v_normalized (np.ndarray | None): Normalized wind speed component perpendicular to the
+            reference wind direction (n_clusters x n_altitudes).
+        u_ref_mean_m_s (np.ndarray | None): Mean reference wind speed of each cluster (n_clusters).
+    """
+
+    def __init__(
+        self,
+        cluster_ids,
+        wind_speeds_m_s,
+        probability,
+        reference_height_m: float | None = None,
+        altitudes_m=None,
+        u_normalized=None,
+        v_normalized=None,
+        u_ref_mean_m_s=None,
+    ):
+        self.cluster_ids = np.asarray(cluster_ids, dtype=int)
+        self.wind_speeds_m_s = np.asarray(wind_speeds_m_s, dtype=float)
+        self.probability = np.asarray(probability, dtype=float)
+        self.reference_height_m = reference_height_m
+        self.u_ref_mean_m_s = None if u_ref_mean_m_s is None else np.asarray(u_ref_mean_m_s, dtype=float)
+
+        if self.probability.shape != (len(self.cluster_ids), len(self.wind_speeds_m_s)):
+            raise ValueError(
+                f"probability must have the shape (n_clusters, n_wind_speed_bins) = "
+                f"{(len(self.cluster_ids), len(self.wind_speeds_m_s))}, got {self.probability.shape}."
+            )
+
+        self.altitudes_m = self.u_normalized = self.v_normalized = None
+        if altitudes_m is not None:
+            self.altitudes_m = np.asarray(altitudes_m, dtype=float)
+            self.u_normalized = np.asarray(u_normalized, dtype=float)
+            self.v_normalized = np.asarray(v_normalized, dtype=float)
+            _check_grid(self.altitudes_m, "altitudes")
+            shape = (len(self.cluster_ids), len(self.altitudes_m))
+            if self.u_normalized.shape != shape or self.v_normalized.shape != shape:
+                raise ValueError(f"u_normalized and v_normalized must have the shape (n_clusters, n_altitudes) = {shape}.")
+
+            # Profile value at the start and slope of every altitude interval (2 x n_clusters x n_intervals)
+            profiles = np.stack([self.u_normalized, self.v_normalized])
+            self._start = profiles[..., :-1]
+            self._slope = np.diff(profiles, axis=-1) / np.diff(self.altitudes_m)
+            steps = np.diff(self.altitudes_m)
+            # On a uniform grid the interval index is computed directly instead of searched
+            self._step = steps[0] if np.allclose(steps, steps[0], rtol=1e-12, atol=0) else None
+
+    @classmethod
+    def from_document(cls, input: dict | str | Path) -> WindResource:
+        """
+        Loads the wind speed distribution per cluster of a wind resource document.
+
+        The probability matrix is summed over the wind direction bins and normalized to a total of 1.
+        Without ``bin_centers_m_s`` the wind speed bin centers are the midpoints of ``bin_edges_m_s``.
+
+        Args:
+            input (dict | str | Path): Document as a dictionary or a path to a YAML or NetCDF file.
+
+        Raises:
+            ValueError: If the document is not a wind resource document, has no wind speed bins
+                or the probability matrix does not match the clusters and bins.
+        """
+        data = _load_document(input, "wind_resource_schema")
+        bins = data.get("wind_speed_bins", {})
+        if "bin_centers_m_s" in bins:
+            centers = np.asarray(bins["bin_centers_m_s"], dtype=float)
+        elif "bin_edges_m_s" in bins:
+            edges = np.asarray(bins["bin_edges_m_s"], dtype=float)
+            centers = (edges[:-1] + edges[1:]) / 2
+        else:
+            raise ValueError("wind_speed_bins must have bin_centers_m_s or bin_edges_m_s.")
+
+        try:
+            probability = np.asarray(data["probability_matrix"]["data"], dtype=float)
+        except ValueError:
+            raise ValueError("probability_matrix.data must be a regular 3D array.") from None
+        if probability.ndim != 3:
+            raise ValueError(f"probability_matrix.data must be a 3D array, got {probability.ndim}D.")
+        probability = probability.sum(axis=2)
+        total = probability.sum()
+        if not total > 0:
+            raise ValueError("The total of probability_matrix.data must be positive.")
+
+        clusters = data["clusters"]
+        u_ref_mean = [cluster.get("u_ref_mean_m_s") for cluster in clusters]
+        return cls(
+            cluster_ids=[cluster["id"] for cluster in clusters],
+            wind_speeds_m_s=centers,
+            probability=probability / total,
+            reference_height_m=data["metadata"].get("reference_height_m"),
+            altitudes_m=data["altitudes"],
+            u_normalized=_stack([cluster["u_normalized"] for cluster in clusters], "u_normalized profiles"),
+            v_normalized=_stack([cluster["v_normalized"] for cluster in clusters], "v_normalized profiles"),
+            u_ref_mean_m_s=None if None in u_ref_mean else u_ref_mean,
+        )
+
+    def _interval(self, altitudes_m) -> tuple:
+        """Returns the altitude interval index and the offset from its start of every altitude (clamped to the grid)."""
+        altitudes = np.clip(np.asarray(altitudes_m, dtype=float), self.altitudes_m[0], self.altitudes_m[-1])
+        n_intervals = len(self.altitudes_m) - 1
+        if self._step is not None:
+            index = np.minimum(((altitudes - self.altitudes_m[0]) / self._step).astype(np.intp), n_intervals - 1)
+        else:
+            index = np.minimum(np.searchsorted(self.altitudes_m, altitudes, side="right") - 1, n_intervals - 1)
+        return index, altitudes - self.altitudes_m[index]
+
+    def wind_components(self, cluster_ids, altitudes_m, reference_wind_speeds_m_s=None) -> tuple:
+        """
+        Returns the wind speed components of the clusters at arbitrary altitudes.
+
+        The inputs are broadcast against each other. The profiles are linearly interpolated between
+        the altitudes and constant below and above them.
+
+        Args:
+            cluster_ids (array_like): Cluster ids.
+            altitudes_m (array_like): Altitudes.
+            reference_wind_speeds_m_s (array_like, optional): Wind speeds at the reference height.
+                Defaults to None (the mean reference wind speed ``u_ref_mean_m_s`` of the cluster).
+
+        Raises:
+            ValueError: If the document has no wind profiles, a cluster id is unknown or no
+                reference wind speed is given and the clusters have no ``u_ref_mean_m_s``.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Wind speed components [m/s] along (u) and perpendicular
+            to (v) the reference wind direction.
+        """
+        if self.altitudes_m is None:
+            raise ValueError("The wind resource has no wind profiles.")
+        rows = _id_rows(self.cluster_ids, cluster_ids, "clusters")
+        if reference_wind_speeds_m_s is None:
+            if self.u_ref_mean_m_s is None:
+                raise ValueError("The clusters have no u_ref_mean_m_s, give the reference wind speeds.")
+            reference_wind_speeds_m_s = self.u_ref_mean_m_s[rows]
+        index, offset = self._interval(altitudes_m)
+        rows, index, offset, reference = np.broadcast_arrays(rows, index, offset, reference_wind_speeds_m_s)
+        u, v = (self._start[:, rows, index] + self._slope[:, rows, index] * offset) * reference
+        return u, v
+
+    def wind(self, cluster_ids, altitudes_m, reference_wind_speeds_m_s=None) -> tuple:
+        """
+        Returns the wind speed and direction of the clusters at arbitrary altitudes.
+
+        Args:
+            cluster_ids (array_like): See `wind_components`.
+            altitudes_m (array_like): See `wind_components`.
+            reference_wind_speeds_m_s (array_like, optional): See `wind_components`.
+
+        Raises:
+            ValueError: See `wind_components`.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Wind speed [m/s] and wind direction [deg] relative to the
+            reference wind direction (counter-clockwise from u to v).
+        """
+        u, v = self.wind_components(cluster_ids, altitudes_m, reference_wind_speeds_m_s)
+        return np.hypot(u, v), np.degrees(np.arctan2(v, u))
+
+
+class TerrainConstraints:
+    """
+    Terrain and airspace constraints of an operational constraints document (``operational_constraints_schema.yml``).
+
+    The azimuth zones and their distance restrictions are compiled into a raster of minimum heights
+    above ground over sorted azimuth and distance intervals, so that millions of points are checked
+    with two binary searches and one lookup each. Every constraint covering an interval applies (the
+    highest minimum height wins) and zones where flight is not allowed have an infinite minimum
+    height. Azimuths and distances not covered by any zone or restriction are unrestricted.
+
+    Azimuth ranges are in degrees clockwise from the azimuth reference (north), half-open
+    ``[start, end)`` and may wrap around 0 deg (e.g. ``[350, 20]``). Distance ranges are horizontal
+    distances from the ground station, also half-open.
+
+    Attributes:
+        azimuth_edges_deg (np.ndarray): Edges of the azimuth intervals, from 0 to 360 deg.
+        distance_edges_m (np.ndarray): Edges of the distance intervals.
+        min_height_agl_m (np.ndarray): Minimum height above ground per azimuth and distance interval,
+            with an extra first (last) column below (beyond) the distance edges
+            (n_azimuth_intervals x n_distance_edges + 1).
+        max_altitude_agl_m (float): Maximum altitude above ground (inf if not constrained).
+    """
+
+    def __init__(self, azimuth_zones: list[dict], max_altitude_agl_m: float | None = None):
+        """
+        Args:
+            azimuth_zones (list[dict]): ``terrain_constraints.azimuth_zones`` of an operational
+                constraints document.
+            max_altitude_agl_m (float, optional): ``airspace_constraints.max_altitude_agl_m``.
+                Defaults to None (no maximum).
+        """
+        self.max_altitude_agl_m = np.inf if max_altitude_agl_m is None else float(max_altitude_agl_m)
+
+        zones = []  # (azimuth start, end, min heights as (distance start, end, height) or None if not allowed)
+        for zone in azimuth_zones:
+            start, end = (float(angle) % 360 for angle in zone["azimuth_range_deg"])
+            if zone["azimuth_range_deg"][1] - zone["azimuth_range_deg"][0] >= 360:
+                start, end = 0.0, 360.0
+            restrictions = None
+            if zone["flight_allowed"]:
+                restrictions = [
+                    (*map(float, restriction["distance_range_m"]), float(restriction["min_height_agl_m"]))
+                    for restriction in zone.get("distance_restrictions", [])
+                ]
+            # Split zones wrapping around 0 deg
+            ranges = [(start, end)] if start < end else [(start, 360.0), (0.0, end)]
+            zones.extend((a, b, restrictions) for a, b in ranges if a < b)
+
+        self.azimuth_edges_deg = np.unique([0.0, 360.0, *(edge for a, b, _ in zones for edge in (a, b))])
+        self.distance_edges_m = np.unique([
+            edge for *_, restrictions in zones for a, b, _ in restrictions or [] for edge in (a, b)
+        ])
+
+        # A point inside every azimuth interval and every distance interval (incl. below and beyond the edges)
+        azimuths = (self.azimuth_edges_deg[:-1] + self.azimuth_edges_deg[1:]) / 2
+        edges = self.distance_edges_m
+        distances = np.concatenate([edges[:1] - 1.0, (edges[:-1] + edges[1:]) / 2, edges[-1:] + 1.0])
+        if not len(edges):
+            distances = np.zeros(1)
+
+        self.min_height_agl_m = np.zeros((len(azimuths), len(distances)))
+        for a, b, restrictions in zones:
+            in_zone = (azimuths >= a) & (azimuths < b)
+            if restrictions is None:
+                self.min_height_agl_m[in_zone] = np.inf
+                continue
+            for start, end, height in restrictions:
+                in_range = (distances >= start) & (distances < end)
+                cells = np.ix_(in_zone, in_range)
+                self.min_height_agl_m[cells] = np.maximum(self.min_height_agl_m[cells], height)
+
+    @classmethod
+    def from_document(cls, input: dict | str | Path) -> TerrainConstraints:
+        """
+        Compiles the terrain and airspace constraints of an operational constraints document.
+
+        Args:
+            input (dict | str | Path): Document as a dictionary or a path to a YAML file.
+
+        Raises:
+            ValueError: If the document is not an operational constraints document.
+        """
+        data = _load_document(input, "operational_constraints_schema")
+        return cls(
+            azimuth_zones=data.get("terrain_constraints", {}).get("azimuth_zones", []),
+            max_altitude_agl_m=data.get("airspace_constraints", {}).get("max_altitude_agl_m"),
+        )
+
+    def min_allowed_height(self, azimuth_deg, distance_m):
+        """
+        Returns the minimum allowed height above ground at the given azimuths and distances.
+
+        Args:
+            azimuth_deg (array_like): Azimuths [deg] clockwise from the azimuth reference.
+            distance_m (array_like): Horizontal distances [m] from the ground station.
+
+        Returns:
+            np.ndarray: Minimum height above ground [m] of the broadcast shape of the inputs, inf
+            where flight is not allowed.
+        """
+        azimuth = np.mod(np.asarray(azimuth_deg, dtype=float), 360.0)
+        row = np.minimum(np.searchsorted(self.azimuth_edges_deg, azimuth, side="right") - 1, len(self.azimuth_edges_deg) - 2)
+        column = np.searchsorted(self.distance_edges_m, np.asarray(distance_m, dtype=float), side="right")
+        return self.min_height_agl_m[row, column]
+
+    def is_allowed(self, points, polar: bool = False):
+        """
+        Checks points of flight paths against the terrain constraints and the maximum altitude.
+
+        Args:
+            points (array_like): Points of shape (..., 3), by default as (east, north, height above
+                ground) [m] relative to the ground station.
+            polar (bool, optional): If True, the points are given as (azimuth [deg], horizontal
+                distance [m], height above ground [m]). Defaults to False.
+
+        Returns:
+            np.ndarray: Boolean array of shape ``points.shape[:-1]``, True where the height is between
+            the minimum allowed height and the maximum altitude above ground.
+        """
+        points = np.asarray(points, dtype=float)
+        if points.shape[-1] != 3:
+            raise ValueError(f"points must have the shape (..., 3), got {points.shape}.")
+        if polar:
+            azimuth, distance, height = np.moveaxis(points, -1, 0)
+        else:
+            east, north, height = np.moveaxis(points, -1, 0)
+            azimuth = np.degrees(np.arctan2(east, north))
+            distance = np.hypot(east, north)
+        return (height >= self.min_allowed_height(azimuth, distance)) & (height <= self.max_altitude_agl_m)
+
+
+def _as_list(items, cls) -> tuple[list, bool]:
+    """Returns ``items`` as a list of ``cls`` objects and whether a single item was given."""
+    single = isinstance(items, (cls, dict, str, Path))
+    items = [items] if single else list(items)
+    return [item if isinstance(item, cls) else cls.from_document(item) for item in items], single
+
+
+def _groups(items: list, key) -> dict:
+    """Groups the indices of ``items`` by ``key(item)``."""
+    groups = {}
+    for i, item in enumerate(items):
+        groups.setdefault(key(item), []).append(i)
+    return groups
+
+
+def _check_reference_heights(designs: list[PowerCurves], sites: list[WindResource]) -> None:
+    heights = {item.reference_height_m for item in designs + sites} - {None}
+    if len(heights) > 1:
+        raise ValueError(f"The power curves and wind resources have different reference heights: {sorted(heights)} m.")
+
+
+def annual_energy_production(
+    power_curves: PowerCurves | dict | str | Path | Sequence,
+    wind_resources: WindResource | dict | str | Path | Sequence,
+):
+    """
+    Computes the annual energy production of every design (power curves) at every site (wind resource).
+
+    The power curve of the profile with the same id as a cluster is evaluated at the wind speed bin
+    centers and weighted with the probability of the cluster and bin:
+    ``AEP[d, s] = 8760 h * sum over clusters c and bins b of P[d, c, b] * p[s, c, b]``.
+    Designs with the same wind speed grid are interpolated together and the contraction is one
+    matrix product per group of sites with the same clusters and bins.
+
+    Args:
+        power_curves (PowerCurves | dict | str | Path | Sequence): Design or list of designs, as
+            `PowerCurves` or power curves documents (dictionaries or paths).
+        wind_resources (WindResource | dict | str | Path | Sequence): Site or list of sites, as
+            `WindResource` or wind resource documents (dictionaries or paths).
+
+    Raises:
+        ValueError: If a design has no power curve for a cluster of a site, or the reference heights
+            of the power curves and wind resources differ.
+
+    Returns:
+        np.ndarray | float: Annual energy production [Wh] of shape (n_designs, n_sites), without the
+        design (site) axis if a single design (site) is given.
+    """
+    designs, single_design = _as_list(power_curves, PowerCurves)
+    sites, single_site = _as_list(wind_resources, WindResource)
+    _check_reference_heights(designs, sites)
+
+    aep = np.empty((len(designs), len(sites)))
+    site_groups = _groups(sites, lambda site: (site.cluster_ids.tobytes(), site.wind_speeds_m_s.tobytes()))
+    design_groups = _groups(designs, lambda design: (design.wind_speeds_m_s.tobytes(), design.profile_ids.tobytes()))
+    for site_index in site_groups.values():
+        cluster_ids = sites[site_index[0]].cluster_ids
+        wind_speeds = sites[site_index[0]].wind_speeds_m_s
+        # (n_sites, n_clusters * n_bins)
+        probability = np.stack([sites[i].probability for i in site_index]).reshape(len(site_index), -1)
+        for design_index in design_groups.values():
+            first = designs[design_index[0]]
+            rows = first._rows(cluster_ids)
+            # (n_designs, n_clusters, n_bins)
+            power = _interp(wind_speeds, first.wind_speeds_m_s, np.stack([designs[i].power_w[rows] for i in design_index]))
+            aep[np.ix_(design_index, site_index)] = power.reshape(len(design_index), -1) @ probability.T
+    aep *= HOURS_PER_YEAR
+
+    if single_design and single_site:
+        return float(aep[0, 0])
+    return aep[0] if single_design else aep[:, 0] if single_site else aep
+
+
+def capacity_factor(
+    power_curves: PowerCurves | dict | str | Path | Sequence,
+    wind_resources: WindResource | dict | str | Path | Sequence,
+):
+    """
+    Computes the capacity factor (mean power over nominal power) of every design at every site.
+
+    Args:
+        power_curves (PowerCurves | dict | str | Path | Sequence): See `annual_energy_production`.
+        wind_resources (WindResource | dict | str | Path | Sequence): See `annual_energy_production`.
+
+    Raises:
+        ValueError: If a design has no (positive) nominal power, see also `annual_energy_production`.
+
+    Returns:
+        np.ndarray | float: Capacity factor of shape (n_designs, n_sites), without the design (site)
+        axis if a single design (site) is given.
+    """
+    designs, single_design = _as_list(power_curves, PowerCurves)
+    sites, single_site = _as_list(wind_resources, WindResource)
+    nominal_power = np.array([design.nominal_power_w or np.nan for design in designs], dtype=float)
+    if not np.all(nominal_power > 0):
+        raise ValueError("All power curves must have a positive nominal power (metadata.model_config.nominal_power_w).")
+
+    aep = annual_energy_production(designs, sites)
+    factor = aep / (nominal_power[:, None] * HOURS_PER_YEAR)
+    if single_design and single_site:
+        return float(factor[0, 0])
+    return factor[0] if single_design else factor[:, 0] if single_site else factor
+
+
+# Arrays of a `WindResource` passed from the sweep workers through shared memory
+_SHARED_ARRAYS = (
+    "cluster_ids", "wind_speeds_m_s", "probability", "altitudes_m", "u_normalized", "v_normalized", "u_ref_mean_m_s",
+)
+
+
+def _read_site(filename: str | Path) -> tuple:
+    """Loads a wind resource file, returning the site (None on error) and its information (see `load_sites`)."""
+    tic = time.perf_counter()
+    site, info, error = None, {}, None
+    try:
+        data = load(filename) if _is_netcdf(filename) else load_yaml(filename, fast=True)
+        site = WindResource.from_document(data)
+        location = data["metadata"].get("location", {})
+        info = {"name": data["metadata"].get("name"), "latitude": location.get("latitude"), "longitude": location.get("longitude")}
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    return site, {"file": str(filename), **info, "load_time_s": time.perf_counter() - tic, "error": error}
+
+
+def _load_site(filename: str | Path) -> tuple:
+    """
+    Loads a wind resource file in a sweep worker and puts its arrays in a shared memory block.
+
+    Returns:
+        tuple: Name of the shared memory block, the layout of the arrays (name, dtype, shape, offset),
+        the reference height and the site information. Without shared memory (Windows, where a block
+        is freed with its last handle) the name is None and the arrays are returned instead of the
+        layout; on error both are None.
+    """
+    site, info = _read_site(filename)
+    if site is None:
+        return None, None, None, info
+    arrays = {name: getattr(site, name) for name in _SHARED_ARRAYS if getattr(site, name) is not None}
+    if os.name != "posix":
+        return None, arrays, site.reference_height_m, info
+
+    block = shared_memory.SharedMemory(create=True, size=max(1, sum(array.nbytes for array in arrays.values())))
+    layout = []
+    offset = 0
+    for name, array in arrays.items():
+        np.ndarray(array.shape, array.dtype, buffer=block.buf, offset=offset)[...] = array
+        layout.append((name, array.dtype.str, array.shape, offset))
+        offset += array.nbytes
+    block.close()
+    # The block stays registered with the resource tracker of the parent process (see `load_sites`), which
+    # removes it if the parent exits without attaching it. `_attach_arrays` or `_release_block` unlink it.
+    return block.name, layout, site.reference_height_m, info
+
+
+def _attach_arrays(name: str, layout: list) -> dict:
+    """Copies the arrays of a site out of the shared memory block ``name`` and releases the block."""
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        return {
+            key: np.ndarray(shape, dtype, buffer=block.buf, offset=offset).copy()
+            for key, dtype, shape, offset in layout
+        }
+    finally:
+        block.close()
+        block.unlink()
+
+
+def _release_block(future: Future) -> None:
+    """Unlinks the shared memory block of a `_load_site` task whose result is not attached."""
+    if future.cancel() or future.exception() is not None:
+        return
+    name = future.result()[0]
+    if name is None:
+        return
+    try:
+        block = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return
+    block.close()
+    block.unlink()
+
+
+def load_sites(files: list[str | Path], workers: int | None = None):
+    """
+    Loads wind resource files across a process pool, yielding them in input order.
+
+    The workers parse the files and pass the arrays back through shared memory, so only a few bytes
+    per site are pickled. The blocks of the sites which are not consumed are released when the
+    generator is closed, so close it (e.g. with `contextlib.closing`) when stopping early.
+
+    Args:
+        files (list[str | Path]): Wind resource files (YAML or NetCDF).
+        workers (int, optional): Number of worker processes. Defaults to the number of CPUs. With 1
+            worker the files are loaded in the current process.
+
+    Yields:
+        tuple[WindResource | None, dict]: The site (None if it could not be loaded) and its
+        information with the keys ``file``, ``name``, ``latitude``, ``longitude``, ``load_time_s``
+        and ``error``.
+    """
+    workers = min(workers or os.cpu_count() or 1, max(len(files), 1))
+    if workers == 1:
+        yield from map(_read_site, files)
+        return
+
+    # Started before the workers, which then share it instead of starting their own trackers that
+    # would remove the shared memory blocks when the workers exit
+    resource_tracker.ensure_running()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_load_site, filename) for filename in files]
+        try:
+            for i, future in enumerate(futures):
+                name, arrays, reference_height_m, info = future.result()
+                futures[i] = None  # Attached (and unlinked) below
+                if name is not None:
+                    arrays = _attach_arrays(name, arrays)
+                yield None if arrays is None else WindResource(reference_height_m=reference_height_m, **arrays), info
+        finally:
+            # Release the blocks of the sites not yielded, e.g. when the caller stops iterating or raises
+            for future in futures:
+                if future is not None:
+                    _release_block(future)
+
+
+def sweep_sites(
+    power_curves: PowerCurves | dict | str | Path,
+    files: list[str | Path],
+    workers: int | None = None,
+) -> list[dict]:
+    """
+    Scores one design against many wind resource files (see `load_sites` and `annual_energy_production`).
+
+    Args:
+        power_curves (PowerCurves | dict | str | Path): Design as `PowerCurves` or a power curves document.
+        files (list[str | Path]): Wind resource files (YAML or NetCDF).
+        workers (int, optional): Number of worker processes loading the files. Defaults to the number of CPUs.
+
+    Returns:
+        list[dict]: One row per file (in input order) with the keys ``file``, ``name``, ``latitude``,
+        ``longitude``, ``aep_wh``, ``capacity_factor``, ``load_time_s`` and ``error``. The energy
+        yield is None for files which could not be loaded or scored.
+    """
+    design = power_curves if isinstance(power_curves, PowerCurves) else PowerCurves.from_document(power_curves)
+    rows = []
+    sites = []
+    with closing(load_sites(files, workers)) as loaded_sites:
+        for site, info in loaded_sites:
+            rows.append({
+                "file": info["file"], "name": info.get("name"), "latitude": info.get("latitude"),
+                "longitude": info.get("longitude"), "aep_wh": None, "capacity_factor": None,
+                "load_time_s": info["load_time_s"], "error": info["error"],
+            })
+            sites.append(site)
+
+    loaded = [i for i, site in enumerate(sites) if site is not None]
+    try:
+        aep = annual_energy_production(design, [sites[i] for i in loaded]) if loaded else []
+        scored = dict(zip(loaded, aep))
+    except ValueError:
+        # Score the sites one by one to report which ones do not match the design
+        scored = {}
+        for i in loaded:
+            try:
+                scored[i] = annual_energy_production(design, sites[i])
+            except ValueError as e:
+                rows[i]["error"] = f"ValueError: {e}"
+
+    for i, aep in scored.items():
+        rows[i]["aep_wh"] = float(aep)
+        if design.nominal_power_w:
+            rows[i]["capacity_factor"] = float(aep) / (design.nominal_power_w * HOURS_PER_YEAR)
+    return rows
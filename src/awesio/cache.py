@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from ._lazy import np
+
+# Default location and size bound of the on-disk cache used by `load_yaml(..., cache=True)`
+CACHE_DIR = Path(
+    os.environ.get(
+        "AWESIO_CACHE_DIR",
+        Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "awesio",
+    )
+)
+CACHE_MAX_SIZE = int(os.environ.get("AWESIO_CACHE_MAX_SIZE", 1024**3))  # bytes
+
+_CACHE_VERSION = 2
+_CACHE_SUFFIX = ".pkl"
+
+
+class _NumericList:
+    """Numeric (nested) list stored as an array in the cache and restored as a list on load."""
+
+    __slots__ = ("array",)
+
+    def __init__(self, array: np.ndarray):
+        self.array = array
+
+    def __getstate__(self):
+        return self.array
+
+    def __setstate__(self, state):
+        self.array = state
+
+
+def _numeric_array(data: list) -> np.ndarray | None:
+    """Returns ``data`` as an ndarray if it is a rectangular list of only ints or only floats, else None."""
+    try:
+        array = np.asarray(data)
+    except ValueError:  # Ragged nested lists
+        return None
+    if array.size == 0 or array.dtype.kind not in "if":
+        return None
+    # Bools (e.g. [True, 2] is an int array) and ints mixed with floats would not round-trip
+    if set(map(type, np.asarray(data, dtype=object).flat)) != {int if array.dtype.kind == "i" else float}:
+        return None
+    return array
+
+
+def _pack(data: Any) -> Any:
+    """Converts numeric lists in ``data`` into arrays for compact and fast serialization."""
+    if isinstance(data, dict):
+        return {k: _pack(v) for k, v in data.items()}
+    elif isinstance(data, list):
+        array = _numeric_array(data)
+        if array is not None:
+            return _NumericList(array)
+        return [_pack(v) for v in data]
+    return data
+
+
+def _unpack(data: Any) -> Any:
+    """Inverse of `_pack`."""
+    if isinstance(data, dict):
+        return {k: _unpack(v) for k, v in data.items()}
+    elif isinstance(data, list):
+        return [_unpack(v) for v in data]
+    elif isinstance(data, _NumericList):
+        return data.array.tolist()
+    return data
+
+
+def _file_signature(filename: Path) -> tuple[str, int, int, str]:
+    """Returns (resolved path, size, mtime, content hash) for ``filename``."""
+    stat = filename.stat()
+    digest = hashlib.blake2b()
+    with open(filename, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return (str(filename), stat.st_size, stat.st_mtime_ns, digest.hexdigest())
+
+
+def _entry_path(filename: Path, options: Any, cache_dir: Path) -> Path:
+    """Returns the cache file for loading ``filename`` with the loader ``options``."""
+    key = repr((_CACHE_VERSION, str(filename), options)).encode()
+    return cache_dir / (hashlib.blake2b(key, digest_size=16).hexdigest() + _CACHE_SUFFIX)
+
+
+def get_cached(filename: Path, options: Any, cache_dir: Path) -> Any:
+    """
+    Returns the cached document for ``filename`` or raises `KeyError` if there is no valid entry.
+
+    An entry is only valid if the path, size, mtime and content hash of the file itself and of
+    every file it pulled in with `!include` are unchanged.
+    """
+    entry_path = _entry_path(filename, options, cache_dir)
+    try:
+        with open(entry_path, "rb") as f:
+            signatures, data = pickle.load(f)
+        for signature in signatures:
+            if _file_signature(Path(signature[0])) != signature:
+                raise KeyError(filename)
+        os.utime(entry_path)  # Mark as recently used for the eviction
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError, AttributeError) as e:
+        raise KeyError(filename) from e
+    return _unpack(data)
+
+
+def set_cached(
+    filename: Path,
+    options: Any,
+    cache_dir: Path,
+    data: Any,
+    dependencies: list[Path],
+    max_size: int | None = None,
+) -> None:
+    """Stores ``data`` loaded from ``filename`` (and ``dependencies``) in the cache and evicts old entries."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    signatures = [_file_signature(path) for path in dict.fromkeys([filename, *dependencies])]
+    # Write to a temporary file and move it in place so concurrent readers never see partial entries
+    fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((signatures, _pack(data)), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, _entry_path(filename, options, cache_dir))
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    evict(cache_dir, CACHE_MAX_SIZE if max_size is None else max_size)
+
+
+def evict(cache_dir: Path, max_size: int) -> None:
+    """Removes the least recently used entries until the cache is at most ``max_size`` bytes."""
+    entries = []
+    for path in cache_dir.glob(f"*{_CACHE_SUFFIX}"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime_ns, stat.st_size, path))
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total_size <= max_size:
+            break
+        path.unlink(missing_ok=True)
+        total_size -= size
+
+
+def clear_cache(cache_dir: str | Path | None = None) -> None:
+    """
+    Removes all entries from the on-disk cache used by `load_yaml`.
+
+    Args:
+        cache_dir (str | Path, optional): Cache directory. Defaults to `CACHE_DIR`.
+    """
+    cache_dir = CACHE_DIR if cache_dir is None else Path(cache_dir)
+    if not cache_dir.exists():
+        return
+    for path in cache_dir.glob(f"*{_CACHE_SUFFIX}"):
+        path.unlink(missing_ok=True)
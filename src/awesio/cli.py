@@ -0,0 +1,342 @@
+"""
+Command line interface of awesIO.
+
+Usage:
+    awesio validate [-j WORKERS] [--fail-fast | --max-errors N] [--format {text,json,junit}] [-o OUTPUT] PATH [PATH ...]
+    awesio generate SCHEMA OUTPUT [--seed SEED] [--size NAME=VALUE ...]
+    awesio sweep [-j WORKERS] [--format {text,csv,json}] [-o OUTPUT] POWER_CURVES SITE [SITE ...]
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import glob
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from xml.etree import ElementTree
+
+from .analysis import sweep_sites
+from .generate import GENERATORS, generate
+from .validator import validate, warm_validator_cache
+from .yaml import _is_netcdf, load, load_yaml
+
+# File extensions validated when a directory is given
+VALIDATE_EXTENSIONS = [".yml", ".yaml"]
+
+
+def expand_paths(patterns: list[str]) -> list[Path]:
+    """
+    Expands files, directories (recursively, see `VALIDATE_EXTENSIONS`) and glob patterns into a sorted list of unique files.
+
+    Args:
+        patterns (list[str]): Files, directories or glob patterns.
+
+    Returns:
+        list[Path]: Files to validate. Patterns without matches are kept so they are reported as missing.
+    """
+    files = []
+    for pattern in patterns:
+        matches = glob.glob(pattern, recursive=True) if glob.has_magic(pattern) else [pattern]
+        if not matches:
+            files.append(Path(pattern))
+        for match in sorted(matches):
+            path = Path(match)
+            if path.is_dir():
+                files.extend(
+                    sorted(p for p in path.rglob("*") if p.suffix.lower() in VALIDATE_EXTENSIONS)
+                )
+            else:
+                files.append(path)
+    return list(dict.fromkeys(files))
+
+
+def _init_worker(restrictive: bool, defaults: bool) -> None:
+    """Compiles the validators once per worker process."""
+    warm_validator_cache(restrictive=restrictive, defaults=defaults)
+
+
+def validate_file(
+    filename: str | Path, restrictive: bool = True, defaults: bool = False, max_errors: int | None = None,
+) -> dict:
+    """
+    Validates a single file and returns the result instead of raising.
+
+    Args:
+        filename (str | Path): Path to the YAML or NetCDF file.
+        restrictive (bool, optional): Passed on to `validate`. Defaults to True.
+        defaults (bool, optional): Passed on to `validate`. Defaults to False.
+        max_errors (int, optional): Passed on to `validate`. Defaults to None (report all errors).
+
+    Returns:
+        dict: Result with the keys ``file``, ``schema``, ``passed``, ``time_s`` and ``error``.
+    """
+    result = {"file": str(filename), "schema": None, "passed": False, "time_s": 0.0, "error": None}
+    tic = time.perf_counter()
+    try:
+        if not Path(filename).is_file():
+            raise FileNotFoundError(f"File not found: {filename}")
+        data = load(filename) if _is_netcdf(filename) else load_yaml(filename, fast=True)
+        result["schema"] = (data.get("metadata") or {}).get("schema") if isinstance(data, dict) else None
+        validate(data, restrictive=restrictive, defaults=defaults, max_errors=max_errors, copy=False)
+        result["passed"] = True
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["time_s"] = time.perf_counter() - tic
+    return result
+
+
+def validate_files(
+    files: list[str | Path],
+    workers: int | None = None,
+    restrictive: bool = True,
+    defaults: bool = False,
+    max_errors: int | None = None,
+):
+    """
+    Validates ``files`` across a process pool, yielding the results (see `validate_file`) in input order.
+
+    Args:
+        files (list[str | Path]): Files to validate.
+        workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+            With 1 worker the files are validated in the current process.
+        restrictive (bool, optional): Passed on to `validate`. Defaults to True.
+        defaults (bool, optional): Passed on to `validate`. Defaults to False.
+        max_errors (int, optional): Passed on to `validate`. Defaults to None (report all errors).
+
+    Yields:
+        dict: Result for each file.
+    """
+    workers = min(workers or os.cpu_count() or 1, max(len(files), 1))
+    if workers == 1:
+        _init_worker(restrictive, defaults)
+        for filename in files:
+            yield validate_file(filename, restrictive, defaults, max_errors)
+        return
+
+    chunksize = max(1, len(files) // (workers * 8))
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(restrictive, defaults)
+    ) as executor:
+        yield from executor.map(
+            validate_file, files, [restrictive] * len(files), [defaults] * len(files), [max_errors] * len(files),
+            chunksize=chunksize,
+        )
+
+
+def _summary(results: list[dict], wall_time: float) -> dict:
+    passed = sum(result["passed"] for result in results)
+    return {
+        "total": len(results),
+        "passed": passed,
+        "failed": len(results) - passed,
+        "wall_time_s": wall_time,
+        "validation_time_s": sum(result["time_s"] for result in results),
+    }
+
+
+def format_json(results: list[dict], summary: dict) -> str:
+    """Returns the results as a JSON report."""
+    return json.dumps({"summary": summary, "results": results}, indent=2)
+
+
+def format_junit(results: list[dict], summary: dict) -> str:
+    """Returns the results as a JUnit XML report with one test case per file."""
+    suite = ElementTree.Element(
+        "testsuite",
+        name="awesio.validate",
+        tests=str(summary["total"]),
+        failures=str(summary["failed"]),
+        errors="0",
+        time=f"{summary['wall_time_s']:.6f}",
+    )
+    for result in results:
+        case = ElementTree.SubElement(
+            suite,
+            "testcase",
+            classname=str(result["schema"] or "unknown"),
+            name=result["file"],
+            time=f"{result['time_s']:.6f}",
+        )
+        if not result["passed"]:
+            failure = ElementTree.SubElement(case, "failure", message=result["error"].splitlines()[0])
+            failure.text = result["error"]
+    if hasattr(ElementTree, "indent"):  # Python 3.9 and later
+        ElementTree.indent(suite)
+    return ElementTree.tostring(suite, encoding="unicode", xml_declaration=True)
+
+
+def _validate_command(args: argparse.Namespace) -> int:
+    files = expand_paths(args.paths)
+    if not files:
+        print("No files to validate", file=sys.stderr)
+        return 2
+
+    tic = time.perf_counter()
+    results = []
+    max_errors = 1 if args.fail_fast else args.max_errors
+    for result in validate_files(files, args.workers, not args.no_restrictive, args.defaults, max_errors):
+        results.append(result)
+        if args.format == "text":
+            status = "[PASS]" if result["passed"] else "[FAIL]"
+            print(f"{status} {result['file']} ({result['time_s']:.3f} s)")
+            if not result["passed"]:
+                print(f"  {result['error']}")
+    summary = _summary(results, time.perf_counter() - tic)
+
+    if args.format == "text":
+        report = (
+            f"\nTotal: {summary['total']} | Passed: {summary['passed']} | Failed: {summary['failed']} "
+            f"| Time: {summary['wall_time_s']:.2f} s"
+        )
+    elif args.format == "json":
+        report = format_json(results, summary)
+    else:
+        report = format_junit(results, summary)
+
+    if args.output:
+        Path(args.output).write_text(report + "\n", encoding="utf-8")
+    else:
+        print(report)
+    return 0 if summary["failed"] == 0 else 1
+
+
+def _parse_size(text: str) -> tuple[str, int]:
+    name, _, value = text.partition("=")
+    try:
+        return name.strip(), int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected NAME=INTEGER, got {text!r}")
+
+
+def _generate_command(args: argparse.Namespace) -> int:
+    tic = time.perf_counter()
+    try:
+        generate(args.schema, args.output, seed=args.seed, **dict(args.size))
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    print(f"Generated {args.output} ({Path(args.output).stat().st_size / 1e6:.1f} MB, {time.perf_counter() - tic:.2f} s)")
+    return 0
+
+
+SWEEP_COLUMNS = ["file", "name", "latitude", "longitude", "aep_wh", "capacity_factor", "load_time_s", "error"]
+
+
+def format_csv(rows: list[dict]) -> str:
+    """Returns the sweep results as a CSV table."""
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=SWEEP_COLUMNS, lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(rows)
+    return output.getvalue().rstrip("\n")
+
+
+def _format_sweep_text(rows: list[dict]) -> str:
+    lines = [f"{'AEP [MWh]':>12} {'CF':>7} {'load [s]':>9}  file", "=" * 70]
+    for row in rows:
+        if row["error"]:
+            lines.append(f"{'-':>12} {'-':>7} {row['load_time_s']:>9.2f}  {row['file']}\n  {row['error']}")
+        else:
+            cf = "-" if row["capacity_factor"] is None else f"{row['capacity_factor']:.4f}"
+            lines.append(f"{row['aep_wh'] / 1e6:>12.3f} {cf:>7} {row['load_time_s']:>9.2f}  {row['file']}")
+    return "\n".join(lines)
+
+
+def _sweep_command(args: argparse.Namespace) -> int:
+    files = expand_paths(args.sites)
+    if not files:
+        print("No wind resource files", file=sys.stderr)
+        return 2
+
+    tic = time.perf_counter()
+    try:
+        rows = sweep_sites(args.power_curves, files, args.workers)
+    except (OSError, ValueError) as e:
+        print(f"{type(e).__name__}: {e}", file=sys.stderr)
+        return 2
+    wall_time = time.perf_counter() - tic
+    failed = sum(row["error"] is not None for row in rows)
+
+    if args.format == "text":
+        report = (
+            f"{_format_sweep_text(rows)}\n\nSites: {len(rows)} | Scored: {len(rows) - failed} | Failed: {failed} "
+            f"| Time: {wall_time:.2f} s"
+        )
+    elif args.format == "json":
+        report = json.dumps({"power_curves": str(args.power_curves), "wall_time_s": wall_time, "results": rows}, indent=2)
+    else:
+        report = format_csv(rows)
+
+    if args.output:
+        Path(args.output).write_text(report + "\n", encoding="utf-8")
+    else:
+        print(report)
+    return 0 if failed == 0 else 1
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point of the ``awesio`` command."""
+    parser = argparse.ArgumentParser(prog="awesio", description="Input/Output standard for airborne wind energy systems")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    validate_parser = subparsers.add_parser(
+        "validate", help="Validate files against the awesIO schemas (auto-detected from metadata.schema)"
+    )
+    validate_parser.add_argument("paths", nargs="+", help="Files, directories or glob patterns (quoted)")
+    validate_parser.add_argument(
+        "-j", "--workers", type=int, default=None, help="Number of worker processes (default: number of CPUs)"
+    )
+    validate_parser.add_argument(
+        "--format", choices=["text", "json", "junit"], default="text", help="Report format (default: text)"
+    )
+    validate_parser.add_argument("-o", "--output", help="Write the report to this file instead of stdout")
+    validate_parser.add_argument(
+        "--no-restrictive", action="store_true", help="Allow properties which are not in the schema"
+    )
+    validate_parser.add_argument("--defaults", action="store_true", help="Apply schema default values")
+    errors_group = validate_parser.add_mutually_exclusive_group()
+    errors_group.add_argument(
+        "--fail-fast", action="store_true", help="Stop validating a file at its first schema error"
+    )
+    errors_group.add_argument(
+        "--max-errors", type=int, default=None, help="Stop validating a file after this many schema errors"
+    )
+    validate_parser.set_defaults(func=_validate_command)
+
+    generate_parser = subparsers.add_parser(
+        "generate", help="Generate a synthetic document of any size (streamed to disk)"
+    )
+    generate_parser.add_argument("schema", choices=list(GENERATORS), help="Schema of the document")
+    generate_parser.add_argument("output", help="Output YAML file")
+    generate_parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    generate_parser.add_argument(
+        "--size", type=_parse_size, action="append", default=[], metavar="NAME=VALUE",
+        help="Size of a dimension, e.g. n_clusters=500 (see awesio.generate)",
+    )
+    generate_parser.set_defaults(func=_generate_command)
+
+    sweep_parser = subparsers.add_parser(
+        "sweep", help="Compute the energy yield of one power curves document at many wind resource sites"
+    )
+    sweep_parser.add_argument("power_curves", help="Power curves file")
+    sweep_parser.add_argument("sites", nargs="+", help="Wind resource files, directories or glob patterns (quoted)")
+    sweep_parser.add_argument(
+        "-j", "--workers", type=int, default=None, help="Number of worker processes (default: number of CPUs)"
+    )
+    sweep_parser.add_argument(
+        "--format", choices=["text", "csv", "json"], default="text", help="Report format (default: text)"
+    )
+    sweep_parser.add_argument("-o", "--output", help="Write the report to this file instead of stdout")
+    sweep_parser.set_defaults(func=_sweep_command)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import copy
+from pathlib import Path
+from typing import Any
+
+from .schemas import schema_validation_error_formatter
+from .validator import _get_schema_type, _validate_data_consistency, get_validator, validate
+
+# Schema keywords which only constrain the node itself or select the subschemas of its children, so a
+# change below a node with only these keywords can be validated by validating the child subschema
+_TRANSPARENT_KEYWORDS = {
+    "type", "properties", "items", "additionalProperties", "required",
+    "minItems", "maxItems", "minProperties", "maxProperties",
+    "description", "title", "$comment", "default", "$schema", "$id", "definitions",
+}
+
+
+class ValidatedDocument:
+    """
+    AWESIO document which stays valid under in-place edits.
+
+    The document is fully validated once on creation (see `awesio.validator.validate`). Afterwards
+    `apply_patch` applies JSON patches (RFC 6902) and only revalidates the subschemas and data
+    consistency rules affected by the changed paths, which is much cheaper than a full validation
+    for large documents. A patch which would make the document invalid is rolled back.
+
+    Example:
+        >>> doc = ValidatedDocument("power_curves.yml")
+        >>> doc.apply_patch([{"op": "replace", "path": "/metadata/name", "value": "New name"}])
+        >>> doc.data["metadata"]["name"]
+        'New name'
+    """
+
+    def __init__(self, input: dict | str | Path, restrictive: bool = True, defaults: bool = False):
+        """
+        Args:
+            input (dict | str | Path): Input data as a dictionary or a path to a YAML or NetCDF file.
+            restrictive (bool, optional): Passed on to `validate`. Defaults to True.
+            defaults (bool, optional): Passed on to `validate`. Defaults to False.
+        """
+        self.restrictive = restrictive
+        self.defaults = defaults
+        self.data = validate(input, restrictive=restrictive, defaults=defaults)
+        self.schema_type = _get_schema_type(self.data)
+        self._validator = get_validator(self.schema_type, restrictive=restrictive, defaults=defaults)
+
+    def apply_patch(self, patch: list[dict]) -> dict:
+        """
+        Applies a JSON patch to the document and revalidates the changed parts.
+
+        Supported operations are ``add``, ``remove``, ``replace``, ``move``, ``copy`` and ``test``
+        with JSON pointers as paths (e.g. ``/power_curves/0/probability_weight``).
+
+        Args:
+            patch (list[dict]): List of patch operations.
+
+        Raises:
+            ValueError: If an operation is invalid, a ``test`` fails or the patched document
+                fails validation. The document is left unchanged in that case.
+
+        Returns:
+            dict: The patched document.
+        """
+        undo = []
+        try:
+            changed_paths = []
+            for operation in patch:
+                changed_paths.extend(self._apply_operation(operation, undo))
+            self._revalidate(changed_paths)
+        except Exception:
+            for restore in reversed(undo):
+                restore()
+            raise
+        return self.data
+
+    def _apply_operation(self, operation: dict, undo: list) -> list[tuple]:
+        """Applies a single patch operation, appends its inverse to ``undo`` and returns the changed paths."""
+        op = operation.get("op")
+        if "path" not in operation:
+            raise ValueError(f"Patch operation is missing 'path': {operation}")
+        path = _parse_pointer(operation["path"])
+
+        if op == "test":
+            if _get(self.data, path) != operation.get("value"):
+                raise ValueError(f"Patch test failed at '{operation['path']}'")
+            return []
+        elif op in ["add", "replace"]:
+            if "value" not in operation:
+                raise ValueError(f"Patch operation is missing 'value': {operation}")
+            return self._set(path, copy.deepcopy(operation["value"]), undo, replace=op == "replace")
+        elif op == "remove":
+            self._remove(path, undo)
+            return [path[:-1]]
+        elif op in ["move", "copy"]:
+            if "from" not in operation:
+                raise ValueError(f"Patch operation is missing 'from': {operation}")
+            source = _parse_pointer(operation["from"])
+            value = copy.deepcopy(_get(self.data, source))
+            changed_paths = []
+            if op == "move":
+                if path[:len(source)] == source and path != source:
+                    raise ValueError(f"Cannot move '{operation['from']}' into itself")
+                self._remove(source, undo)
+                changed_paths.append(source[:-1])
+            return changed_paths + self._set(path, value, undo)
+        raise ValueError(f"Unsupported patch operation: {op!r}")
+
+    def _set(self, path: tuple, value: Any, undo: list, replace: bool = False) -> list[tuple]:
+        """Adds or replaces the value at ``path``."""
+        if not path:
+            if not isinstance(value, dict):
+                raise ValueError("The document root must be a dictionary")
+            previous = self.data
+            undo.append(lambda: setattr(self, "data", previous))
+            self.data = value
+            return [()]
+
+        parent = _get(self.data, path[:-1])
+        key = path[-1]
+        if isinstance(parent, dict):
+            if key in parent:
+                previous = parent[key]
+                undo.append(lambda: parent.__setitem__(key, previous))
+                parent[key] = value
+                return [path]
+            elif replace:
+                raise ValueError(f"Path not found: {_format_pointer(path)}")
+            undo.append(lambda: parent.pop(key))
+            parent[key] = value
+            return [path[:-1]]  # The parent may not allow the new key
+        elif isinstance(parent, list):
+            index = _list_index(parent, key, allow_end=not replace)
+            if replace:
+                previous = parent[index]
+                undo.append(lambda: parent.__setitem__(index, previous))
+                parent[index] = value
+                return [path]
+            parent.insert(index, value)
+            undo.append(lambda: parent.pop(index))
+            return [path[:-1]]
+        raise ValueError(f"Path not found: {_format_pointer(path)}")
+
+    def _remove(self, path: tuple, undo: list) -> None:
+        """Removes the value at ``path``."""
+        if not path:
+            raise ValueError("Cannot remove the document root")
+        parent = _get(self.data, path[:-1])
+        key = path[-1]
+        if isinstance(parent, dict) and key in parent:
+            items = list(parent.items())
+            del parent[key]
+            undo.append(lambda: _restore(parent, items))
+        elif isinstance(parent, list):
+            index = _list_index(parent, key)
+            previous = parent.pop(index)
+            undo.append(lambda: parent.insert(index, previous))
+        else:
+            raise ValueError(f"Path not found: {_format_pointer(path)}")
+
+    def _revalidate(self, changed_paths: list[tuple]) -> None:
+        """Validates the subschemas and consistency rules affected by ``changed_paths``."""
+        changed_paths = _minimal_paths(changed_paths)
+        if not changed_paths:
+            return
+        if any(path[:2] in [(), ("metadata",), ("metadata", "schema")] for path in changed_paths):
+            # The schema type may have changed, start over
+            schema_type = _get_schema_type(self.data)
+            if schema_type != self.schema_type:
+                self.data = validate(self.data, restrictive=self.restrictive, defaults=self.defaults)
+                self.schema_type = schema_type
+                self._validator = get_validator(schema_type, self.restrictive, self.defaults)
+                return
+
+        validate_paths(self.data, self._validator, self.schema_type, changed_paths)
+
+
+def validate_paths(data: dict, validator, schema_type: str, changed_paths: list[tuple]) -> None:
+    """
+    Validates only the parts of a valid document affected by changes at ``changed_paths``.
+
+    Each changed path is validated against the deepest subschema which only selects the subschemas
+    of its children (e.g. not below an ``allOf``), followed by the data consistency rules depending
+    on the changed paths.
+
+    Args:
+        data (dict): The changed document.
+        validator: Validator of the document (see `awesio.validator.get_validator`).
+        schema_type (str): Schema type of the document.
+        changed_paths (list[tuple]): Paths (tuples of keys and list indices) of the changed values.
+
+    Raises:
+        ValueError: If the changed parts fail validation.
+    """
+    changed_paths = _minimal_paths(changed_paths)
+    root_schema = validator.schema
+    validated = []
+    for path in changed_paths:
+        schema, depth = _subschema(root_schema, data, path)
+        prefix = path[:depth]
+        if any(prefix[:len(p)] == p for p in validated):
+            continue
+        validated.append(prefix)
+        errors = _iter_errors(validator, _get(data, prefix), schema, prefix)
+        schema_validation_error_formatter(errors, root_schema["$id"])
+
+    _validate_data_consistency(data, schema_type, changed_paths)
+
+
+def _iter_errors(validator, instance: Any, schema: dict, prefix: tuple):
+    """Yields the validation errors of ``instance`` against ``schema`` with paths relative to the document."""
+    if schema is not validator.schema:
+        validator = validator.evolve(schema=schema)
+    for error in validator.iter_errors(instance):
+        error.path.extendleft(reversed(prefix))
+        yield error
+
+
+def _parse_pointer(pointer: str) -> tuple:
+    """Splits a JSON pointer into its (unescaped) reference tokens."""
+    if pointer == "":
+        return ()
+    if not pointer.startswith("/"):
+        raise ValueError(f"Invalid JSON pointer: {pointer!r}")
+    return tuple(token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/"))
+
+
+def _format_pointer(path: tuple) -> str:
+    return "".join("/" + str(token).replace("~", "~0").replace("/", "~1") for token in path)
+
+
+def _list_index(array: list, token: Any, allow_end: bool = False) -> int:
+    """Returns the list index for the reference token ``token`` ("-" is the end of the list if ``allow_end``)."""
+    if allow_end and token == "-":
+        return len(array)
+    if isinstance(token, str) and not (token.isdigit() and (token == "0" or not token.startswith("0"))):
+        raise ValueError(f"Invalid list index: {token!r}")
+    index = int(token)
+    if index > len(array) - (0 if allow_end else 1):
+        raise ValueError(f"List index out of range: {index}")
+    return index
+
+
+def _get(data: Any, path: tuple) -> Any:
+    """Returns the value at ``path`` in ``data``."""
+    for i, token in enumerate(path):
+        if isinstance(data, dict) and token in data:
+            data = data[token]
+        elif isinstance(data, list):
+            data = data[_list_index(data, token)]
+        else:
+            raise ValueError(f"Path not found: {_format_pointer(path[:i + 1])}")
+    return data
+
+
+def _restore(data: dict, items: list[tuple]) -> None:
+    """Restores the content and key order of ``data``."""
+    data.clear()
+    data.update(items)
+
+
+def _minimal_paths(paths: list[tuple]) -> list[tuple]:
+    """Drops duplicate paths and the paths below another changed path."""
+    paths = sorted(set(paths), key=len)
+    minimal = []
+    for path in paths:
+        if not any(path[:len(p)] == p for p in minimal):
+            minimal.append(path)
+    return minimal
+
+
+def _resolve(root_schema: dict, schema: Any) -> Any:
+    """Resolves a local ``$ref`` (``#/...``) of ``schema`` against ``root_schema``."""
+    while isinstance(schema, dict) and set(schema) == {"$ref"} and schema["$ref"].startswith("#"):
+        tokens = _parse_pointer(schema["$ref"][1:])
+        schema = root_schema
+        for token in tokens:
+            schema = schema[token]
+    return schema
+
+
+def _subschema(root_schema: dict, data: Any, path: tuple) -> tuple[dict, int]:
+    """
+    Descends from the root schema along ``path`` while the schemas only select the subschemas of their
+    children (see `_TRANSPARENT_KEYWORDS`).
+
+    Returns:
+        tuple[dict, int]: The deepest such subschema and the number of path tokens it covers.
+    """
+    schema = root_schema
+    instance = data
+    for depth, token in enumerate(path):
+        if not isinstance(schema, dict) or not set(schema) <= _TRANSPARENT_KEYWORDS:
+            return schema, depth
+        if isinstance(instance, dict) and token in instance:
+            child = schema.get("properties", {}).get(token, schema.get("additionalProperties"))
+        elif isinstance(instance, list):
+            token = _list_index(instance, token)
+            child = schema.get("items")
+        else:
+            return schema, depth
+        child = _resolve(root_schema, child)
+        if not isinstance(child, dict):
+            return schema, depth
+        schema, instance = child, instance[token]
+    return schema, len(path)
@@ -0,0 +1,305 @@
+"""
+Seeded generators of synthetic awesIO documents of any size.
+
+The documents are valid against their schemas (including the data consistency checks of
+`awesio.validator.validate`) and are streamed to disk: only one cluster, power curve or
+probability matrix slice is held in memory at a time, so multi-GB files can be generated for
+stress tests and benchmarks. The same seed and sizes always give the same file.
+
+Example:
+    >>> from awesio.generate import generate_wind_resource
+    >>> generate_wind_resource("wind_resource.yml", n_clusters=500, n_wind_speed_bins=200, n_wind_direction_bins=72)
+"""
+from __future__ import annotations
+
+import inspect
+from pathlib import Path
+from typing import TextIO
+
+from ._lazy import np
+from .yaml import _get_YAML
+
+AWESIO_VERSION = "0.1.0"
+# Fixed creation time so that the output only depends on the seed and sizes
+TIME_CREATED = "2000-01-01T00:00:00"
+REFERENCE_HEIGHT_M = 100.0
+MAX_ALTITUDE_M = 500.0
+MAX_WIND_SPEED_M_S = 30.0
+
+
+def _flow(values) -> str:
+    """Formats a 1D array as a YAML flow sequence, the same way as `awesio.yaml.write_yaml`."""
+    return "[" + ", ".join(map(repr, values.tolist())) + "]"
+
+
+def _dump(f: TextIO, data: dict) -> None:
+    """Writes the (small) mapping ``data`` with the awesIO YAML settings."""
+    _get_YAML().dump(data, f)
+
+
+def _altitudes(n_altitudes: int):
+    return np.linspace(0.0, MAX_ALTITUDE_M, n_altitudes)
+
+
+def _wind_profile(rng, altitudes) -> tuple:
+    """Returns a random (u, v) wind profile normalized to a magnitude of 1 at the reference height."""
+    shear_exponent = rng.uniform(0.05, 0.3)
+    magnitude = ((altitudes + 1.0) / (REFERENCE_HEIGHT_M + 1.0)) ** shear_exponent
+    veer = np.deg2rad(rng.uniform(-20.0, 20.0)) * (altitudes - REFERENCE_HEIGHT_M) / MAX_ALTITUDE_M
+    return magnitude * np.cos(veer), magnitude * np.sin(veer)
+
+
+def generate_wind_resource(
+    foutput: str | Path,
+    n_clusters: int = 8,
+    n_altitudes: int = 51,
+    n_wind_speed_bins: int = 50,
+    n_wind_direction_bins: int = 36,
+    seed: int = 0,
+) -> None:
+    """
+    Writes a synthetic wind resource document (``wind_resource_schema.yml``) to ``foutput``.
+
+    The clusters have power-law wind profiles with random shear and veer, and the probability
+    matrix combines a Weibull-like wind speed distribution with a prevailing wind direction per
+    cluster, normalized to a total of 100 %.
+
+    Args:
+        foutput (str | Path): Path to the output YAML file.
+        n_clusters (int, optional): Number of clusters. Defaults to 8.
+        n_altitudes (int, optional): Number of altitudes of the wind profiles. Defaults to 51.
+        n_wind_speed_bins (int, optional): Number of wind speed bins. Defaults to 50.
+        n_wind_direction_bins (int, optional): Number of wind direction bins. Defaults to 36.
+        seed (int, optional): Seed of the random number generator. Defaults to 0.
+    """
+    rng = np.random.default_rng(seed)
+    altitudes = _altitudes(n_altitudes)
+    speed_edges = np.linspace(0.0, MAX_WIND_SPEED_M_S, n_wind_speed_bins + 1)
+    speed_centers = (speed_edges[:-1] + speed_edges[1:]) / 2
+    direction_edges = np.linspace(0.0, 360.0, n_wind_direction_bins + 1)
+    direction_centers = (direction_edges[:-1] + direction_edges[1:]) / 2
+    frequencies = rng.dirichlet(np.ones(n_clusters)) * 100.0
+
+    with open(foutput, "w", encoding="utf-8") as f:
+        _dump(f, {
+            "metadata": {
+                "name": "Synthetic Wind Resource Data",
+                "description": "Synthetic wind resource data generated by awesio.generate",
+                "note": f"Generated with seed {seed}",
+                "awesIO_version": AWESIO_VERSION,
+                "schema": "wind_resource_schema.yml",
+                "n_clusters": n_clusters,
+                "n_wind_speed_bins": n_wind_speed_bins,
+                "n_wind_direction_bins": n_wind_direction_bins,
+                "wind_direction_bin_width_deg": 360.0 / n_wind_direction_bins,
+                "reference_height_m": REFERENCE_HEIGHT_M,
+                "wind_speed_range_m_s": [0.0, MAX_WIND_SPEED_M_S],
+                "data_source": "synthetic",
+                "altitude_range_m": [0.0, MAX_ALTITUDE_M],
+                "time_created": TIME_CREATED,
+            }
+        })
+        f.write(f"altitudes: {_flow(altitudes)}\n")
+        f.write("wind_speed_bins:\n")
+        f.write(f"    bin_edges_m_s: {_flow(speed_edges)}\n")
+        f.write(f"    bin_centers_m_s: {_flow(speed_centers)}\n")
+        f.write("wind_direction_bins:\n")
+        f.write(f"    bin_edges_deg: {_flow(direction_edges)}\n")
+        f.write(f"    bin_centers_deg: {_flow(direction_centers)}\n")
+
+        f.write("clusters:\n")
+        for cluster_id in range(1, n_clusters + 1):
+            u, v = _wind_profile(rng, altitudes)
+            f.write(f"   -  id: {cluster_id}\n")
+            f.write(f"      u_normalized: {_flow(u)}\n")
+            f.write(f"      v_normalized: {_flow(v)}\n")
+
+        _dump(f, {
+            "probability_matrix": {
+                "description": "Probability of each cluster occurring at each wind speed and direction bin (% of total samples)",
+                "dimensions": "[n_clusters x n_wind_speed_bins x n_wind_direction_bins]",
+            }
+        })
+        f.write("    data:\n")
+        for frequency in frequencies:
+            scale = rng.uniform(4.0, 12.0)
+            shape = rng.uniform(1.5, 3.0)
+            speed_pdf = (speed_centers / scale) ** (shape - 1) * np.exp(-((speed_centers / scale) ** shape))
+            prevailing = rng.uniform(0.0, 360.0)
+            direction_pdf = np.exp(2.0 * np.cos(np.deg2rad(direction_centers - prevailing)))
+            block = np.outer(speed_pdf, direction_pdf) * rng.uniform(0.5, 1.5, (n_wind_speed_bins, n_wind_direction_bins))
+            block *= frequency / block.sum()
+            for i, row in enumerate(block):
+                f.write(("       -     - " if i == 0 else "             - ") + _flow(row) + "\n")
+
+
+def generate_power_curves(
+    foutput: str | Path,
+    n_curves: int = 8,
+    n_altitudes: int = 51,
+    n_wind_speeds: int = 50,
+    seed: int = 0,
+) -> None:
+    """
+    Writes a synthetic power curves document (``power_curves_schema.yml``) to ``foutput``.
+
+    The power curves of a 50 kW pumping ground-gen system follow a cubic law between the cut-in
+    and the rated wind speed and are capped at the nominal power, scaled by a random speed ratio
+    per profile.
+
+    Args:
+        foutput (str | Path): Path to the output YAML file.
+        n_curves (int, optional): Number of power curves (wind profiles). Defaults to 8.
+        n_altitudes (int, optional): Number of altitudes of the wind profiles. Defaults to 51.
+        n_wind_speeds (int, optional): Number of reference wind speeds. Defaults to 50.
+        seed (int, optional): Seed of the random number generator. Defaults to 0.
+    """
+    rng = np.random.default_rng(seed)
+    altitudes = _altitudes(n_altitudes)
+    cut_in, rated, cut_out, nominal_power = 4.0, 12.0, 25.0, 50000.0
+    wind_speeds = np.linspace(1.0, cut_out, n_wind_speeds)
+    weights = rng.dirichlet(np.ones(n_curves))
+
+    with open(foutput, "w", encoding="utf-8") as f:
+        _dump(f, {
+            "metadata": {
+                "name": "Synthetic Power Curves",
+                "description": "Synthetic power curves generated by awesio.generate",
+                "note": f"Generated with seed {seed}",
+                "awesIO_version": AWESIO_VERSION,
+                "schema": "power_curves_schema.yml",
+                "time_created": TIME_CREATED,
+                "model_config": {
+                    "wing_area_m2": 20.0,
+                    "nominal_power_w": nominal_power,
+                    "nominal_tether_force_n": 3000.0,
+                    "cut_in_wind_speed_m_s": cut_in,
+                    "cut_out_wind_speed_m_s": cut_out,
+                    "operating_altitude_m": 200.0,
+                    "tether_length_operational_m": 300.0,
+                },
+                "wind_resource": {
+                    "n_clusters": n_curves,
+                    "reference_height_m": REFERENCE_HEIGHT_M,
+                    "data_source": "synthetic",
+                },
+            }
+        })
+        f.write(f"altitudes_m: {_flow(altitudes)}\n")
+        f.write(f"reference_wind_speeds_m_s: {_flow(wind_speeds)}\n")
+
+        f.write("power_curves:\n")
+        for profile_id, weight in enumerate(weights, start=1):
+            u, v = _wind_profile(rng, altitudes)
+            speed_ratio = rng.uniform(0.9, 1.3)
+            speeds = wind_speeds * speed_ratio
+            cycle_power = nominal_power * np.clip((speeds - cut_in) / (rated - cut_in), 0.0, 1.0) ** 3
+            cycle_power[(wind_speeds < cut_in) | (wind_speeds > cut_out)] = 0.0
+            reel_out_time = np.full(n_wind_speeds, rng.uniform(40.0, 80.0))
+            reel_in_time = np.full(n_wind_speeds, rng.uniform(10.0, 30.0))
+            cycle_time = reel_out_time + reel_in_time
+            reel_in_power = -0.2 * cycle_power
+            reel_out_power = (cycle_power * cycle_time - reel_in_power * reel_in_time) / reel_out_time
+
+            f.write(f"   -  profile_id: {profile_id}\n")
+            f.write(f"      speed_ratio_at_operating_altitude: {speed_ratio!r}\n")
+            f.write(f"      u_normalized: {_flow(u)}\n")
+            f.write(f"      v_normalized: {_flow(v)}\n")
+            f.write(f"      probability_weight: {float(weight)!r}\n")
+            f.write(f"      cycle_power_w: {_flow(cycle_power)}\n")
+            f.write(f"      reel_out_power_w: {_flow(reel_out_power)}\n")
+            f.write(f"      reel_in_power_w: {_flow(reel_in_power)}\n")
+            f.write(f"      reel_out_time_s: {_flow(reel_out_time)}\n")
+            f.write(f"      reel_in_time_s: {_flow(reel_in_time)}\n")
+            f.write(f"      cycle_time_s: {_flow(cycle_time)}\n")
+
+
+def generate_operational_constraints(
+    foutput: str | Path,
+    n_azimuth_zones: int = 3,
+    n_distance_restrictions: int = 4,
+    seed: int = 0,
+) -> None:
+    """
+    Writes a synthetic operational constraints document (``operational_constraints_schema.yml``) to ``foutput``.
+
+    The azimuth zones split 0-360 deg at random angles; in each zone flight is allowed with a
+    probability of 80 % and the minimum height increases with the distance from the ground station.
+
+    Args:
+        foutput (str | Path): Path to the output YAML file.
+        n_azimuth_zones (int, optional): Number of terrain azimuth zones. Defaults to 3.
+        n_distance_restrictions (int, optional): Number of distance restrictions per zone where
+            flight is allowed. Defaults to 4.
+        seed (int, optional): Seed of the random number generator. Defaults to 0.
+    """
+    rng = np.random.default_rng(seed)
+    azimuth_edges = np.concatenate([[0.0], np.sort(rng.uniform(0.0, 360.0, n_azimuth_zones - 1)), [360.0]])
+    max_altitude = 500.0
+
+    with open(foutput, "w", encoding="utf-8") as f:
+        _dump(f, {
+            "metadata": {
+                "name": "Synthetic Operational Constraints",
+                "description": "Synthetic operational constraints generated by awesio.generate",
+                "note": f"Generated with seed {seed}",
+                "awesIO_version": AWESIO_VERSION,
+                "schema": "operational_constraints_schema.yml",
+                "system_type": "pumping_ground_gen",
+            },
+            "airspace_constraints": {
+                "max_altitude_agl_m": max_altitude,
+                "max_altitude_msl_m": max_altitude + 100.0,
+            },
+            "terrain_constraints": {
+                "description": "Minimum height restrictions by azimuth zone and distance from ground station center",
+            },
+        })
+        f.write("    azimuth_zones:\n")
+        for start, end in zip(azimuth_edges[:-1], azimuth_edges[1:]):
+            flight_allowed = bool(rng.random() < 0.8)
+            f.write(f"       -  azimuth_range_deg: {_flow(np.array([start, end]))}\n")
+            f.write(f"          flight_allowed: {'true' if flight_allowed else 'false'}\n")
+            if not flight_allowed:
+                continue
+            distance_edges = np.concatenate([[0.0], np.cumsum(rng.uniform(10.0, 200.0, n_distance_restrictions))])
+            min_heights = np.concatenate([[0.0], np.cumsum(rng.uniform(0.0, 60.0, n_distance_restrictions - 1))])
+            f.write("          distance_restrictions:\n")
+            for i, min_height in enumerate(min_heights):
+                f.write(f"             -  distance_range_m: {_flow(distance_edges[i:i + 2])}\n")
+                f.write(f"                min_height_agl_m: {float(min_height)!r}\n")
+
+
+GENERATORS = {
+    "wind_resource_schema": generate_wind_resource,
+    "power_curves_schema": generate_power_curves,
+    "operational_constraints_schema": generate_operational_constraints,
+}
+
+
+def generate(schema_type: str, foutput: str | Path, seed: int = 0, **sizes) -> None:
+    """
+    Writes a synthetic document for ``schema_type`` to ``foutput``.
+
+    Args:
+        schema_type (str): Name of the schema without extension (see `GENERATORS`).
+        foutput (str | Path): Path to the output YAML file.
+        seed (int, optional): Seed of the random number generator. Defaults to 0.
+        **sizes: Sizes passed on to the generator (e.g. ``n_clusters=500``).
+
+    Raises:
+        ValueError: If there is no generator for ``schema_type`` or a size is not one of its dimensions.
+    """
+    schema_type = schema_type.replace(".yml", "").replace(".yaml", "")
+    if schema_type not in GENERATORS:
+        raise ValueError(
+            f"No generator for schema '{schema_type}'. Available: {', '.join(GENERATORS)}"
+        )
+    generator = GENERATORS[schema_type]
+    allowed = [name for name in inspect.signature(generator).parameters if name.startswith("n_")]
+    unknown = [name for name in sizes if name not in allowed]
+    if unknown:
+        raise ValueError(
+            f"Unknown sizes for schema '{schema_type}': {', '.join(unknown)}. Available: {', '.join(allowed)}"
+        )
+    generator(foutput, seed=seed, **sizes)
@@ -0,0 +1,290 @@
+"""
+Typed object model of system configurations (``system_schema.yml``), generated from the schema.
+
+Every object of the schema with declared properties becomes a ``__slots__`` dataclass, which
+takes about 80 bytes instead of the few hundred of the dicts returned by
+`awesio.validator.validate`, and attribute access is faster than dict lookups. This matters
+for parameter studies keeping thousands of system variants in memory. Numeric arrays are
+stored as NumPy arrays, also inside the objects without declared properties (e.g. the
+``wing_sections`` table), which stay dicts.
+
+The classes are named after the schema definitions and their nesting, e.g. ``System``,
+``SystemComponents``, ``Wing``, ``WingStructure``, ``TetherStructureMaterial`` or
+``GroundStationGenerator``. The properties of the type-dependent ``allOf`` branches of an
+object are merged into one class.
+
+Example:
+    >>> from awesio.model import System
+    >>> from awesio.validator import validate
+    >>> system = System.from_dict(validate("examples/ground_gen/soft_kite_pumping_ground_gen_system.yml"))
+    >>> system.components.tether.structure.diameter_m
+    0.014
+    >>> system.to_dict() == validate("examples/ground_gen/soft_kite_pumping_ground_gen_system.yml")
+    True
+"""
+from __future__ import annotations
+
+import dataclasses
+import keyword
+from typing import Any
+
+from ._lazy import np
+from .schemas import load_schema
+from .tables import table_rows
+
+_PYTHON_TYPES = {"number": "float", "integer": "int", "string": "str", "boolean": "bool", "null": "None", "array": "np.ndarray | list"}
+
+
+class _Unset:
+    """Value of the fields which are not in the document (unlike None, which is an explicit null)."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __repr__(self) -> str:
+        return "UNSET"
+
+    def __reduce__(self):
+        return (_Unset, ())
+
+
+UNSET = _Unset()
+
+
+class _Model:
+    """Base class of the generated dataclasses."""
+
+    __slots__ = ()
+    # Fields holding a generated class or a numeric array, set on the generated classes
+    _children: dict[str, type] = {}
+    _arrays: frozenset[str] = frozenset()
+    # Field names of the schema properties (which are renamed if they are Python keywords)
+    _keys: dict[str, str] = {}
+
+    def __init__(self, **values):
+        """Sets the fields given as keyword arguments, the others are `UNSET`."""
+        for name in self.__slots__:
+            setattr(self, name, values.pop(name, UNSET))
+        if values:
+            raise TypeError(f"{type(self).__name__}() got unexpected keyword arguments: {', '.join(values)}")
+
+    @classmethod
+    def from_dict(cls, data: dict) -> _Model:
+        """
+        Converts the dict form of the object (e.g. returned by `awesio.validator.validate`).
+
+        Keys which are not properties of the schema are kept in ``extra``. Numeric arrays (also
+        inside untyped values such as ``wing_sections``) are converted to NumPy arrays, other values
+        are not copied.
+
+        Args:
+            data (dict): Dict form of the object.
+
+        Raises:
+            ValueError: If ``data`` is not a dict.
+        """
+        if not isinstance(data, dict):
+            raise ValueError(f"{cls.__name__} must be a dict, got {type(data).__name__}.")
+        values = {}
+        extra = {}
+        for key, value in data.items():
+            name = cls._keys.get(key)
+            if name is None:
+                extra[key] = value
+            elif name in cls._children and isinstance(value, dict):
+                values[name] = cls._children[name].from_dict(value)
+            elif name in cls._arrays:
+                values[name] = _as_numeric_array(value)
+            else:
+                values[name] = _pack(value)
+        return cls(**values, extra=extra or UNSET)
+
+    def to_dict(self) -> dict:
+        """
+        Returns the dict form of the object.
+
+        The keys are in schema order followed by the ``extra`` keys. NumPy arrays are converted to
+        (nested) lists.
+        """
+        data = {}
+        for key, name in self._keys.items():
+            value = getattr(self, name)
+            if value is UNSET:
+                continue
+            data[key] = value.to_dict() if isinstance(value, _Model) else _unpack(value)
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+
+def _has_int(value: list) -> bool:
+    return any(type(item) is int or (type(item) is list and _has_int(item)) for item in value)
+
+
+def _as_numeric_array(value: Any) -> Any:
+    """
+    Returns ``value`` as a NumPy array if it is a (regular, nested) list of numbers, else unchanged.
+
+    Lists mixing integers and floats are kept, as the array would turn the integers into floats.
+    """
+    if not isinstance(value, list) or not value:
+        return value
+    try:
+        array = np.array(value)
+    except ValueError:  # Ragged
+        return value
+    if array.dtype.kind == "i" or (array.dtype.kind == "f" and not _has_int(value)):
+        return array
+    return value
+
+
+def _pack(value: Any) -> Any:
+    """
+    Converts the numeric arrays in the untyped (dict or list) ``value`` to NumPy arrays.
+
+    Dicts and lists without numeric arrays are returned as they are (not copied).
+    """
+    if isinstance(value, dict):
+        packed = {key: _pack(item) for key, item in value.items()}
+        return value if all(packed[key] is item for key, item in value.items()) else packed
+    if isinstance(value, list):
+        array = _as_numeric_array(value)
+        if array is not value:
+            return array
+        packed = [_pack(item) for item in value]
+        return value if all(new is old for new, old in zip(packed, value)) else packed
+    return value
+
+
+def _unpack(value: Any) -> Any:
+    """Inverse of `_pack`."""
+    if isinstance(value, dict):
+        return {key: _unpack(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_unpack(item) for item in value]
+    if np.loaded and isinstance(value, np.ndarray):
+        return table_rows(value) if value.dtype.names is not None else value.tolist()
+    return value
+
+
+def _resolve(root: dict, schema: dict) -> dict:
+    while "$ref" in schema:
+        schema = root["definitions"][schema["$ref"].rsplit("/", 1)[-1]]
+    return schema
+
+
+def _merged_properties(root: dict, schema: dict) -> dict:
+    """Returns the properties of ``schema`` merged with those of its ``allOf`` (``then``) branches."""
+    properties = {}
+    branches = [schema] + [
+        sub for branch in schema.get("allOf", []) for sub in (branch, branch.get("then", {}))
+    ]
+    for branch in branches:
+        for key, subschema in branch.get("properties", {}).items():
+            subschema = _resolve(root, subschema)
+            if key in properties and ("properties" in properties[key] or "properties" in subschema):
+                # Object defined in several branches: merge their properties
+                merged = dict(properties[key])
+                merged["properties"] = {**_merged_properties(root, properties[key]), **_merged_properties(root, subschema)}
+                merged.pop("allOf", None)
+                properties[key] = merged
+            elif key not in properties or set(subschema) > set(properties[key]):
+                properties[key] = subschema
+    return properties
+
+
+def _class_name(key: str) -> str:
+    return "".join(part[:1].upper() + part[1:] for part in key.split("_"))
+
+
+def _field_type(subschema: dict, child: type | None) -> str:
+    if child is not None:
+        return child.__name__
+    types = subschema.get("type", "Any")
+    types = types if isinstance(types, list) else [types]
+    return " | ".join(_PYTHON_TYPES.get(t, "dict" if t == "object" else "Any") for t in types)
+
+
+def _is_numeric_array(subschema: dict) -> bool:
+    """True for arrays without declared (non-numeric) item types."""
+    if "array" not in (subschema.get("type") if isinstance(subschema.get("type"), list) else [subschema.get("type")]):
+        return False
+    items = subschema.get("items", {})
+    return not items or items.get("type") in ("number", "integer", "array")
+
+
+def _build(root: dict, schema: dict, name: str, classes: dict) -> type:
+    """Generates the dataclass of the object ``schema`` (and of its nested objects) into ``classes``."""
+    fields = []
+    children = {}
+    arrays = set()
+    keys = {}
+    for key, subschema in _merged_properties(root, schema).items():
+        field_name = f"{key}_" if keyword.iskeyword(key) or key == "extra" else key
+        keys[key] = field_name
+        child = None
+        if subschema.get("properties") or any(branch.get("then", {}).get("properties") for branch in subschema.get("allOf", [])):
+            ref_name = schema["properties"].get(key, {}).get("$ref", "") if "properties" in schema else ""
+            child_name = _class_name(ref_name.rsplit("/", 1)[-1]) if ref_name else name + _class_name(key)
+            child = classes.get(child_name) or _build(root, subschema, child_name, classes)
+            children[field_name] = child
+        elif _is_numeric_array(subschema):
+            arrays.add(field_name)
+        annotation = _field_type(subschema, child)
+        fields.append((field_name, f"{annotation} | _Unset"))
+    fields.append(("extra", "dict | _Unset"))
+
+    # The slots and the keyword-only `_Model.__init__` are set by hand, as the ``slots`` and
+    # ``kw_only`` options of dataclasses need Python 3.10
+    cls = dataclasses.make_dataclass(
+        name, fields, bases=(_Model,), init=False,
+        namespace={
+            "__slots__": tuple(field_name for field_name, _ in fields),
+            "__doc__": f"{schema.get('title', name)} (generated from the schema).",
+        },
+    )
+    cls.__module__ = __name__
+    cls._children = children
+    cls._arrays = frozenset(arrays)
+    cls._keys = keys
+    classes[name] = cls
+    return cls
+
+
+def build_model(schema_type: str, name: str) -> dict[str, type]:
+    """
+    Generates the dataclasses of a schema.
+
+    Args:
+        schema_type (str): Schema file name without extension, e.g. ``system_schema``.
+        name (str): Name of the root class.
+
+    Returns:
+        dict[str, type]: Generated classes by name, the root class first.
+    """
+    root = load_schema(schema_type)
+    classes = {}
+    _build(root, root, name, classes)
+    return dict(sorted(classes.items(), key=lambda item: item[0] != name))
+
+
+MODEL_CLASSES = build_model("system_schema", "System")
+globals().update(MODEL_CLASSES)
+System = MODEL_CLASSES["System"]
+
+
+def from_dict(data: dict) -> System:
+    """Converts a system document in dict form to the typed model (see `_Model.from_dict`)."""
+    return System.from_dict(data)
+
+
+def to_dict(system: System) -> dict:
+    """Converts a typed system model back to its dict form (see `_Model.to_dict`)."""
+    return system.to_dict()
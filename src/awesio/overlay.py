@@ -0,0 +1,165 @@
+"""
+Copy-on-write views of awesIO documents.
+
+An `Overlay` shows a base document with some values replaced or added without copying it: only the
+overridden values are stored and every other subtree is read from (and shared with) the base.
+
+Example:
+    >>> base = {"a": {"b": 1, "c": [1, 2]}, "d": 3}
+    >>> view = Overlay.from_paths(base, {"a.b": 10, "a.c.1": 20})
+    >>> view["a"]["b"], view["a"]["c"], view["d"]
+    (10, [1, 20], 3)
+    >>> base["a"]["b"]
+    1
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+
+class _Branch(dict):
+    """Overrides below a key (as opposed to a dict value replacing the key)."""
+
+
+def parse_path(path: str | tuple, data: Any = None) -> tuple:
+    """
+    Splits a dotted path (e.g. ``components.tether.structure.diameter_m``) into its keys.
+
+    Args:
+        path (str | tuple): Dotted path, or a tuple of keys which is returned as is.
+        data (Any, optional): Document used to convert the keys of list items to integers
+            (e.g. ``power_curves.0.probability_weight``). Defaults to None (digits are list indices).
+
+    Returns:
+        tuple: Keys of the path.
+    """
+    if isinstance(path, tuple):
+        return path
+    keys = []
+    for token in path.split("."):
+        if token.lstrip("-").isdigit() and (data is None or isinstance(data, list)):
+            token = int(token)
+        keys.append(token)
+        if data is not None:
+            try:
+                data = data[token]
+            except (KeyError, IndexError, TypeError):
+                data = None
+    return tuple(keys)
+
+
+def _overlay(value: Any, branch: _Branch) -> Any:
+    """Applies the overrides ``branch`` to ``value``."""
+    if isinstance(value, Mapping):
+        return Overlay(value, branch)
+    if isinstance(value, list):
+        items = list(value)  # Lists are small compared to the documents, copy the outer one
+        for index, override in branch.items():
+            if not isinstance(index, int) or not -len(items) <= index < len(items):
+                raise KeyError(f"List index out of range: {index!r}")
+            items[index] = _overlay(items[index], override) if isinstance(override, _Branch) else override
+        return items
+    raise KeyError(f"Can not override keys of a {type(value).__name__}: {list(branch)}")
+
+
+class Overlay(Mapping):
+    """
+    Read-only mapping showing ``base`` with overridden values, sharing every other subtree with ``base``.
+
+    Nested mappings are returned as overlays of their overrides (or as the base mapping itself if
+    nothing below them is overridden). Use `to_dict` to get a plain dict, e.g. for jsonschema or
+    `awesio.yaml.write_yaml`.
+    """
+
+    __slots__ = ("base", "overrides")
+
+    def __init__(self, base: Mapping, overrides: dict | None = None):
+        """
+        Args:
+            base (Mapping): Base document (not copied, must not change while the overlay is used).
+            overrides (dict, optional): Overridden values by key, with nested overrides as returned
+                by `from_paths`. Defaults to None.
+        """
+        self.base = base
+        self.overrides = _Branch(overrides or {})
+
+    @classmethod
+    def from_paths(cls, base: Mapping, overrides: dict[str | tuple, Any]) -> Overlay:
+        """
+        Creates an overlay from values by path.
+
+        Args:
+            base (Mapping): Base document.
+            overrides (dict[str | tuple, Any]): Values by dotted path (see `parse_path`) or tuple of keys.
+
+        Raises:
+            ValueError: If a path is empty or overrides a value below another overridden path.
+        """
+        tree = _Branch()
+        for path, value in overrides.items():
+            keys = parse_path(path, base)
+            if not keys:
+                raise ValueError("The path of an override can not be empty.")
+            node = tree
+            for key in keys[:-1]:
+                node = node.setdefault(key, _Branch())
+                if not isinstance(node, _Branch):
+                    raise ValueError(f"Conflicting overrides at {path!r}.")
+            if isinstance(node.get(keys[-1]), _Branch):
+                raise ValueError(f"Conflicting overrides at {path!r}.")
+            node[keys[-1]] = value
+        return cls(base, tree)
+
+    def __getitem__(self, key):
+        if key in self.overrides:
+            override = self.overrides[key]
+            if isinstance(override, _Branch):
+                return _overlay(self.base[key], override)
+            return override
+        return self.base[key]
+
+    def __iter__(self):
+        yield from self.base
+        yield from (key for key in self.overrides if key not in self.base)
+
+    def __len__(self) -> int:
+        return len(self.base) + sum(key not in self.base for key in self.overrides)
+
+    def __contains__(self, key) -> bool:
+        return key in self.overrides or key in self.base
+
+    def __repr__(self) -> str:
+        return f"Overlay({dict(self.overrides)!r})"
+
+    def paths(self) -> list[tuple]:
+        """Returns the overridden paths (tuples of keys)."""
+        paths = []
+        stack = [((), self.overrides)]
+        while stack:
+            prefix, branch = stack.pop()
+            for key, value in branch.items():
+                if isinstance(value, _Branch):
+                    stack.append((prefix + (key,), value))
+                else:
+                    paths.append(prefix + (key,))
+        return sorted(paths, key=lambda path: tuple(map(str, path)))
+
+    def to_dict(self) -> dict:
+        """
+        Returns the document as a plain dict.
+
+        Only the dicts and lists on the overridden paths are new; all other subtrees are shared with
+        the base document.
+        """
+        return _materialize(self.base, self.overrides)
+
+
+def _materialize(value: Any, branch: _Branch) -> Any:
+    """Applies the overrides ``branch`` to a copy of the outer dict or list ``value``."""
+    if not isinstance(value, (Mapping, list)):
+        raise KeyError(f"Can not override keys of a {type(value).__name__}: {list(branch)}")
+    data = dict(value) if isinstance(value, Mapping) else list(value)
+    for key, override in branch.items():
+        data[key] = _materialize(value[key], override) if isinstance(override, _Branch) else override
+    return data
@@ -1,15 +1,209 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from itertools import islice
 from pathlib import Path
 
+from jsonschema.exceptions import best_match as _best_match
+
 schemaPath = Path(__file__).parent
 
+# Pre-parsed schemas (plain and restrictive) written by ``scripts/build_schema_bundle.py``
+BUNDLE_PATH = schemaPath / "schemas_bundle.json"
+_BUNDLE_VERSION = 1
+_bundle = None
+# SHA-256 hashes of the schema sources by path, with the (size, mtime) they were computed for
+_source_hashes: dict[Path, tuple[tuple[int, int], str]] = {}
+
+
+def _get_schema_file(schema_type: str) -> Path:
+    """Returns the path of the schema file for ``schema_type`` (``.yaml`` or ``.yml``)."""
+    schema_file = schemaPath / f"{schema_type}.yaml"
+    if not schema_file.exists():
+        schema_file = schemaPath / f"{schema_type}.yml"
+    if not schema_file.exists():
+        raise FileNotFoundError(f"Schema file {schema_file} not found.")
+    return schema_file
+
+
+def available_schema_types() -> list[str]:
+    """Returns the names (file names without extension) of the schemas in the ``schemas`` folder."""
+    return sorted(path.stem for path in schemaPath.iterdir() if path.suffix in [".yml", ".yaml"])
+
+
+def _enforce_no_additional_properties(schema):
+    """Recursively set additionalProperties: false for all objects in the schema"""
+    if isinstance(schema, dict):
+
+        # If this is an object type schema, and additionalProperties is not specified,
+        #   set additionalProperties: false
+        if (
+            schema.get("type") == "object" or "properties" in schema
+        ) and "additionalProperties" not in schema:
+            schema["additionalProperties"] = False
+
+        # Recursively process all nested schemas
+        for key, value in schema.items():
+            if key == "properties":
+                # Process each property's schema
+                for prop_schema in value.values():
+                    _enforce_no_additional_properties(prop_schema)
+            elif key in ["items", "additionalItems"]:
+                # Process array item schemas
+                _enforce_no_additional_properties(value)
+            elif key in ["oneOf", "anyOf", "allOf"]:
+                # Process each subschema in these combining keywords
+                for subschema in value:
+                    _enforce_no_additional_properties(subschema)
+    return schema
+
+
+def _source_hash(schema_file: Path) -> str:
+    """Returns the SHA-256 hash of ``schema_file``, only read again if its size or mtime changed."""
+    stat = schema_file.stat()
+    signature = (stat.st_size, stat.st_mtime_ns)
+    cached = _source_hashes.get(schema_file)
+    if cached is None or cached[0] != signature:
+        cached = _source_hashes[schema_file] = (signature, hashlib.sha256(schema_file.read_bytes()).hexdigest())
+    return cached[1]
+
+
+def _parse_schema(schema_file: Path, restrictive: bool) -> dict:
+    from ..yaml import load_yaml  # Only needed without an up-to-date bundle
+
+    schema = load_yaml(schema_file)
+    return _enforce_no_additional_properties(schema) if restrictive else schema
+
+
+def build_schema_bundle() -> dict:
+    """
+    Parses every schema and returns the bundle written to `BUNDLE_PATH`.
+
+    Returns:
+        dict: The plain and restrictive schemas by schema type, with the SHA-256 hash of their
+        YAML source.
+    """
+    schemas = {}
+    for schema_type in available_schema_types():
+        schema_file = _get_schema_file(schema_type)
+        schemas[schema_type] = {
+            "source": schema_file.name,
+            "sha256": _source_hash(schema_file),
+            "schema": _parse_schema(schema_file, restrictive=False),
+            "restrictive": _parse_schema(schema_file, restrictive=True),
+        }
+    return {"version": _BUNDLE_VERSION, "schemas": schemas}
+
+
+def stale_schemas(bundle: dict | None = None) -> list[str]:
+    """
+    Returns the schema types whose YAML source is missing from or changed since the bundle.
+
+    Args:
+        bundle (dict, optional): Bundle to check. Defaults to the bundle at `BUNDLE_PATH`.
+    """
+    bundle = _load_bundle() if bundle is None else bundle
+    entries = bundle.get("schemas", {}) if bundle.get("version") == _BUNDLE_VERSION else {}
+    stale = [
+        schema_type for schema_type in available_schema_types()
+        if schema_type not in entries
+        or entries[schema_type]["source"] != _get_schema_file(schema_type).name
+        or entries[schema_type]["sha256"] != _source_hash(_get_schema_file(schema_type))
+    ]
+    return stale + sorted(set(entries) - set(available_schema_types()))
+
+
+def _load_bundle() -> dict:
+    """Reads the bundle once (an empty bundle if it does not exist)."""
+    global _bundle
+    if _bundle is None:
+        try:
+            _bundle = json.loads(BUNDLE_PATH.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            _bundle = {}
+    return _bundle
+
+
+def load_schema(schema_type: str, restrictive: bool = False) -> dict:
+    """
+    Returns the parsed schema ``schema_type`` from the bundle, or from its YAML source if the
+    bundle is missing or out of date (e.g. while editing a schema).
+
+    The YAML files are the source of truth: the bundle entry is only used if the SHA-256 hash of
+    the source matches. Schemas from the bundle are shared between calls and must not be modified;
+    they were checked against the metaschema when the bundle was built.
+
+    Args:
+        schema_type (str): Name of the schema without extension (e.g. ``"system_schema"``).
+        restrictive (bool, optional): If True, return the schema with ``additionalProperties: false``
+            on every object (see `_enforce_no_additional_properties`). Defaults to False.
+
+    Raises:
+        FileNotFoundError: If the schema file is not found.
+    """
+    schema = _bundled_schema(schema_type, restrictive)
+    return _parse_schema(_get_schema_file(schema_type), restrictive) if schema is None else schema
+
+
+def _bundled_schema(schema_type: str, restrictive: bool = False) -> dict | None:
+    """Returns the schema from the bundle, or None if it is not in the bundle or out of date."""
+    schema_file = _get_schema_file(schema_type)
+    bundle = _load_bundle()
+    entry = bundle.get("schemas", {}).get(schema_type) if bundle.get("version") == _BUNDLE_VERSION else None
+    if entry is None or entry["source"] != schema_file.name or entry["sha256"] != _source_hash(schema_file):
+        return None
+    return entry["restrictive" if restrictive else "schema"]
+
+
+def write_schema_bundle(path: str | Path = BUNDLE_PATH) -> None:
+    """Writes the bundle of the current schemas (see `build_schema_bundle`) to ``path``."""
+    global _bundle
+    bundle = build_schema_bundle()
+    Path(path).write_text(json.dumps(bundle, separators=(",", ":")) + "\n", encoding="utf-8")
+    if Path(path) == BUNDLE_PATH:
+        _bundle = bundle
+
+
+def schema_validation_error_formatter(errors, schema_id, fail_fast=False, max_errors=None, best_match=False):
+    """
+    Raises a ValueError listing the validation ``errors`` if there are any.
+
+    The errors are consumed lazily, so with ``fail_fast`` or ``max_errors`` the validation stops
+    as soon as enough errors are found instead of enumerating all errors of a malformed document.
+
+    Args:
+        errors (Iterable[jsonschema.exceptions.ValidationError]): Errors, typically ``validator.iter_errors(instance)``.
+        schema_id (str): Schema name used in the message.
+        fail_fast (bool, optional): Stop at the first error. Same as ``max_errors=1``. Defaults to False.
+        max_errors (int, optional): Maximum number of errors to collect. Defaults to None (all errors).
+        best_match (bool, optional): Only report the most relevant of the collected errors
+            (see `jsonschema.exceptions.best_match`). Defaults to False.
+
+    Raises:
+        ValueError: If there is at least one error.
+    """
+    if fail_fast:
+        max_errors = 1
+    if max_errors is not None and max_errors < 1:
+        raise ValueError(f"max_errors must be at least 1, got {max_errors}")
+
+    errors = iter(errors)
+    # Collect one more error than reported to know whether errors were omitted (not reported with fail_fast)
+    collected = list(errors if max_errors is None else islice(errors, max_errors + (not fail_fast)))
+    if not collected:
+        return
+    truncated = max_errors is not None and len(collected) > max_errors
+    collected = collected[:max_errors]
+    if best_match:
+        collected = [_best_match(collected)]
+
+    error_messages = []
+    for error in collected:
+        path = ".".join(str(p) for p in error.path) if error.path else "root"
+        error_messages.append(f"  - At '{path}': {error.message}")
+    if truncated and not fail_fast:
+        error_messages.append(f"  - ... stopped after {max_errors} errors")
 
-def schema_validation_error_formatter(errors, schema_id):
-    errors = list(errors)
-    if errors:
-        error_messages = []
-        for error in errors:
-            path = ".".join(str(p) for p in error.path) if error.path else "root"
-            error_messages.append(f"  - At '{path}': {error.message}")
-        
-        full_message = f"Validation failed for schema '{schema_id}':\n" + "\n".join(error_messages)
-        raise ValueError(full_message)
+    full_message = f"Validation failed for schema '{schema_id}':\n" + "\n".join(error_messages)
+    raise ValueError(full_message)
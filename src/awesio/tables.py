@@ -0,0 +1,178 @@
+"""
+Columnar ``headers``/``data`` tables.
+
+Many tables of the system and kite geometry files are stored row by row, as a ``headers`` list
+naming the columns and a ``data`` list of rows (e.g. ``wing_airfoils``, ``wing_sections`` or
+``bridle_nodes`` in a system document, ``wing_particles`` in a structural geometry file).
+`to_table` converts the rows into a NumPy structured array with one typed field per header, so
+solvers take a column as a view (``table["LE_x"]``) instead of re-parsing lists of lists.
+
+Documents are converted while loading with ``load_yaml(..., tables=True)`` or afterwards with
+`read_tables`. `awesio.yaml.write_yaml` writes the tables back as rows.
+
+Example:
+    >>> from awesio.yaml import load_yaml
+    >>> data = load_yaml("examples/ground_gen/soft_kite_pumping_ground_gen_system.yml", tables=True)
+    >>> sections = data["components"]["wing"]["structure"]["wing_sections"]["data"]
+    >>> sections["LE_x"]  # float64 view of the column
+    >>> sections.dtype["airfoil_id"]
+    dtype('int64')
+"""
+from __future__ import annotations
+
+from operator import itemgetter
+from typing import Any
+
+from ._lazy import np
+
+_INT64_RANGE = (-2**63, 2**63)
+
+
+def is_table(value: Any) -> bool:
+    """Returns True for a dict with a ``headers`` list of unique strings and a ``data`` list or array of rows."""
+    if not isinstance(value, dict):
+        return False
+    headers = value.get("headers")
+    data = value.get("data")
+    return (
+        isinstance(headers, list) and len(headers) > 0 and all(type(header) is str for header in headers)
+        and len(set(headers)) == len(headers)
+        and (
+            isinstance(data, list) and all(type(row) is list for row in data)
+            or np.loaded and isinstance(data, np.ndarray) and (data.dtype.names is not None or data.ndim == 2)
+        )
+    )
+
+
+def _column_dtype(values: list) -> Any:
+    """
+    Returns the dtype of a column: bool, int64, float64 (integers and floats mixed), a fixed-length
+    string or object (anything else, e.g. dicts, None or numbers mixed with strings).
+    """
+    types = set(map(type, values))
+    if not types:
+        return np.float64
+    if types == {bool}:
+        return np.bool_
+    if types <= {int, float}:
+        integers = values if types == {int} else [value for value in values if type(value) is int] if int in types else []
+        if integers and not (_INT64_RANGE[0] <= min(integers) and max(integers) < _INT64_RANGE[1]):
+            return object
+        return np.int64 if types == {int} else np.float64
+    if types == {str}:
+        return f"U{max(map(len, values))}"
+    return object
+
+
+def check_rows(headers: list[str], rows: list) -> None:
+    """
+    Checks that every row has one value per header.
+
+    Raises:
+        ValueError: Naming the first row with a different number of values.
+    """
+    widths = np.fromiter(map(len, rows), dtype=np.intp, count=len(rows))
+    wrong = np.flatnonzero(widths != len(headers))
+    if wrong.size:
+        row = int(wrong[0])
+        raise ValueError(
+            f"Table row {row} has {widths[row]} values, expected {len(headers)} ({', '.join(headers)})"
+            + (f" ({wrong.size - 1} more rows with the wrong width)" if wrong.size > 1 else "")
+        )
+
+
+def check_columns(headers: list[str], table: Any) -> None:
+    """
+    Checks that no column of a table (rows with one value per header or structured array) mixes
+    numbers and strings.
+
+    Typed fields of a structured array can not mix them, so only its object fields are checked.
+
+    Raises:
+        ValueError: Naming the first mixed column.
+    """
+    if isinstance(table, list):
+        columns = zip(headers, zip(*table))
+    elif table.dtype.hasobject and table.dtype.names is not None:
+        columns = ((name, table[name].tolist()) for name in table.dtype.names if table.dtype[name] == object)
+    else:
+        return  # Typed columns only
+    for header, column in columns:
+        types = set(map(type, column))
+        if types & {int, float} and str in types:
+            raise ValueError(f"Table column {header!r} mixes numbers and strings")
+
+
+def to_table(headers: list[str], data: list | Any) -> np.ndarray:
+    """
+    Converts the rows of a table to a structured array with one field per header.
+
+    Each column gets its own dtype (see `_column_dtype`): integer and float columns become int64 and
+    float64, string columns fixed-length strings and other columns (e.g. dicts) object fields.
+    Columns mixing integers and floats become float64, so their integers are written back as floats.
+
+    Args:
+        headers (list[str]): Column names.
+        data (list | np.ndarray): Rows as lists, a 2D array (e.g. loaded with ``read_numpy``) or a
+            structured array (returned as is if its fields are ``headers``).
+
+    Returns:
+        np.ndarray: Structured array of shape (n_rows,).
+
+    Raises:
+        ValueError: If a row does not have one value per header or the fields of a structured
+            array differ from ``headers``.
+    """
+    if isinstance(data, np.ndarray):
+        if data.dtype.names is not None:
+            if list(data.dtype.names) != list(headers):
+                raise ValueError(f"Table fields {list(data.dtype.names)} differ from the headers {list(headers)}")
+            return data
+        if data.ndim != 2 or data.shape[1] != len(headers):
+            raise ValueError(f"Table data of shape {data.shape} does not have {len(headers)} columns ({', '.join(headers)})")
+        table = np.empty(len(data), dtype=[(header, data.dtype) for header in headers])
+        for i, header in enumerate(headers):
+            table[header] = data[:, i]
+        return table
+
+    check_rows(headers, data)
+    columns = [list(map(itemgetter(i), data)) for i in range(len(headers))]
+    table = np.empty(len(data), dtype=[(header, _column_dtype(column)) for header, column in zip(headers, columns)])
+    for header, column in zip(headers, columns):
+        if table.dtype[header] == object:
+            for i, value in enumerate(column):  # Element-wise, so that list values stay lists
+                table[header][i] = value
+        else:
+            table[header] = column
+    return table
+
+
+def table_rows(table: np.ndarray) -> list[list]:
+    """Returns the rows of a structured array (see `to_table`) as lists of built-in values."""
+    return [list(row) for row in table.tolist()]
+
+
+def read_tables(document: Any) -> Any:
+    """
+    Converts the ``data`` of every table in ``document`` to a structured array (see `to_table`), in place.
+
+    Tables with rows of the wrong width are left as lists (and reported by the validation).
+
+    Returns:
+        The document.
+    """
+    stack = [document]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            if is_table(value):
+                try:
+                    value["data"] = to_table(value["headers"], value["data"])
+                except ValueError:
+                    pass
+                stack.extend(item for key, item in value.items() if key not in ("headers", "data"))
+            else:
+                stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(item for item in value if isinstance(item, (dict, list)))
+    return document
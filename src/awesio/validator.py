@@ -1,14 +1,22 @@
 from __future__ import annotations
 
+import math
+from contextvars import ContextVar
+from itertools import chain
 from pathlib import Path, PosixPath, WindowsPath
 from referencing import Registry, Resource
 from referencing.exceptions import NoSuchResource
-import copy
+from copy import deepcopy
 import jsonschema
 import jsonschema.validators
 
-from .yaml import load_yaml
-from .schemas import schemaPath, schema_validation_error_formatter
+from ._lazy import np  # Imported on first use
+from .tables import check_columns, check_rows, is_table, to_table
+from .yaml import load, load_yaml
+from .schemas import (
+    _bundled_schema, _get_schema_file, _parse_schema, available_schema_types, load_schema, schemaPath,
+    schema_validation_error_formatter, stale_schemas,
+)
 
 
 def retrieve_yaml(uri: str):
@@ -21,48 +29,64 @@ def retrieve_yaml(uri: str):
 
 
 registry = Registry(retrieve=retrieve_yaml)
-
-
-def _enforce_no_additional_properties(schema):
-    """Recursively set additionalProperties: false for all objects in the schema"""
-    if isinstance(schema, dict):
-
-        # If this is an object type schema, and additionalProperties is not specified,
-        #   set additionalProperties: false
-        if (
-            schema.get("type") == "object" or "properties" in schema
-        ) and "additionalProperties" not in schema:
-            schema["additionalProperties"] = False
-
-        # Recursively process all nested schemas
-        for key, value in schema.items():
-            if key == "properties":
-                # Process each property's schema
-                for prop_schema in value.values():
-                    _enforce_no_additional_properties(prop_schema)
-            elif key in ["items", "additionalItems"]:
-                # Process array item schemas
-                _enforce_no_additional_properties(value)
-            elif key in ["oneOf", "anyOf", "allOf"]:
-                # Process each subschema in these combining keywords
-                for subschema in value:
-                    _enforce_no_additional_properties(subschema)
-    return schema
+_registry_has_bundle = False
+
+
+def _get_registry() -> Registry:
+    """Returns `registry` with the up-to-date schemas of the bundle pre-registered (on first use)."""
+    global registry, _registry_has_bundle
+    if not _registry_has_bundle:
+        stale = stale_schemas()
+        resources = []
+        for schema_type in available_schema_types():
+            if schema_type not in stale:
+                schema = load_schema(schema_type)
+                resource = Resource.from_contents(schema)
+                resources += [(schema["$id"], resource), (_get_schema_file(schema_type).name, resource)]
+        registry = registry.with_resources(resources)
+        _registry_has_bundle = True
+    return registry
+
+
+def _get_schema_type(data: dict) -> str:
+    """Auto-detects the schema type (schema file name without extension) from ``metadata.schema``."""
+    if "metadata" not in data or "schema" not in data["metadata"]:
+        raise ValueError(
+            "Schema type could not be automatically determined. "
+            "The input data must contain 'metadata.schema' field."
+        )
+    schema_filename = data["metadata"]["schema"]
+    # Remove .yml or .yaml extension to get schema_type
+    return schema_filename.replace(".yml", "").replace(".yaml", "")
 
 
 def validate(
-    input: dict | str | Path, restrictive: bool = True, defaults: bool = False,
+    input: dict | str | Path,
+    restrictive: bool = True,
+    defaults: bool = False,
+    fail_fast: bool = False,
+    max_errors: int | None = None,
+    best_match: bool = False,
+    copy: bool = True,
 ) -> None:
     """
     Validates a given AWESIO input by auto-detecting the schema type from metadata.
 
     Args:
         input (dict | str | Path): Input data as a dictionary or a path to a YAML file 
-            containing the data to be validated.
+            (or NetCDF file written by `awesio.yaml.write_netcdf`) containing the data to be validated.
         restrictive (bool, optional): If True, the schema will be modified to enforce
             that no additional properties are allowed. Defaults to True.
         defaults (bool, optional): If True, default values specified in the schema will 
             be applied to the input data during validation. Defaults to False.
+        fail_fast (bool, optional): If True, stop at the first schema error. Defaults to False.
+        max_errors (int, optional): Stop after this many schema errors. Defaults to None (report all).
+        best_match (bool, optional): If True, only report the most relevant schema error.
+            Defaults to False.
+        copy (bool, optional): If False, a dict input is validated in place instead of a deep copy
+            of it, which halves the peak memory for large documents. The input is returned as is
+            or, with ``defaults``, as an `awesio.overlay.Overlay` of it holding only the injected
+            default values (the input is not modified). Defaults to True.
 
     Raises:
         FileNotFoundError: If the schema file corresponding to the schema type is not found.
@@ -76,38 +100,22 @@ def validate(
         dict: The validated input data. If `defaults` is True, the returned data will 
         include default values specified in the schema.
     """
+    if type(input) is dict and not copy:
+        return _validate_in_place(input, restrictive, defaults, fail_fast, max_errors, best_match)
     if type(input) is dict:
-        data = copy.deepcopy(input)
+        data = deepcopy(input)
     elif type(input) in [str, Path, PosixPath, WindowsPath]:
-        data = load_yaml(input)
+        data = load(input)
     else:
         raise TypeError(f"Input type {type(input)} is not supported.")
     
-    # Auto-detect schema_type from metadata
-    if "metadata" not in data or "schema" not in data["metadata"]:
-        raise ValueError(
-            "Schema type could not be automatically determined. "
-            "The input data must contain 'metadata.schema' field."
-        )
-    schema_filename = data["metadata"]["schema"]
-    # Remove .yml or .yaml extension to get schema_type
-    schema_type = schema_filename.replace(".yml", "").replace(".yaml", "")
-    
-    schema_file = schemaPath / f"{schema_type}.yaml"
-    if not schema_file.exists():
-        schema_file = schemaPath / f"{schema_type}.yml"
-    if not schema_file.exists():
-        raise FileNotFoundError(f"Schema file {schema_file} not found.")
-
-    schema = load_yaml(schema_file)
-    if restrictive:
-        schema = _enforce_no_additional_properties(schema)
-
-    if defaults:
-        _jsonschema_validate_modified(data, schema, cls = DefaultValidatingDraft7Validator, registry=registry)
-    else:
-        _jsonschema_validate_modified(data, schema, registry=registry)
+    schema_type = _get_schema_type(data)
 
+    validator = get_validator(schema_type, restrictive=restrictive, defaults=defaults)
+    schema_validation_error_formatter(
+        validator.iter_errors(data), validator.schema["$id"],
+        fail_fast=fail_fast, max_errors=max_errors, best_match=best_match,
+    )
 
     # Additional consistency checks beyond schema validation
     _validate_data_consistency(data, schema_type)
@@ -115,29 +123,331 @@ def validate(
     return data
 
 
+def _validate_in_place(
+    data: dict, restrictive: bool, defaults: bool, fail_fast: bool, max_errors: int | None, best_match: bool,
+):
+    """Validates ``data`` without copying or modifying it (see ``copy`` of `validate`)."""
+    schema_type = _get_schema_type(data)
+    validator = get_validator(schema_type, restrictive=restrictive, defaults=defaults)
+    injected = {}
+    token = _injected_defaults.set((injected, set()) if defaults else None)
+    try:
+        schema_validation_error_formatter(
+            validator.iter_errors(data), validator.schema["$id"],
+            fail_fast=fail_fast, max_errors=max_errors, best_match=best_match,
+        )
+    finally:
+        _injected_defaults.reset(token)
+    if not defaults:
+        _validate_data_consistency(data, schema_type)
+        return data
+
+    from .overlay import Overlay  # Only needed with defaults
+
+    overlay = Overlay.from_paths(data, _default_paths(data, injected))
+    _validate_data_consistency(overlay.to_dict() if injected else data, schema_type)
+    return overlay
+
+
+def _default_paths(data: dict, injected: dict[int, tuple]) -> dict[tuple, object]:
+    """Returns the injected default values by path, locating their containers in ``data`` by id."""
+    paths = {}
+    remaining = len(injected)
+    stack = [((), data)]
+    while stack and remaining:
+        path, node = stack.pop()
+        if id(node) in injected:
+            for key, value in injected[id(node)][1].items():
+                paths[path + (key,)] = value
+            remaining -= 1
+        items = node.items() if isinstance(node, dict) else enumerate(node)
+        stack.extend((path + (key,), value) for key, value in items if isinstance(value, (dict, list)))
+    return paths
+
+
+# Process-wide cache of compiled validators keyed by (schema_type, restrictive, defaults)
+_validator_cache: dict[tuple[str, bool, bool], jsonschema.protocols.Validator] = {}
+
+
+def get_validator(
+    schema_type: str, restrictive: bool = True, defaults: bool = False,
+) -> jsonschema.protocols.Validator:
+    """
+    Returns the compiled validator for ``schema_type``, building and caching it on first use.
+
+    The schema is only loaded (from the pre-parsed bundle if it is up to date, see
+    `awesio.schemas.load_schema`, else parsed and checked) the first time a given combination
+    of ``schema_type``, ``restrictive`` and ``defaults`` is requested.
+
+    Args:
+        schema_type (str): Name of the schema without extension (e.g. ``"system_schema"``).
+        restrictive (bool, optional): If True, additional properties are not allowed. Defaults to True.
+        defaults (bool, optional): If True, the validator applies schema default values
+            to the instance. Defaults to False.
+
+    Raises:
+        FileNotFoundError: If the schema file corresponding to the schema type is not found.
+        jsonschema.exceptions.SchemaError: If the schema itself is invalid.
+
+    Returns:
+        jsonschema.protocols.Validator: Validator instance for the schema.
+    """
+    key = (schema_type, bool(restrictive), bool(defaults))
+    validator = _validator_cache.get(key)
+    if validator is None:
+        schema = _bundled_schema(schema_type, restrictive)
+        check = schema is None  # The bundled schemas are checked when the bundle is built
+        if check:
+            schema = _parse_schema(_get_schema_file(schema_type), restrictive)
+        cls = DefaultValidatingDraft7Validator if defaults else NumericDraft7Validator
+        validator = _validator_cache.setdefault(
+            key, _build_validator(schema, cls=cls, registry=_get_registry(), check=check)
+        )
+    return validator
+
+
+def warm_validator_cache(
+    schema_types: list[str] | None = None,
+    restrictive: bool | list[bool] = True,
+    defaults: bool | list[bool] = False,
+) -> None:
+    """
+    Builds the validators up front so that later calls to ``validate`` only pay for the instance check.
+
+    Args:
+        schema_types (list[str], optional): Schema names to compile. Defaults to all
+            schemas in the ``schemas`` folder.
+        restrictive (bool | list[bool], optional): Value(s) of the ``restrictive`` flag to compile. Defaults to True.
+        defaults (bool | list[bool], optional): Value(s) of the ``defaults`` flag to compile. Defaults to False.
+    """
+    if schema_types is None:
+        schema_types = available_schema_types()
+    restrictive = [restrictive] if isinstance(restrictive, bool) else restrictive
+    defaults = [defaults] if isinstance(defaults, bool) else defaults
+    for schema_type in schema_types:
+        for _restrictive in restrictive:
+            for _defaults in defaults:
+                get_validator(schema_type, restrictive=_restrictive, defaults=_defaults)
+
+
+def clear_validator_cache(schema_type: str | None = None) -> None:
+    """
+    Invalidates cached validators, e.g. after a schema file has been edited.
+
+    Args:
+        schema_type (str, optional): Only drop validators for this schema. Defaults to
+            None which clears the whole cache.
+    """
+    global registry, _registry_has_bundle
+    if schema_type is None:
+        _validator_cache.clear()
+        registry = Registry(retrieve=retrieve_yaml)
+        _registry_has_bundle = False
+        return
+    for key in [key for key in _validator_cache if key[0] == schema_type]:
+        del _validator_cache[key]
+
+
+# Defaults injected by the validation of `_validate_in_place` instead of modifying the instance, as
+# {id(dict): (dict, {property: default})}, and the ids of the dicts and lists inside these defaults,
+# which are copies owned by the validation and may be modified
+_injected_defaults: ContextVar[tuple[dict, set] | None] = ContextVar("_injected_defaults", default=None)
+
+
 # See: https://python-jsonschema.readthedocs.io/en/stable/faq/#why-doesn-t-my-schema-s-default-property-set-the-default-on-my-instance
 def extend_with_default(validator_class):
     validate_properties = validator_class.VALIDATORS["properties"]
 
     def set_defaults(validator, properties, instance, schema):
-        for property, subschema in properties.items():
-            if "default" in subschema:
-                instance.setdefault(property, subschema["default"])
+        state = _injected_defaults.get()
+        if state is None or id(instance) in state[1]:
+            for property, subschema in properties.items():
+                if "default" in subschema and property not in instance:
+                    # Copied, as the schemas (and their defaults) are shared by the cached validators
+                    instance[property] = deepcopy(subschema["default"])
+        elif isinstance(instance, dict):
+            missing = {
+                property: deepcopy(subschema["default"]) for property, subschema in properties.items()
+                if "default" in subschema and property not in instance
+            }
+            if missing:
+                # Validate a shallow copy with the defaults, recorded for the caller's (unchanged) dict
+                injected, owned = state
+                injected.setdefault(id(instance), (instance, {}))[1].update(missing)
+                for value in missing.values():
+                    owned.update(map(id, _containers(value)))
+                instance = {**instance, **injected[id(instance)][1]}
 
         for error in validate_properties(validator, properties, instance, schema):
             yield error
 
     return jsonschema.validators.extend(validator_class, {"properties": set_defaults})
 
-DefaultValidatingDraft7Validator = extend_with_default(jsonschema.Draft7Validator)
 
-def _jsonschema_validate_modified(instance, schema, cls=None, *args, **kwargs):
-    """Modification of the `jsonschema.validate` which is though to provide a better error message when validation fails"""
+def _containers(value) -> list:
+    """Returns the dicts and lists in ``value`` (including itself)."""
+    containers = []
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, (dict, list)):
+            containers.append(value)
+            stack.extend(value.values() if isinstance(value, dict) else value)
+    return containers
+
+
+# Keywords allowed in the (nested) "array of number" subschemas checked by `extend_with_numeric_arrays`
+_NUMERIC_LEAF_KEYWORDS = {
+    "type", "minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum", "description", "title", "$comment",
+}
+_NUMERIC_ARRAY_KEYWORDS = {"type", "items", "description", "title", "$comment"}
+_NUMERIC_TYPES = {
+    "number": ((int, float), ("integer", "floating"), "iuf"),
+    "integer": ((int,), ("integer",), "iu"),
+}
+
+
+def _is_numpy(instance, *type_names: str) -> bool:
+    """Returns True if ``instance`` is of one of the NumPy types ``type_names``, without importing NumPy."""
+    return np.loaded and isinstance(instance, tuple(getattr(np, name) for name in type_names))
+
+
+def _numeric_items_spec(items) -> tuple[int, str, dict] | None:
+    """
+    Returns (depth, type, leaf schema) if ``items`` is a number schema or a (nested) array of numbers schema.
+
+    Only plain subschemas are recognized (type and bounds), anything else returns None.
+    """
+    depth = 1
+    while isinstance(items, dict) and items.get("type") == "array":
+        if not items.keys() <= _NUMERIC_ARRAY_KEYWORDS or "items" not in items:
+            return None
+        items = items["items"]
+        depth += 1
+    if (
+        isinstance(items, dict)
+        and items.get("type") in _NUMERIC_TYPES
+        and items.keys() <= _NUMERIC_LEAF_KEYWORDS
+    ):
+        return depth, items["type"], items
+    return None
+
+
+def _is_valid_numeric_array(instance, depth: int, leaf_type: str, leaf_schema: dict) -> bool:
+    """
+    Checks in one shot that ``instance`` is an array of ``depth`` nested levels of numbers within the bounds of ``leaf_schema``.
+
+    Returns False if the instance is not valid or if that can not be decided without the
+    element-wise validation.
+    """
+    python_types, numpy_types, kinds = _NUMERIC_TYPES[leaf_type]
+    if _is_numpy(instance, "ndarray"):
+        if instance.ndim != depth or instance.dtype.kind not in kinds:
+            return False
+        return (
+            ("minimum" not in leaf_schema or not (instance < leaf_schema["minimum"]).any())
+            and ("maximum" not in leaf_schema or not (instance > leaf_schema["maximum"]).any())
+            and ("exclusiveMinimum" not in leaf_schema or not (instance <= leaf_schema["exclusiveMinimum"]).any())
+            and ("exclusiveMaximum" not in leaf_schema or not (instance >= leaf_schema["exclusiveMaximum"]).any())
+        )
+
+    # Plain lists are checked without NumPy, which is not even imported for them
+    leaves = instance
+    for _ in range(depth - 1):
+        if not all(issubclass(t, list) or _is_numpy_type(t, "ndarray") for t in set(map(type, leaves))):
+            return False
+        leaves = list(chain.from_iterable(leaves))
+    if not all(
+        (issubclass(t, python_types) or _is_numpy_type(t, *numpy_types))
+        and not (issubclass(t, bool) or _is_numpy_type(t, "bool_"))
+        for t in set(map(type, leaves))
+    ):
+        return False
+    if not leaves or leaf_schema.keys() <= {"type", "description", "title", "$comment"}:
+        return True
+    try:
+        if math.isnan(sum(leaves)):
+            return False  # Bounds are not decided by min/max with NaN values (or inf - inf)
+    except OverflowError:
+        return False
+    lowest, highest = min(leaves), max(leaves)
+
+    if "minimum" in leaf_schema and lowest < leaf_schema["minimum"]:
+        return False
+    if "maximum" in leaf_schema and highest > leaf_schema["maximum"]:
+        return False
+    if "exclusiveMinimum" in leaf_schema and lowest <= leaf_schema["exclusiveMinimum"]:
+        return False
+    if "exclusiveMaximum" in leaf_schema and highest >= leaf_schema["exclusiveMaximum"]:
+        return False
+    return True
+
+
+def _is_numpy_type(cls: type, *type_names: str) -> bool:
+    """Returns True if ``cls`` is a subclass of one of the NumPy types ``type_names``, without importing NumPy."""
+    return np.loaded and issubclass(cls, tuple(getattr(np, name) for name in type_names))
+
+
+def _is_lazy_array(instance) -> bool:
+    """Returns True for array containers which are not ndarrays but convert to one (e.g. `xr.DataArray` or dask arrays)."""
+    return (
+        not _is_numpy(instance, "ndarray")
+        and hasattr(instance, "__array__")
+        and getattr(instance, "ndim", 0) > 0
+    )
+
+
+def extend_with_numeric_arrays(validator_class):
+    """
+    Extends ``validator_class`` with a fast path for large homogeneous numeric arrays.
+
+    For "array of number" subschemas (including nested ones like the probability matrix) the
+    type, nesting depth and ``minimum``/``maximum`` of all values are checked with NumPy at once.
+    Only if that check fails, the array is validated element-wise to report precise errors.
+    NumPy arrays and scalars are accepted as JSON arrays and numbers, as well as lazily loaded
+    arrays (e.g. from `awesio.yaml.open_yaml`) which are read when validated.
+    """
+    validate_items = validator_class.VALIDATORS["items"]
+
+    def items(validator, items, instance, schema):
+        if _is_lazy_array(instance):
+            instance = np.asarray(instance)  # Reads the data
+        spec = _numeric_items_spec(items)
+        if spec is not None and validator.is_type(instance, "array"):
+            if _is_valid_numeric_array(instance, *spec):
+                return
+        yield from validate_items(validator, items, instance, schema)
+
+    base_checker = validator_class.TYPE_CHECKER
+    type_checker = base_checker.redefine_many(
+        {
+            "array": lambda checker, instance: (
+                base_checker.is_type(instance, "array")
+                or _is_numpy(instance, "ndarray")
+                or _is_lazy_array(instance)
+            ),
+            "integer": lambda checker, instance: (
+                base_checker.is_type(instance, "integer") or _is_numpy(instance, "integer")
+            ),
+        }
+    )
+    return jsonschema.validators.extend(validator_class, {"items": items}, type_checker=type_checker)
+
+NumericDraft7Validator = extend_with_numeric_arrays(jsonschema.Draft7Validator)
+DefaultValidatingDraft7Validator = extend_with_default(NumericDraft7Validator)
+
+def _build_validator(schema, cls=None, *args, check=True, **kwargs):
+    """Checks ``schema`` (unless ``check`` is False) and returns a validator instance of ``cls`` (auto-detected if None)"""
     if cls is None:
         cls = jsonschema.validators.validator_for(schema)
 
-    cls.check_schema(schema)
-    validator = cls(schema, *args, **kwargs)
+    if check:
+        cls.check_schema(schema)
+    return cls(schema, *args, **kwargs)
+
+def _jsonschema_validate_modified(instance, schema, cls=None, *args, **kwargs):
+    """Modification of the `jsonschema.validate` which is though to provide a better error message when validation fails"""
+    validator = _build_validator(schema, cls, *args, **kwargs)
     schema_validation_error_formatter(validator.iter_errors(instance), schema['$id'])
 
 
@@ -153,118 +463,273 @@ def _validate_cluster_count(data: dict) -> None:
             )
 
 
-def _validate_data_consistency(data: dict, schema_type: str) -> None:
-    """Validate data consistency based on schema type."""
-    if schema_type == "wind_resource_schema":
-        _validate_wind_resource_consistency(data)
-    elif schema_type == "power_curves_schema":
-        _validate_power_curves_consistency(data)
+def _validate_data_consistency(data: dict, schema_type: str, changed_paths: list[tuple] | None = None) -> None:
+    """
+    Validate data consistency based on schema type.
 
+    Args:
+        data (dict): Data to check.
+        schema_type (str): Name of the schema without extension.
+        changed_paths (list[tuple], optional): If given, only the rules reading data at, above or
+            below one of these paths are run. Defaults to None which runs all rules.
+    """
+    for rule, dependencies in _CONSISTENCY_RULES.get(schema_type, []):
+        if changed_paths is None or any(
+            _paths_overlap(path, dependency) for path in changed_paths for dependency in dependencies
+        ):
+            rule(data)
 
-def _validate_wind_resource_consistency(data: dict) -> None:
-    """Validates consistency requirements for wind resource data."""
-    # Check cluster count
-    _validate_cluster_count(data)
-    
-    # Check that u_normalized and v_normalized have same length as altitudes
+
+def _paths_overlap(path: tuple, pattern: tuple) -> bool:
+    """Returns True if ``path`` is equal to, above or below ``pattern`` (``"*"`` matches any key)."""
+    return all(p == q or q == "*" for p, q in zip(path, pattern))
+
+
+def _as_array(data, dtype=float) -> np.ndarray | None:
+    """Returns ``data`` as a contiguous ndarray, or None if it is ragged or not numeric."""
+    try:
+        return np.ascontiguousarray(data, dtype=dtype)
+    except (ValueError, TypeError):
+        return None
+
+
+def _check_array_lengths(
+    items: list, key: str, expected_length: int, reference_name: str, describe, required: bool = False,
+) -> np.ndarray | None:
+    """
+    Checks that ``item[key]`` has ``expected_length`` values for all ``items``.
+
+    The arrays are stacked into one (n_items x expected_length) ndarray, so the check is a single
+    shape comparison. Only if that fails, the lengths are compared to find the offending item.
+
+    Args:
+        items (list): List of dictionaries (e.g. clusters or power curves).
+        key (str): Key of the array in each item.
+        expected_length (int): Expected number of values.
+        reference_name (str): Name of the array defining ``expected_length`` used in the error message.
+        describe (callable): Returns the item description for the error message given its index.
+        required (bool, optional): If False, items without ``key`` are skipped, otherwise they
+            count as empty arrays. Defaults to False.
+
+    Raises:
+        ValueError: If any of the arrays does not have ``expected_length`` values.
+
+    Returns:
+        np.ndarray | None: The stacked arrays, or None if they are not numeric.
+    """
+    indices = [i for i, item in enumerate(items) if required or key in item]
+    stacked = _as_array([items[i].get(key, []) for i in indices])
+    if stacked is not None and stacked.shape == (len(indices), expected_length):
+        return stacked
+
+    lengths = np.array([len(items[i].get(key, [])) for i in indices], dtype=int)
+    mismatch = np.flatnonzero(lengths != expected_length)
+    if mismatch.size:
+        raise ValueError(
+            f"{describe(indices[mismatch[0]])}: {key} length ({lengths[mismatch[0]]}) "
+            f"does not match {reference_name} length ({expected_length})"
+        )
+    return None
+
+
+def _validate_bins(bins: dict, expected_count: int | None, centers_key: str, edges_key: str, count_name: str) -> None:
+    """Validates the number of bin centers and edges."""
+    if expected_count and centers_key in bins:
+        actual_count = len(bins[centers_key])
+        if actual_count != expected_count:
+            raise ValueError(
+                f"{centers_key} length ({actual_count}) does not match {count_name} ({expected_count})"
+            )
+
+    if edges_key in bins and centers_key in bins:
+        if len(bins[edges_key]) != len(bins[centers_key]) + 1:
+            raise ValueError(
+                f"{edges_key} must have exactly one more element than {centers_key}. "
+                f"Got {len(bins[edges_key])} edges and {len(bins[centers_key])} centers"
+            )
+
+
+def _validate_probability_matrix(data: dict) -> None:
+    """Validates shape, sign and total of the [n_clusters x n_wind_speed_bins x n_wind_direction_bins] probability matrix."""
+    if "data" not in data.get("probability_matrix", {}):
+        return
+    probabilities = _as_array(data["probability_matrix"]["data"])
+    if probabilities is None or probabilities.ndim != 3:
+        raise ValueError(
+            "probability_matrix.data must be a regular numeric "
+            "[n_clusters x n_wind_speed_bins x n_wind_direction_bins] array"
+        )
+
+    metadata = data.get("metadata", {})
+    for axis, name in enumerate(["n_clusters", "n_wind_speed_bins", "n_wind_direction_bins"]):
+        expected = metadata.get(name)
+        if expected is not None and probabilities.shape[axis] != expected:
+            raise ValueError(
+                f"probability_matrix.data shape {probabilities.shape} does not match "
+                f"metadata.{name} ({expected}) along axis {axis}"
+            )
+
+    valid = probabilities >= 0  # Also False for NaN
+    if not valid.all():
+        index = tuple(int(i) for i in np.argwhere(~valid)[0])
+        raise ValueError(
+            f"probability_matrix.data values must be non-negative, got {probabilities[index]} at index {list(index)}"
+        )
+
+    # Probabilities are given in % of total samples
+    total = probabilities.sum()
+    if abs(total - 100.0) > 0.1:  # Allow small floating point tolerance
+        raise ValueError(f"Sum of probability_matrix.data values should equal 100 (%), got {total}")
+
+
+def _validate_cluster_profiles(data: dict) -> None:
+    """Validates that u_normalized and v_normalized of all clusters have the same length as altitudes."""
     if "clusters" in data and "altitudes" in data:
+        clusters = data["clusters"]
         altitude_count = len(data["altitudes"])
-        for i, cluster in enumerate(data["clusters"]):
-            if len(cluster.get("u_normalized", [])) != altitude_count:
-                raise ValueError(
-                    f"Cluster {cluster.get('id', i+1)}: u_normalized length ({len(cluster.get('u_normalized', []))}) "
-                    f"does not match altitudes length ({altitude_count})"
-                )
-            if len(cluster.get("v_normalized", [])) != altitude_count:
-                raise ValueError(
-                    f"Cluster {cluster.get('id', i+1)}: v_normalized length ({len(cluster.get('v_normalized', []))}) "
-                    f"does not match altitudes length ({altitude_count})"
-                )
-            if len(cluster.get("u_normalized", [])) != len(cluster.get("v_normalized", [])):
-                raise ValueError(
-                    f"Cluster {cluster.get('id', i+1)}: u_normalized and v_normalized arrays must have the same length"
-                )
-    
-    # Check unique cluster IDs and consecutive numbering
+        for key in ["u_normalized", "v_normalized"]:
+            _check_array_lengths(
+                clusters, key, altitude_count, "altitudes",
+                lambda i: f"Cluster {clusters[i].get('id', i+1)}", required=True,
+            )
+
+
+def _validate_cluster_ids(data: dict) -> None:
+    """Validates that the cluster IDs are unique and numbered consecutively from 1."""
     if "clusters" in data:
-        cluster_ids = [cluster.get("id") for cluster in data["clusters"]]
-        if len(cluster_ids) != len(set(cluster_ids)):
+        cluster_ids = np.array([cluster.get("id") for cluster in data["clusters"]])
+        if np.unique(cluster_ids).size != cluster_ids.size:
             raise ValueError("Cluster IDs must be unique")
-        expected_ids = list(range(1, len(cluster_ids) + 1))
-        if sorted(cluster_ids) != expected_ids:
-            raise ValueError(f"Cluster IDs must be consecutive starting from 1. Expected {expected_ids}, got {sorted(cluster_ids)}")
-    
-    # Check wind speed bins consistency
-    if "wind_speed_bins" in data and "metadata" in data:
-        bins = data["wind_speed_bins"]
-        metadata = data["metadata"]
-        
-        expected_bin_centers = metadata.get("n_wind_speed_bins")
-        if expected_bin_centers and "bin_centers_m_s" in bins:
-            actual_bin_centers = len(bins["bin_centers_m_s"])
-            if actual_bin_centers != expected_bin_centers:
-                raise ValueError(
-                    f"bin_centers_m_s length ({actual_bin_centers}) does not match n_wind_speed_bins ({expected_bin_centers})"
-                )
-        
-        if "bin_edges_m_s" in bins and "bin_centers_m_s" in bins:
-            if len(bins["bin_edges_m_s"]) != len(bins["bin_centers_m_s"]) + 1:
-                raise ValueError(
-                    f"bin_edges_m_s must have exactly one more element than bin_centers_m_s. "
-                    f"Got {len(bins['bin_edges_m_s'])} edges and {len(bins['bin_centers_m_s'])} centers"
-                )
+        expected_ids = np.arange(1, cluster_ids.size + 1)
+        if not np.array_equal(np.sort(cluster_ids), expected_ids):
+            raise ValueError(f"Cluster IDs must be consecutive starting from 1. Expected {expected_ids.tolist()}, got {np.sort(cluster_ids).tolist()}")
+
+
+def _validate_wind_bins(data: dict) -> None:
+    """Validates the wind speed and wind direction bins against the metadata."""
+    metadata = data.get("metadata", {})
+    if "wind_speed_bins" in data:
+        _validate_bins(
+            data["wind_speed_bins"], metadata.get("n_wind_speed_bins"),
+            "bin_centers_m_s", "bin_edges_m_s", "n_wind_speed_bins",
+        )
+    if "wind_direction_bins" in data:
+        _validate_bins(
+            data["wind_direction_bins"], metadata.get("n_wind_direction_bins"),
+            "bin_centers_deg", "bin_edges_deg", "n_wind_direction_bins",
+        )
 
 
-def _validate_power_curves_consistency(data: dict) -> None:
-    """Validates consistency requirements for power curves data."""
-    if not ("power_curves" in data and "altitudes_m" in data and "reference_wind_speeds_m_s" in data):
+def _validate_wind_resource_consistency(data: dict) -> None:
+    """Validates consistency requirements for wind resource data."""
+    for rule, _ in _CONSISTENCY_RULES["wind_resource_schema"]:
+        rule(data)
+
+
+def _has_power_curves(data: dict) -> bool:
+    return "power_curves" in data and "altitudes_m" in data and "reference_wind_speeds_m_s" in data
+
+
+def _validate_power_curve_ids(data: dict) -> None:
+    """Validates that the power curve profile IDs are unique."""
+    if _has_power_curves(data):
+        profile_ids = np.array([curve.get("profile_id") for curve in data["power_curves"]])
+        if np.unique(profile_ids).size != profile_ids.size:
+            raise ValueError("Power curve profile_id values must be unique")
+
+
+def _validate_probability_weights(data: dict) -> None:
+    """Validates that the probability weights of the power curves sum to approximately 1.0."""
+    if _has_power_curves(data):
+        total_weight = np.array(
+            [curve.get("probability_weight", 0) for curve in data["power_curves"]], dtype=float
+        ).sum()
+        if abs(total_weight - 1.0) > 0.001:  # Allow small floating point tolerance
+            raise ValueError(f"Sum of probability_weight values should equal 1.0, got {total_weight}")
+
+
+_POWER_TIME_ARRAYS = [
+    "cycle_power_w", "reel_out_power_w", "reel_in_power_w",
+    "reel_out_time_s", "reel_in_time_s", "cycle_time_s"
+]
+
+
+def _validate_power_curve_lengths(data: dict) -> None:
+    """Validates the array lengths of all power curves against altitudes_m and reference_wind_speeds_m_s."""
+    if not _has_power_curves(data):
         return
-    
+
+    curves = data["power_curves"]
     altitude_count = len(data["altitudes_m"])
     wind_speed_count = len(data["reference_wind_speeds_m_s"])
-    
-    # Check unique profile IDs
-    profile_ids = [curve.get("profile_id") for curve in data["power_curves"]]
-    if len(profile_ids) != len(set(profile_ids)):
-        raise ValueError("Power curve profile_id values must be unique")
-    
-    # Check that probability weights sum to approximately 1.0
-    total_weight = sum(curve.get("probability_weight", 0) for curve in data["power_curves"])
-    if abs(total_weight - 1.0) > 0.001:  # Allow small floating point tolerance
-        raise ValueError(f"Sum of probability_weight values should equal 1.0, got {total_weight}")
-    
-    # Check array length consistency within each power curve
-    for i, curve in enumerate(data["power_curves"]):
-        profile_id = curve.get("profile_id", i+1)
-        
-        # Check u_normalized and v_normalized match altitudes
-        if "u_normalized" in curve:
-            if len(curve["u_normalized"]) != altitude_count:
-                raise ValueError(
-                    f"Power curve {profile_id}: u_normalized length ({len(curve['u_normalized'])}) "
-                    f"does not match altitudes_m length ({altitude_count})"
-                )
-        if "v_normalized" in curve:
-            if len(curve["v_normalized"]) != altitude_count:
-                raise ValueError(
-                    f"Power curve {profile_id}: v_normalized length ({len(curve['v_normalized'])}) "
-                    f"does not match altitudes_m length ({altitude_count})"
-                )
-        if "u_normalized" in curve and "v_normalized" in curve:
-            if len(curve["u_normalized"]) != len(curve["v_normalized"]):
-                raise ValueError(
-                    f"Power curve {profile_id}: u_normalized and v_normalized arrays must have the same length"
-                )
-        
-        # Check power and time arrays match reference wind speeds
-        power_time_arrays = [
-            "cycle_power_w", "reel_out_power_w", "reel_in_power_w",
-            "reel_out_time_s", "reel_in_time_s", "cycle_time_s"
-        ]
-        for array_name in power_time_arrays:
-            if array_name in curve:
-                if len(curve[array_name]) != wind_speed_count:
-                    raise ValueError(
-                        f"Power curve {profile_id}: {array_name} length ({len(curve[array_name])}) "
-                        f"does not match reference_wind_speeds_m_s length ({wind_speed_count})"
-                    )
\ No newline at end of file
+
+    def describe(i):
+        return f"Power curve {curves[i].get('profile_id', i+1)}"
+
+    # u_normalized and v_normalized match altitudes
+    for key in ["u_normalized", "v_normalized"]:
+        _check_array_lengths(curves, key, altitude_count, "altitudes_m", describe)
+
+    # Power and time arrays match reference wind speeds
+    for key in _POWER_TIME_ARRAYS:
+        _check_array_lengths(curves, key, wind_speed_count, "reference_wind_speeds_m_s", describe)
+
+
+def _validate_tables(data: dict) -> None:
+    """
+    Validates that every ``headers``/``data`` table has one value per header in each row and no
+    column mixing numbers and strings (see `awesio.tables`).
+    """
+    stack = [((), data)]
+    while stack:
+        path, value = stack.pop()
+        if isinstance(value, dict):
+            table = is_table(value)
+            if table:
+                try:
+                    if isinstance(value["data"], list):
+                        check_rows(value["headers"], value["data"])
+                        check_columns(value["headers"], value["data"])
+                    else:
+                        # Checks the fields or columns of arrays
+                        check_columns(value["headers"], to_table(value["headers"], value["data"]))
+                except ValueError as error:
+                    raise ValueError(f"At '{'.'.join(map(str, path))}': {error}") from None
+            stack.extend((path + (key,), item) for key, item in value.items() if not (table and key == "data"))
+        elif isinstance(value, list):
+            stack.extend((path + (i,), item) for i, item in enumerate(value) if isinstance(item, (dict, list)))
+
+
+def _validate_power_curves_consistency(data: dict) -> None:
+    """Validates consistency requirements for power curves data."""
+    for rule, _ in _CONSISTENCY_RULES["power_curves_schema"]:
+        rule(data)
+
+
+# Consistency rules per schema type with the paths of the data they read ("*" matches any key),
+# used to only rerun the rules affected by a change (see `awesio.document.ValidatedDocument`)
+_N_BINS = [("metadata", "n_wind_speed_bins"), ("metadata", "n_wind_direction_bins")]
+_CONSISTENCY_RULES = {
+    "wind_resource_schema": [
+        (_validate_cluster_count, [("metadata", "n_clusters"), ("clusters",)]),
+        (
+            _validate_cluster_profiles,
+            [("altitudes",), ("clusters", "*", "u_normalized"), ("clusters", "*", "v_normalized")],
+        ),
+        (_validate_cluster_ids, [("clusters", "*", "id")]),
+        (_validate_wind_bins, [("wind_speed_bins",), ("wind_direction_bins",), *_N_BINS]),
+        (_validate_probability_matrix, [("probability_matrix",), ("metadata", "n_clusters"), *_N_BINS]),
+    ],
+    "system_schema": [(_validate_tables, [("components",)])],
+    "power_curves_schema": [
+        (_validate_power_curve_ids, [("power_curves", "*", "profile_id")]),
+        (_validate_probability_weights, [("power_curves", "*", "probability_weight")]),
+        (
+            _validate_power_curve_lengths,
+            [
+                ("altitudes_m",), ("reference_wind_speeds_m_s",),
+                *[("power_curves", "*", key) for key in ["u_normalized", "v_normalized", *_POWER_TIME_ARRAYS]],
+            ],
+        ),
+    ],
+}
@@ -0,0 +1,196 @@
+"""
+Parameter sweeps over a base awesIO document.
+
+A `ParameterSweep` validates the base document once and describes each variant by its overrides
+(dotted paths such as ``components.tether.structure.diameter_m``). Variants are `Overlay` views
+sharing every unchanged subtree with the base, and only the overridden paths of a variant are
+revalidated (see `awesio.document.validate_paths`), so thousands of variants of a system document
+cost about as much as the values they change.
+
+Example:
+    >>> from awesio.variants import ParameterSweep
+    >>> sweep = ParameterSweep(
+    ...     "examples/ground_gen/soft_kite_pumping_ground_gen_system.yml",
+    ...     {"components.tether.structure.diameter_m": [0.012, 0.014, 0.016],
+    ...      "components.wing.structure.mass_kg": [40.0, 50.0]},
+    ... )
+    >>> len(sweep)
+    6
+    >>> sweep[1]["components"]["wing"]["structure"]["mass_kg"]
+    50.0
+    >>> sweep.write("variants", workers=4)  # variants/variant_00000.yml, ...
+"""
+from __future__ import annotations
+
+import math
+import os
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from .document import _get, validate_paths
+from .overlay import Overlay, parse_path
+from .validator import _get_schema_type, get_validator, validate
+from .yaml import write_yaml
+
+# Base document and validator of the worker processes of `ParameterSweep.write`
+_WORKER_SWEEP = None
+
+
+class ParameterSweep:
+    """
+    Variants of a base document given as a grid or a list of overrides by dotted path.
+
+    Indexing and iterating return the variants as validated `Overlay` views; use
+    `Overlay.to_dict` for a plain dict (which still shares the unchanged subtrees with the base).
+    Override values are shared between the variants and must not be modified.
+    """
+
+    def __init__(self, base: dict | str | Path, overrides: dict[str, list] | list[dict], restrictive: bool = True):
+        """
+        Args:
+            base (dict | str | Path): Base document as a dictionary or a path to a YAML or NetCDF file.
+                It is validated once (see `awesio.validator.validate`).
+            overrides (dict[str, list] | list[dict]): Either a grid as the list of values of each
+                path (every combination is a variant, the last path varying fastest) or a list of
+                variants as their values by path. Paths are dotted (list items by index, e.g.
+                ``components.wing.structure.sections.0.chord_m``) or tuples of keys.
+            restrictive (bool, optional): Passed on to `validate`. Defaults to True.
+
+        Raises:
+            ValueError: If the base document is invalid or a grid path has no values.
+        """
+        self.base = validate(base, restrictive=restrictive)
+        self.schema_type = _get_schema_type(self.base)
+        self.restrictive = restrictive
+        self._validator = get_validator(self.schema_type, restrictive=restrictive)
+
+        if isinstance(overrides, Mapping):
+            self._grid = {parse_path(path, self.base): list(values) for path, values in overrides.items()}
+            for path, values in self._grid.items():
+                if not values:
+                    raise ValueError(f"No values given for {'.'.join(map(str, path))!r}.")
+            self._variants = None
+        else:
+            self._grid = None
+            self._variants = [
+                {parse_path(path, self.base): value for path, value in variant.items()} for variant in overrides
+            ]
+
+    def __len__(self) -> int:
+        if self._grid is None:
+            return len(self._variants)
+        return math.prod(len(values) for values in self._grid.values())
+
+    def __getitem__(self, index: int) -> Overlay:
+        """
+        Returns the validated variant ``index``.
+
+        Raises:
+            IndexError: If ``index`` is out of range.
+            ValueError: If the variant fails validation.
+        """
+        overrides = self.overrides(index)
+        variant = Overlay.from_paths(self.base, overrides)
+        _validate_variant(self.base, variant, self._validator, self.schema_type, index)
+        return variant
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def overrides(self, index: int) -> dict[tuple, Any]:
+        """
+        Returns the overridden values of variant ``index`` by path (tuple of keys).
+
+        Raises:
+            IndexError: If ``index`` is out of range.
+        """
+        n_variants = len(self)
+        if not -n_variants <= index < n_variants:
+            raise IndexError(f"Variant index out of range: {index}")
+        index %= n_variants
+        if self._grid is None:
+            return self._variants[index]
+        overrides = {}
+        for path, values in reversed(self._grid.items()):
+            index, position = divmod(index, len(values))
+            overrides[path] = values[position]
+        return dict(reversed(overrides.items()))
+
+    def write(self, directory: str | Path, name: str = "variant_{index:05d}.yml", workers: int | None = 1) -> list[Path]:
+        """
+        Validates and writes every variant to a YAML file (see `awesio.yaml.write_yaml` with ``fast=True``).
+
+        The variants are materialized one at a time, so the memory use does not grow with the number
+        of variants. With several workers, the base document is sent once to each worker process
+        and the tasks only carry the overrides.
+
+        Args:
+            directory (str | Path): Output directory (created if needed).
+            name (str, optional): File name pattern formatted with the variant ``index``.
+                Defaults to ``variant_{index:05d}.yml``.
+            workers (int, optional): Number of worker processes, None for the number of CPUs.
+                Defaults to 1 (write in the current process).
+
+        Returns:
+            list[Path]: The written files in variant order.
+
+        Raises:
+            ValueError: If a variant fails validation. The variants before it are written.
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        tasks = ((index, self.overrides(index), directory / name.format(index=index)) for index in range(len(self)))
+        workers = min(workers or os.cpu_count() or 1, max(len(self), 1))
+        if workers == 1:
+            return [_write_variant(self.base, self._validator, self.schema_type, *task) for task in tasks]
+
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(self.base, self.schema_type, self.restrictive),
+        ) as executor:
+            return list(executor.map(_write_worker_variant, tasks, chunksize=max(len(self) // (4 * workers), 1)))
+
+
+def _changed_paths(base: dict, paths: list[tuple]) -> list[tuple]:
+    """Returns the paths to revalidate: the parent of a new key, as it may not allow it."""
+    changed_paths = []
+    for path in paths:
+        try:
+            parent = _get(base, path[:-1])
+        except (KeyError, IndexError, TypeError, ValueError):
+            parent = None
+        new_key = isinstance(parent, dict) and path[-1] not in parent
+        changed_paths.append(path[:-1] if new_key else path)
+    return changed_paths
+
+
+def _validate_variant(base: dict, variant: Overlay, validator, schema_type: str, index: int) -> dict:
+    """Validates the overridden paths of ``variant`` and returns it as a plain dict."""
+    try:
+        data = variant.to_dict()
+    except (KeyError, IndexError) as error:
+        raise ValueError(f"Variant {index}: invalid override path ({error}).") from None
+    try:
+        if _get_schema_type(data) != schema_type:
+            raise ValueError("Overrides can not change the schema of the document.")
+        validate_paths(data, validator, schema_type, _changed_paths(base, variant.paths()))
+    except ValueError as error:
+        raise ValueError(f"Variant {index}: {error}") from None
+    return data
+
+
+def _write_variant(base: dict, validator, schema_type: str, index: int, overrides: dict, path: Path) -> Path:
+    variant = Overlay.from_paths(base, overrides)
+    write_yaml(_validate_variant(base, variant, validator, schema_type, index), path, fast=True)
+    return path
+
+
+def _init_worker(base: dict, schema_type: str, restrictive: bool) -> None:
+    global _WORKER_SWEEP
+    _WORKER_SWEEP = (base, get_validator(schema_type, restrictive=restrictive), schema_type)
+
+
+def _write_worker_variant(task: tuple) -> Path:
+    return _write_variant(*_WORKER_SWEEP, *task)
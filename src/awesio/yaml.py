@@ -1,14 +1,37 @@
 from __future__ import annotations
 
+import copy
+import json
 import os
+import re
+import uuid
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
 from typing import Any
 from pathlib import Path
 
-import numpy as np
 from ruamel.yaml import YAML
 from ruamel.yaml.constructor import SafeConstructor
-import netCDF4 # Importing netCFD to avoid warning: <frozen importlib._bootstrap>:241: RuntimeWarning: numpy.ndarray size changed, may indicate binary incompatibility. Expected 16 from C header, got 96 from PyObject
-import xarray as xr
+from ruamel.yaml.events import (
+    AliasEvent, DocumentStartEvent, MappingEndEvent, MappingStartEvent, ScalarEvent, SequenceEndEvent,
+    SequenceStartEvent,
+)
+from ruamel.yaml.nodes import ScalarNode
+
+from . import cache as _cache
+from ._lazy import np, xr  # Imported on first use
+from .cache import clear_cache
+from .tables import is_table, table_rows, to_table
+
+# Directory of the file currently being loaded by `load_yaml`. Relative `!include` paths are
+# resolved against it, which also works for the C parser where the stream name is not available.
+_include_dir: ContextVar[Path | None] = ContextVar("_include_dir", default=None)
+# Files pulled in with `!include` while loading a cached document (None if not recording)
+_included_files: ContextVar[list[Path] | None] = ContextVar("_included_files", default=None)
+# (datasets exit stack, chunks) while loading with `open_yaml`, which includes NetCDF files lazily
+_lazy_netcdf: ContextVar[tuple[ExitStack, Any] | None] = ContextVar("_lazy_netcdf", default=None)
+# State of the `!include`s of the current top-level `load_yaml` call (see `_new_include_state`)
+_include_state: ContextVar[dict | None] = ContextVar("_include_state", default=None)
 
 
 def _fmt(v: Any) -> dict | list | str | float | int:
@@ -20,7 +43,8 @@ def _fmt(v: Any) -> dict | list | str | float | int:
             values within the dictionary.
     """
     if isinstance(v, dict):
-        return {k: _fmt(v) for k, v in v.items() if _fmt(v) != {}}
+        formatted = ((k, _fmt(v)) for k, v in v.items())
+        return {k: v for k, v in formatted if not (isinstance(v, dict) and not v)}
     elif isinstance(v, tuple):
         return list(v)
     else:
@@ -43,12 +67,215 @@ def _ds2yml(ds: xr.Dataset) -> dict:
     )
 
 
+def _ds2lazy(ds: xr.Dataset) -> dict:
+    """
+    Same layout as `_ds2yml` but without reading the data. Coordinates and the data of the
+    data variables are returned as `xr.DataArray`s which are only read when accessed (e.g. with
+    `np.asarray` or by the validator).
+
+    Args:
+        ds (xr.Dataset): Lazily opened NetCDF data
+    """
+    out = {k: ds[k] for k in ds.coords}
+    for k, v in ds.data_vars.items():
+        out[k] = {"dims": list(v.dims), "attrs": dict(v.attrs), "data": v}
+        if not v.attrs:
+            del out[k]["attrs"]
+    return out
+
+
+# Layout of the awesIO documents in NetCDF files (see `write_netcdf`):
+#   "keys": order of the top-level keys in the document
+#   "variables": variable name -> (path in the document, dimensions)
+#   "records": (key of the list of records, record dimension, record field stored as coordinate)
+#   "record_dims": record field -> dimensions of the field (besides the record dimension)
+_NETCDF_LAYOUTS = {
+    "wind_resource_schema": {
+        "keys": [
+            "metadata", "altitudes", "wind_speed_bins", "wind_direction_bins", "clusters", "probability_matrix",
+        ],
+        "variables": {
+            "altitude": (("altitudes",), ("altitude",)),
+            "wind_speed_bin_edge": (("wind_speed_bins", "bin_edges_m_s"), ("wind_speed_bin_edge",)),
+            "wind_speed_bin": (("wind_speed_bins", "bin_centers_m_s"), ("wind_speed_bin",)),
+            "direction_bin_edge": (("wind_direction_bins", "bin_edges_deg"), ("direction_bin_edge",)),
+            "direction_bin": (("wind_direction_bins", "bin_centers_deg"), ("direction_bin",)),
+            "probability_matrix": (
+                ("probability_matrix", "data"),
+                ("cluster", "wind_speed_bin", "direction_bin"),
+            ),
+        },
+        "records": ("clusters", "cluster", "id"),
+        "record_dims": {
+            "u_normalized": ("altitude",),
+            "v_normalized": ("altitude",),
+            "wind_speed_distribution": ("wind_speed_bin",),
+            "wind_direction_distribution": ("direction_bin",),
+        },
+    },
+    "power_curves_schema": {
+        "keys": ["metadata", "altitudes_m", "reference_wind_speeds_m_s", "power_curves"],
+        "variables": {
+            "altitude": (("altitudes_m",), ("altitude",)),
+            "wind_speed": (("reference_wind_speeds_m_s",), ("wind_speed",)),
+        },
+        "records": ("power_curves", "profile", "profile_id"),
+        "record_dims": {
+            "u_normalized": ("altitude",),
+            "v_normalized": ("altitude",),
+            **{
+                name: ("wind_speed",)
+                for name in [
+                    "cycle_power_w", "reel_out_power_w", "reel_in_power_w",
+                    "reel_out_time_s", "reel_in_time_s", "cycle_time_s",
+                ]
+            },
+        },
+    },
+}
+# Dataset attribute listing the metadata attributes stored as JSON strings
+_JSON_ATTRIBUTES = "awesio_json_attributes"
+# Metadata entries giving the size of a dimension of the layouts above, used by
+# `load_yaml(..., stream=True)` to allocate the arrays before reading their values
+_METADATA_SIZES = {
+    "cluster": "n_clusters",
+    "wind_speed_bin": "n_wind_speed_bins",
+    "direction_bin": "n_wind_direction_bins",
+}
+
+
+def _get_netcdf_layout(schema: str) -> dict:
+    """Returns the NetCDF layout for the ``metadata.schema`` value ``schema``."""
+    schema_type = schema.replace(".yml", "").replace(".yaml", "")
+    if schema_type not in _NETCDF_LAYOUTS:
+        raise ValueError(
+            f"Schema '{schema}' can not be stored in NetCDF. Supported schemas: {list(_NETCDF_LAYOUTS)}"
+        )
+    return _NETCDF_LAYOUTS[schema_type]
+
+
+def _doc2ds(instance: dict) -> xr.Dataset:
+    """
+    Converts a wind resource or power curves document into a xr.Dataset with named dimensions.
+
+    Args:
+        instance (dict): Document matching the wind resource or power curves schema.
+    """
+    metadata = instance["metadata"]
+    layout = _get_netcdf_layout(metadata["schema"])
+    records_key, record_dim, record_coord = layout["records"]
+
+    # Metadata as attributes. Values which NetCDF can not store (dicts, lists, booleans, ...) as JSON
+    attrs, json_attrs = {}, []
+    for key, value in metadata.items():
+        if isinstance(value, (str, int, float)) and not isinstance(value, bool):
+            attrs[key] = value
+        else:
+            attrs[key] = json.dumps(value)
+            json_attrs.append(key)
+    attrs[_JSON_ATTRIBUTES] = " ".join(json_attrs)
+
+    data_vars = {}
+    for key, value in instance.items():
+        if key == "metadata":
+            continue
+        elif key == records_key:
+            fields = list(dict.fromkeys(field for record in value for field in record))
+            for field in fields:
+                if not all(field in record for record in value):
+                    raise ValueError(f"'{field}' has to be given for all or none of the {records_key}")
+                try:
+                    array = np.asarray([record[field] for record in value])
+                except ValueError as e:
+                    raise ValueError(f"'{field}' of the {records_key} must have the same length") from e
+                name = record_dim if field == record_coord else field
+                dims = (record_dim, *layout["record_dims"].get(field, ()))
+                data_vars[name] = (dims, array)
+        else:
+            variables = {
+                name: (path, dims) for name, (path, dims) in layout["variables"].items() if path[0] == key
+            }
+            if not variables:
+                raise ValueError(f"'{key}' can not be stored in NetCDF for schema '{metadata['schema']}'")
+            leaf_keys = [path[1] for path, _ in variables.values() if len(path) > 1]
+            # Scalars next to the arrays (e.g. probability_matrix.description) as variable attributes
+            var_attrs = {k: v for k, v in value.items() if k not in leaf_keys} if leaf_keys else {}
+            for name, (path, dims) in variables.items():
+                if len(path) > 1 and path[1] not in value:
+                    continue
+                array = value[path[1]] if len(path) > 1 else value
+                data_vars[name] = (dims, np.asarray(array), var_attrs)
+                var_attrs = {}
+    return xr.Dataset(data_vars, attrs=attrs)
+
+
+def _ds2doc(ds: xr.Dataset, mode: str = "list") -> dict:
+    """
+    Converts a xr.Dataset written by `write_netcdf` back into the document layout.
+
+    Args:
+        ds (xr.Dataset): Dataset with awesIO metadata attributes.
+        mode (str, optional): Type of the arrays in the document. Either "list" (nested lists as
+            from YAML), "numpy" (NumPy arrays) or "lazy" (`xr.DataArray`s read on access).
+            Defaults to "list".
+    """
+    json_attrs = ds.attrs.get(_JSON_ATTRIBUTES, "").split()
+    metadata = {}
+    for key, value in ds.attrs.items():
+        if key != _JSON_ATTRIBUTES:
+            metadata[key] = json.loads(value) if key in json_attrs else _item(value)
+    layout = _get_netcdf_layout(metadata["schema"])
+    records_key, record_dim, record_coord = layout["records"]
+    paths = {name: path for name, (path, _) in layout["variables"].items()}
+
+    def convert(data_array):
+        if mode == "lazy":
+            return data_array
+        return data_array.values if mode == "numpy" else data_array.values.tolist()
+
+    out = {"metadata": metadata}
+    names = [name for name in paths if name in ds.variables]
+    names += sorted(
+        (name for name in ds.variables if name not in paths), key=lambda name: name != record_dim
+    )
+    for name in names:
+        data_array = ds[name]
+        if name in paths:
+            path = paths[name]
+            if len(path) == 1:
+                out[path[0]] = convert(data_array)
+            else:
+                parent = out.setdefault(path[0], {})
+                parent.update({k: _item(v) for k, v in data_array.attrs.items()})
+                parent[path[1]] = convert(data_array)
+        else:
+            # Field of the records (e.g. clusters or power curves)
+            records = out.setdefault(records_key, [{} for _ in range(ds.sizes[record_dim])])
+            field = record_coord if name == record_dim else name
+            if data_array.ndim == 1 or mode == "list":
+                values = data_array.values.tolist()
+            elif mode == "numpy":
+                values = data_array.values
+            else:
+                values = [data_array[i] for i in range(len(records))]
+            for record, value in zip(records, values):
+                record[field] = value
+    return {key: out[key] for key in layout["keys"] if key in out}
+
+
+def _item(value: Any) -> Any:
+    """Converts NumPy scalars (e.g. from NetCDF attributes) to built-in types."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
 def _get_YAML(
     typ: str = "safe",
     write_numpy: bool = True,
     read_numpy: bool = False,
     read_include: bool = True,
     n_list_flow_style: int = 1,
+    fast: bool = False,
+    read_tables: bool = False,
 ) -> YAML:
     """Get `ruamel.yaml.YAML` instance default setting for AWESIO
 
@@ -58,13 +285,19 @@ def _get_YAML(
         read_numpy (bool, optional): Flag for reading numpy list of numeric values to be converted to numpy arrays. Defaults to False.
         read_include (bool, optional): Flag for enabling the `!include` constructor which enables reading others files just as embedded data. Defaults to True.
         n_list_flow_style (int, optional): Integer which states which shape of lists of numeric data that should be written with flow-style (e.g. `x: [1, 2, ...]`). Defaults to 1.
+        fast (bool, optional): Flag for using the libyaml based C parser (`ruamel.yaml.clib`) instead of the pure-python parser. Falls back to the pure-python parser if the C extension is not installed. Defaults to False.
+        read_tables (bool, optional): Flag for reading the ``data`` of ``headers``/``data`` tables as structured NumPy arrays (see `awesio.tables.to_table`). Defaults to False.
 
     Returns:
         ruamel.yaml.YAML: Instance with defaults as described above.
     """
-    yaml_obj = YAML(
-        typ=typ, pure=True
-    )  # kenloen TODO: Can only make it work with the pure-python version (`pure=True`) as I can not figure out how to extract the file name for the file being
+    yaml_obj = YAML(typ=typ, pure=not fast)
+    # Register the constructors and representers below on subclasses, as registering them on
+    # ruamel's classes would change every other `YAML` instance as well (e.g. `read_numpy`)
+    yaml_obj.Constructor = type("Constructor", (yaml_obj.Constructor,), {})
+    yaml_obj.Representer = type("Representer", (yaml_obj.Representer,), {})
+    # Options affecting the loaded data, used to key the on-disk cache
+    yaml_obj._awesio_read_options = (typ, read_numpy, read_include, read_tables)
     yaml_obj.default_flow_style = False
     yaml_obj.width = 1e6
     yaml_obj.allow_unicode = False
@@ -89,8 +322,13 @@ def _get_YAML(
         )
 
     yaml_obj.Representer.add_representer(list, list_rep)
+    # Placeholders of the numeric rows written by `write_yaml(..., fast=True)`
+    yaml_obj.Representer.add_representer(
+        _FlowRow,
+        lambda dumper, data: dumper.represent_sequence("tag:yaml.org,2002:seq", data, flow_style=True),
+    )
 
-    if write_numpy:
+    if write_numpy and np.loaded:  # Without NumPy imported there can not be NumPy data to write
         # Convert numpy types to build in data types
         yaml_obj.Representer.add_multi_representer(
             np.str_, lambda dumper, data: dumper.represent_str(str(data))
@@ -103,9 +341,9 @@ def _get_YAML(
             np.integer, lambda dumper, data: dumper.represent_int(int(data))
         )
 
-        # Convert numpy array to list
+        # Convert numpy array to list (structured arrays of tables to a list of rows)
         def ndarray_rep(dumper, data):
-            return list_rep(dumper, data.tolist())
+            return list_rep(dumper, table_rows(data) if data.dtype.names is not None else data.tolist())
 
         yaml_obj.Representer.add_representer(np.ndarray, ndarray_rep)
 
@@ -127,26 +365,330 @@ def _get_YAML(
 
     yaml_obj.Constructor.add_constructor("tag:yaml.org,2002:python/tuple", tuple_constructor)
 
+    if read_tables:
+
+        def table_constructor(constructor, node):
+            data = constructor.yaml_base_dict_type()
+            yield data
+            data.update(constructor.construct_mapping(node))
+            if is_table(data):
+                try:
+                    data["data"] = to_table(data["headers"], data["data"])
+                except ValueError:
+                    pass  # Rows of the wrong width are left as lists and reported by the validation
+
+        yaml_obj.Constructor.add_constructor("tag:yaml.org,2002:map", table_constructor)
+
     if read_include:
 
         def include(constructor, node):
-            filename = Path(constructor.loader.reader.stream.name).parent / node.value
+            parent = _include_dir.get()
+            if parent is None:
+                # Loaded without `load_yaml` (e.g. `yaml_obj.load(...)`), only possible with the pure-python reader
+                parent = Path(constructor.loader.reader.stream.name).parent
+            filename = (parent / node.value).resolve()
             ext = os.path.splitext(filename)[1].lower()
+            included_files = _included_files.get()
+            if included_files is not None:
+                included_files.append(filename)
+
+            # Each file is parsed once per top-level load, later includes get a copy. Lazily
+            # loaded NetCDF data is shared instead, as copying it would read the data.
+            state = _include_state.get()
+            if state is None:  # Loaded without `load_yaml`
+                state = _new_include_state()
+            if filename in state["stack"]:
+                chain = " -> ".join(str(path) for path in [*state["stack"], filename] if path is not None)
+                raise ValueError(f"Include cycle detected: {chain}")
+            if filename not in state["documents"]:
+                state["documents"][filename] = _include_file(filename, ext, state)
+            elif _lazy_netcdf.get() is None:
+                return copy.deepcopy(state["documents"][filename])
+            return state["documents"][filename]
+
+        def _include_file(filename, ext, state):
             if ext in [".yaml", ".yml"]:
-                return load_yaml(
-                    filename, _get_YAML()
-                )  # TODO: Make `get_YAML()` dynamic to make it possible to update
+                # Nested loads share the configuration of this loader. A `YAML` instance can not
+                # load re-entrantly, so one copy of it is used per include depth.
+                depth = len(state["stack"])
+                if depth not in state["loaders"]:
+                    state["loaders"][depth] = _copy_YAML(yaml_obj)
+                return load_yaml(filename, state["loaders"][depth])
             elif ext in [".nc"]:
-                return _ds2yml(xr.open_dataset(filename))
+                # Files written by `write_netcdf` are included as documents, others as plain datasets
+                lazy_netcdf = _lazy_netcdf.get()
+                if lazy_netcdf is None:
+                    with xr.open_dataset(filename) as ds:
+                        if _JSON_ATTRIBUTES in ds.attrs:
+                            return _ds2doc(ds, "numpy" if read_numpy else "list")
+                        return _ds2yml(ds)
+                stack, chunks = lazy_netcdf
+                # `cache=False` so that data accessed once is not kept in memory
+                ds = stack.enter_context(xr.open_dataset(filename, chunks=chunks, cache=False))
+                if _JSON_ATTRIBUTES in ds.attrs:
+                    return _ds2doc(ds, "lazy")
+                return _ds2lazy(ds)
             else:
                 raise ValueError(f"Unsupported file extension: {ext}")
 
-        yaml_obj.constructor.add_constructor("!include", include)
+        yaml_obj.Constructor.add_constructor("!include", include)
 
     return yaml_obj
 
 
-def load_yaml(filename: str | Path | os.PathLike, loader=None) -> dict:
+def _copy_YAML(yaml_obj: YAML) -> YAML:
+    """Returns a new `YAML` instance with the constructors, representers and settings of ``yaml_obj`` (from ``_get_YAML``)."""
+    yaml_copy = YAML(typ=yaml_obj.typ, pure=yaml_obj.pure)
+    yaml_copy.Constructor = yaml_obj.Constructor
+    yaml_copy.Representer = yaml_obj.Representer
+    yaml_copy._awesio_read_options = yaml_obj._awesio_read_options
+    return yaml_copy
+
+
+def _new_include_state() -> dict:
+    """
+    Returns the state shared by all `!include`s of a top-level load:
+    the files currently being loaded ("stack"), the parsed documents ("documents") and the
+    loaders per include depth ("loaders").
+    """
+    return {"stack": [], "documents": {}, "loaders": {}}
+
+
+# Plain scalars resolved to an int (no fraction or exponent) or a float by the YAML 1.2 resolver
+_DECIMAL = re.compile(r"[-+]?[0-9]+(\.[0-9]*)?([eE][-+]?[0-9]+)?").fullmatch
+# Largest integer stored exactly in the float64 arrays filled by `_stream_array`
+_MAX_EXACT_INT = 2**53
+_NO_KEY = object()
+
+
+class _NotStreamable(Exception):
+    """Raised by `_stream_load` for YAML it does not handle, which is then loaded by the regular loader."""
+
+
+def _stream_shape(document: Any, path: list) -> tuple | None:
+    """
+    Returns the shape of the array at ``path`` of the document being loaded if it is a variable of
+    the NetCDF layout of its schema and the size of each dimension is known by now, from the
+    metadata (see `_METADATA_SIZES`) or the arrays and records read before it.
+    """
+    metadata = document.get("metadata") if isinstance(document, dict) else None
+    schema = metadata.get("schema") if isinstance(metadata, dict) else None
+    if not isinstance(schema, str):
+        return None
+    layout = _NETCDF_LAYOUTS.get(schema.replace(".yml", "").replace(".yaml", ""))
+    if layout is None:
+        return None
+    path = tuple(path)
+    dims = next((dims for var_path, dims in layout["variables"].values() if var_path == path), None)
+    records_key, record_dim, _ = layout["records"]
+    if dims is None and len(path) == 3 and path[0] == records_key and isinstance(path[1], int):
+        dims = layout["record_dims"].get(path[2])
+    if dims is None:
+        return None
+
+    shape = []
+    for dim in dims:
+        size = metadata.get(_METADATA_SIZES.get(dim))
+        if type(size) is not int:
+            if dim == record_dim:
+                values = document.get(records_key)
+            else:
+                var_path, var_dims = layout["variables"].get(dim, ((), ()))
+                values = document
+                for key in var_path if var_dims == (dim,) else [None]:
+                    values = values.get(key) if isinstance(values, dict) else None
+            size = len(values) if isinstance(values, (list, np.ndarray)) else None
+        if not size or size < 0:  # Unknown, or empty arrays which are read as 1D
+            return None
+        shape.append(size)
+    return tuple(shape)
+
+
+def _stream_array(events, shape: tuple) -> np.ndarray:
+    """
+    Reads the numbers of a nested sequence of ``shape`` from the parser ``events`` (after its
+    `SequenceStartEvent`) into a preallocated array, one row at a time.
+
+    Returns:
+        np.ndarray: float64 array, or int64 if all the numbers are integers (as `np.asarray`).
+
+    Raises:
+        _NotStreamable: If the sequence has another shape or a value is not a plain number.
+    """
+    array = np.empty(shape)
+    flat = array.reshape(-1)
+    ndim = len(shape)
+    row_length = shape[-1]
+    counts = [0] * ndim  # Sequences read at each depth of the current item
+    depth = 1
+    offset = 0
+    row = []
+    integers = True
+    for event in events:
+        kind = type(event)
+        if kind is ScalarEvent:
+            value = event.value
+            match = _DECIMAL(value)
+            if match is None or depth != ndim or event.style or event.ctag is not None or event.anchor is not None:
+                raise _NotStreamable
+            if match.lastindex is None:
+                number = int(value)
+                if not -_MAX_EXACT_INT <= number <= _MAX_EXACT_INT:
+                    raise _NotStreamable
+                row.append(number)
+            else:
+                row.append(float(value))
+                integers = False
+        elif kind is SequenceStartEvent:
+            if depth == ndim or counts[depth - 1] == shape[depth - 1] or event.ctag is not None or event.anchor is not None:
+                raise _NotStreamable
+            counts[depth - 1] += 1
+            depth += 1
+            counts[depth - 1] = 0
+        elif kind is SequenceEndEvent:
+            if depth == ndim:
+                if len(row) != row_length:
+                    raise _NotStreamable
+                flat[offset:offset + row_length] = row
+                offset += row_length
+                row = []
+            elif counts[depth - 1] != shape[depth - 1]:
+                raise _NotStreamable
+            depth -= 1
+            if depth == 0:
+                return array.astype(np.int64) if integers else array
+        else:
+            raise _NotStreamable
+    raise _NotStreamable
+
+
+def _stream_scalar(event: ScalarEvent, constructor, resolver, plain: dict) -> Any:
+    """Constructs the value of a scalar event like the loader, plain numbers directly."""
+    value = event.value
+    if event.anchor is not None:
+        raise _NotStreamable
+    if event.ctag is None and not event.style:
+        match = _DECIMAL(value)
+        if match is not None:
+            return float(value) if match.lastindex else int(value)
+        if value in plain:
+            return plain[value]
+        tag = resolver.resolve(ScalarNode, value, (True, False))
+    elif event.ctag is None or str(event.ctag) == "!":
+        tag = resolver.resolve(ScalarNode, value, event.implicit)
+    else:
+        tag = event.ctag
+    if str(tag) == "tag:yaml.org,2002:merge":
+        raise _NotStreamable
+    node = ScalarNode(tag, value, event.start_mark, event.end_mark, style=event.style)
+    result = constructor.construct_object(node, deep=True)
+    constructor.constructed_objects.pop(node, None)
+    if event.ctag is None and not event.style and type(result) in (str, bool, type(None)):
+        plain[value] = result  # Keys and other repeated plain scalars are resolved once
+    return result
+
+
+def _stream_load(loader: YAML, stream) -> Any:
+    """
+    Loads a single YAML document from the parser events of ``stream`` (a binary file), giving the
+    same result as ``loader.load`` with ``read_numpy``.
+
+    The arrays of the NetCDF layout of the document's schema (e.g. ``probability_matrix.data``)
+    are read into preallocated arrays (see `_stream_shape` and `_stream_array`) without building
+    the nested lists of Python floats first. Other sequences are read as by `numpy_constructor`.
+
+    Raises:
+        _NotStreamable: For YAML features the event reader does not handle (anchors and aliases,
+            merge keys, tags on collections, complex or duplicate keys, other YAML versions,
+            several documents) or arrays not matching their layout.
+    """
+    constructor = loader.constructor
+    resolver = loader.resolver
+    read_tables = loader._awesio_read_options[3]
+    plain = {}
+    stack = []  # [container, key of the next value] of the open mappings and sequences
+    path = []  # Keys of the open collections below the root
+    root = None
+    documents = 0
+    events = loader.parse(stream)
+    try:
+        for event in events:
+            kind = type(event)
+            if kind is ScalarEvent:
+                value = _stream_scalar(event, constructor, resolver, plain)
+            elif kind is SequenceStartEvent or kind is MappingStartEvent:
+                if event.anchor is not None or event.ctag is not None:
+                    raise _NotStreamable
+                if stack:
+                    container, key = stack[-1]
+                    if key is _NO_KEY:
+                        raise _NotStreamable  # Complex key
+                    path.append(len(container) if type(container) is list else key)
+                if kind is MappingStartEvent:
+                    stack.append([{}, _NO_KEY])
+                    continue
+                shape = _stream_shape(stack[0][0], path) if stack else None
+                if shape is None:
+                    stack.append([[], None])
+                    continue
+                value = _stream_array(events, shape)
+                if path:
+                    path.pop()
+            elif kind is SequenceEndEvent or kind is MappingEndEvent:
+                value = stack.pop()[0]
+                if path:
+                    path.pop()
+                if kind is SequenceEndEvent:
+                    try:
+                        array = np.asarray(value)
+                        if np.issubdtype(array.dtype, np.number):
+                            value = array
+                    except ValueError:
+                        pass
+                elif read_tables and is_table(value):
+                    try:
+                        value["data"] = to_table(value["headers"], value["data"])
+                    except ValueError:
+                        pass
+            elif kind is DocumentStartEvent:
+                documents += 1
+                if documents > 1 or event.version not in (None, (1, 2)):
+                    raise _NotStreamable
+                continue
+            elif kind is AliasEvent:
+                raise _NotStreamable
+            else:
+                continue
+
+            if not stack:
+                root = value
+                continue
+            top = stack[-1]
+            container, key = top
+            if type(container) is list:
+                container.append(value)
+            elif key is _NO_KEY:
+                if value in container:
+                    raise _NotStreamable  # Duplicate key, reported by the regular loader
+                top[1] = value
+            else:
+                container[key] = value
+                top[1] = _NO_KEY
+    except TypeError as error:  # Unhashable key
+        raise _NotStreamable from error
+    finally:
+        events.close()
+    return root
+
+
+def load_yaml(
+    filename: str | Path | os.PathLike,
+    loader=None,
+    fast: bool = False,
+    cache: bool | str | Path = False,
+    tables: bool = False,
+    stream: bool = False,
+) -> dict:
     """
     Opens ``filename`` and loads the content into a dictionary with the ``_get_YAML``
     function from ruamel.yaml.YAML.
@@ -154,25 +696,133 @@ def load_yaml(filename: str | Path | os.PathLike, loader=None) -> dict:
     Args:
         filename (str | Path | os.PathLike): Path or file-handle to the local file to be loaded or string path to the file.
         loader (ruamel.yaml.YAML, optional): Defaults to SafeLoader.
+        fast (bool, optional): Use the libyaml based C parser when no ``loader`` is given. Defaults to False.
+        cache (bool | str | Path, optional): Flag for using the on-disk cache of parsed documents
+            (``awesio.cache.CACHE_DIR``), or the cache directory to use. Entries are reused as long as
+            the file and all the files it includes are unchanged. Only used when ``filename`` is a path
+            and ``loader`` is created by ``_get_YAML``. Defaults to False.
+        tables (bool, optional): Read the ``data`` of ``headers``/``data`` tables as structured NumPy
+            arrays (see `awesio.tables`) when no ``loader`` is given. Defaults to False.
+        stream (bool, optional): Read the numeric sequences as NumPy arrays (``read_numpy``) from
+            the parser events, with the large arrays of the wind resource and power curves layouts
+            (e.g. ``probability_matrix.data``) written straight into arrays allocated from the
+            metadata sizes (``n_clusters``, ``n_wind_speed_bins``, ...) instead of building nested
+            lists first. Files the event reader does not handle (e.g. with anchors) are loaded
+            by the regular loader. ``loader`` must be created with ``_get_YAML(read_numpy=True)``.
+            Defaults to False.
 
     Returns:
         dict: Dictionary representation of the YAML file given in ``filename``.
+
+    Raises:
+        ValueError: If ``stream`` is set and ``loader`` does not read NumPy arrays.
     """
     if loader is None:
-        loader = _get_YAML()
+        loader = _get_YAML(fast=fast, read_tables=tables, read_numpy=stream)
+    if stream and not getattr(loader, "_awesio_read_options", (None, False))[1]:
+        raise ValueError("stream=True requires a loader created with `_get_YAML(read_numpy=True)`.")
 
     if isinstance(filename, str):
         filename = Path(filename)
 
-    return loader.load(filename)
+    options = getattr(loader, "_awesio_read_options", None)
+    if cache is not False and isinstance(filename, Path) and options is not None:
+        cache_dir = _cache.CACHE_DIR if cache is True else Path(cache)
+        filename = filename.resolve()
+        try:
+            return _cache.get_cached(filename, options, cache_dir)
+        except KeyError:
+            pass
+        included_files = []
+        token = _included_files.set(included_files)
+        try:
+            data = load_yaml(filename, loader, stream=stream)
+        finally:
+            _included_files.reset(token)
+        _cache.set_cached(filename, options, cache_dir, data, included_files)
+        return data
+
+    name = filename if isinstance(filename, Path) else getattr(filename, "name", None)
+    state = _include_state.get()
+    state_token = _include_state.set(_new_include_state()) if state is None else None
+    state = _include_state.get()
+    state["stack"].append(Path(name).resolve() if name is not None else None)
+    token = _include_dir.set(Path(name).parent if name is not None else None)
+    try:
+        if stream:
+            return _stream_load_file(loader, filename)
+        return loader.load(filename)
+    finally:
+        _include_dir.reset(token)
+        state["stack"].pop()
+        if state_token is not None:
+            _include_state.reset(state_token)
+
+
+def _stream_load_file(loader: YAML, filename: Path | Any) -> Any:
+    """Loads ``filename`` (path or binary file) with `_stream_load`, else with ``loader.load``."""
+    if isinstance(filename, Path):
+        with filename.open("rb") as stream:
+            try:
+                return _stream_load(loader, stream)
+            except _NotStreamable:
+                pass
+        return loader.load(filename)
+    start = filename.tell()
+    try:
+        return _stream_load(loader, filename)
+    except _NotStreamable:
+        filename.seek(start)
+        return loader.load(filename)
+
+
+@contextmanager
+def open_yaml(
+    filename: str | Path | os.PathLike,
+    loader=None,
+    fast: bool = False,
+    chunks: int | dict | str | None = None,
+):
+    """
+    Context manager which loads ``filename`` like ``load_yaml``, but with NetCDF files pulled in
+    with `!include` opened lazily instead of converted to nested lists.
+
+    The data of the NetCDF variables is returned as `xr.DataArray`s which are only read when they
+    are accessed (or validated). The datasets stay open until the context exits.
+
+    Example:
+        >>> with open_yaml("wind_resource.yml", chunks="auto") as data:
+        ...     validate(data)
+
+    Args:
+        filename (str | Path | os.PathLike): Path or file-handle to the local file to be loaded or string path to the file.
+        loader (ruamel.yaml.YAML, optional): Defaults to SafeLoader.
+        fast (bool, optional): Use the libyaml based C parser when no ``loader`` is given. Defaults to False.
+        chunks (int | dict | str, optional): Chunks passed to `xr.open_dataset` to read the data as
+            dask arrays (requires dask). Defaults to None which lazily reads NumPy arrays on access.
+
+    Yields:
+        dict: Dictionary representation of the YAML file given in ``filename``.
+    """
+    with ExitStack() as stack:
+        token = _lazy_netcdf.set((stack, chunks))
+        try:
+            data = load_yaml(filename, loader, fast=fast)
+        finally:
+            _lazy_netcdf.reset(token)
+        yield data
+
 
-def write_yaml(instance : dict, foutput : str) -> None:
+def write_yaml(instance : dict, foutput : str, fast : bool = False) -> None:
     """
     Writes a dictionary to a YAML file using the ruamel.yaml library.
 
     Args:
         instance (dict): Dictionary to be written to the YAML file.
         foutput (str): Path to the output YAML file.
+        fast (bool, optional): Flag for writing the numeric arrays (lists and NumPy arrays written
+            with flow-style) directly instead of element by element through ruamel.yaml. The output
+            is byte-identical. Defaults to False.
 
     Returns:
         None
@@ -180,4 +830,186 @@ def write_yaml(instance : dict, foutput : str) -> None:
     # Write yaml with updated values
     yaml = _get_YAML()
     with open(foutput, "w", encoding="utf-8") as f:
+        if fast:
+            rows = {}
+            try:
+                skeleton = _flow_skeleton(instance, rows, f"_awesio_{uuid.uuid4().hex}_", set())
+            except _SharedObject:
+                pass
+            else:
+                yaml.dump(skeleton, _FlowRowStream(f, rows))
+                return
         yaml.dump(instance, f)
+
+
+# Longer rows are not written directly as ruamel.yaml would wrap them at the line width
+_MAX_FLOW_ROW_LENGTH = 30000
+
+
+def _is_flow_row(data) -> bool:
+    """Returns True if ``data`` is a list or 1D NumPy array of numbers which `write_yaml` writes as a flow sequence."""
+    if type(data) is list:
+        # Integers outside of the int64 range make an object array, which `list_rep` writes with block-style
+        types = set(map(type, data))
+        return (
+            len(data) <= _MAX_FLOW_ROW_LENGTH and types <= {int, float}
+            and (int not in types or all(-2**63 <= value < 2**63 for value in data if type(value) is int))
+        )
+    return (
+        np.loaded and isinstance(data, np.ndarray) and data.ndim == 1 and data.dtype.kind in "iuf"
+        and len(data) <= _MAX_FLOW_ROW_LENGTH
+    )
+
+
+class _FlowRow(list):
+    """Flow sequence holding the placeholder of a numeric row (see `_flow_skeleton`)."""
+
+
+class _SharedObject(Exception):
+    """Raised by `_flow_skeleton` for objects which occur more than once (written with anchors and aliases)."""
+
+
+def _flow_skeleton(data, rows: dict, prefix: str, seen: set):
+    """
+    Returns a copy of ``data`` where the numeric rows written with flow-style are replaced by a flow
+    sequence with a placeholder string as only item.
+
+    The rows are stored in ``rows`` by placeholder, ruamel.yaml then only emits the document structure
+    and `_FlowRowStream` writes the formatted rows in place of the placeholders.
+
+    Raises:
+        _SharedObject: If a list, dict or array occurs more than once in ``data``, as ruamel.yaml
+            writes those with anchors and aliases.
+    """
+    is_array = np.loaded and isinstance(data, np.ndarray)
+    if type(data) in (list, dict) or is_array:
+        if id(data) in seen:
+            raise _SharedObject
+        seen.add(id(data))
+
+    if _is_flow_row(data):
+        placeholder = f"{prefix}{len(rows)}"
+        rows[placeholder] = data
+        return _FlowRow([placeholder])
+    elif type(data) is dict:
+        return {key: _flow_skeleton(value, rows, prefix, seen) for key, value in data.items()}
+    elif type(data) is list:
+        return [_flow_skeleton(value, rows, prefix, seen) for value in data]
+    elif is_array and data.ndim > 1 and data.dtype.kind in "iuf":
+        # Sub-arrays are views which are not part of ``data`` and can not be shared
+        return [_flow_skeleton(value, rows, prefix, set()) for value in data]
+    elif is_array and data.dtype.names is not None:  # Table (see `awesio.tables`)
+        return [_flow_skeleton(row, rows, prefix, set()) for row in table_rows(data)]
+    return data
+
+
+def _format_flow_row(data) -> str:
+    """Formats the items of a numeric row the same way as ruamel.yaml (floats round-trip exactly)."""
+    values = data.tolist() if not isinstance(data, list) else data
+    text = ", ".join(map(repr, values))
+    if "n" in text:  # nan or inf, written as .nan, .inf and -.inf
+        text = ", ".join(
+            repr(value) if value == value and abs(value) != float("inf")
+            else ".nan" if value != value else ".inf" if value > 0 else "-.inf"
+            for value in values
+        )
+    return text
+
+
+class _FlowRowStream:
+    """Text stream which writes the formatted numeric rows in place of their placeholders (see `_flow_skeleton`)."""
+
+    def __init__(self, stream, rows: dict):
+        self.stream = stream
+        self.rows = rows
+        self.encoding = stream.encoding  # ruamel.yaml writes bytes to streams without encoding
+
+    def write(self, data: str) -> None:
+        row = self.rows.pop(data, None)
+        self.stream.write(data if row is None else _format_flow_row(row))
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
+def write_netcdf(instance: dict, foutput: str | Path, complevel: int = 4) -> None:
+    """
+    Writes a wind resource or power curves document to a compressed NetCDF file.
+
+    Arrays are stored as variables with named dimensions (e.g. ``cluster``, ``altitude``,
+    ``wind_speed_bin`` and ``direction_bin`` for the wind resource, ``profile``, ``altitude`` and
+    ``wind_speed`` for power curves) and the metadata as attributes.
+
+    Args:
+        instance (dict): Document matching the wind resource or power curves schema.
+        foutput (str | Path): Path to the output NetCDF file.
+        complevel (int, optional): zlib compression level (0-9). Defaults to 4.
+
+    Raises:
+        ValueError: If the schema of the document is not supported, or the document contains
+            data which can not be stored with named dimensions (e.g. ragged arrays).
+
+    Returns:
+        None
+    """
+    ds = _doc2ds(instance)
+    encoding = {
+        name: {"zlib": complevel > 0, "complevel": complevel}
+        for name, var in ds.variables.items()
+        if var.dtype.kind in "iuf"
+    }
+    ds.to_netcdf(foutput, encoding=encoding)
+
+
+def load_netcdf(filename: str | Path, read_numpy: bool = False) -> dict:
+    """
+    Loads a NetCDF file written by ``write_netcdf`` into the same dictionary as loading the YAML version.
+
+    Args:
+        filename (str | Path): Path to the NetCDF file.
+        read_numpy (bool, optional): Flag for returning the arrays as NumPy arrays instead of lists. Defaults to False.
+
+    Returns:
+        dict: Dictionary representation of the document.
+    """
+    with xr.open_dataset(filename) as ds:
+        return _ds2doc(ds, "numpy" if read_numpy else "list")
+
+
+def load(filename: str | Path, **kwargs) -> dict:
+    """
+    Loads a YAML or NetCDF file, dispatching on the file extension (``.nc`` uses ``load_netcdf``).
+
+    Args:
+        filename (str | Path): Path to the file.
+        **kwargs: Passed on to ``load_yaml`` or ``load_netcdf``.
+
+    Returns:
+        dict: Dictionary representation of the file.
+    """
+    if _is_netcdf(filename):
+        return load_netcdf(filename, **kwargs)
+    return load_yaml(filename, **kwargs)
+
+
+def write(instance: dict, foutput: str | Path, **kwargs) -> None:
+    """
+    Writes a document to a YAML or NetCDF file, dispatching on the file extension (``.nc`` uses ``write_netcdf``).
+
+    Args:
+        instance (dict): Dictionary to be written.
+        foutput (str | Path): Path to the output file.
+        **kwargs: Passed on to ``write_yaml`` or ``write_netcdf``.
+
+    Returns:
+        None
+    """
+    if _is_netcdf(foutput):
+        write_netcdf(instance, foutput, **kwargs)
+    else:
+        write_yaml(instance, foutput, **kwargs)
+
+
+def _is_netcdf(filename: str | Path | os.PathLike) -> bool:
+    """Returns True if ``filename`` has the NetCDF extension."""
+    return os.path.splitext(str(filename))[1].lower() == ".nc"
@@ -0,0 +1,18 @@
+"""Shared helpers of the test suite (run with ``pixi run test``)."""
+from __future__ import annotations
+
+from pathlib import Path
+
+from awesio.yaml import load_yaml
+
+EXAMPLES_PATH = Path(__file__).parent.parent / "examples"
+
+
+def example_files() -> list[Path]:
+    """Returns the awesIO documents (files with ``metadata.schema``) in the examples folder."""
+    files = []
+    for path in sorted(EXAMPLES_PATH.glob("**/*.yml")):
+        data = load_yaml(path, fast=True)
+        if isinstance(data, dict) and "schema" in (data.get("metadata") or {}):
+            files.append(path)
+    return files
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import os
+from contextlib import closing
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from awesio.analysis import (
+    HOURS_PER_YEAR, PowerCurves, TerrainConstraints, WindResource, annual_energy_production, capacity_factor,
+    load_sites,
+)
+from awesio.generate import generate_wind_resource
+from awesio.yaml import load_yaml
+
+from conftest import EXAMPLES_PATH
+
+SHM_PATH = Path("/dev/shm")
+POWER_CURVES = EXAMPLES_PATH / "ground_gen" / "soft_kite_pumping_ground_gen_power_curves.yml"
+OPERATIONAL_CONSTRAINTS = EXAMPLES_PATH / "ground_gen" / "soft_kite_pumping_ground_gen_operational_constraints.yml"
+WIND_RESOURCES = [EXAMPLES_PATH / "wind_resource.yml", EXAMPLES_PATH / "clustered_profiles_wind_resource.yml"]
+
+
+@pytest.fixture(scope="module")
+def site_files(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("sites")
+    files = [directory / f"site_{seed}.yml" for seed in range(4)]
+    for seed, path in enumerate(files):
+        generate_wind_resource(path, n_clusters=3, n_wind_speed_bins=10, n_wind_direction_bins=8, seed=seed)
+    return files
+
+
+@pytest.fixture(scope="module")
+def design():
+    return PowerCurves.from_document(POWER_CURVES)
+
+
+@pytest.fixture(scope="module")
+def sites():
+    return [WindResource.from_document(path) for path in WIND_RESOURCES]
+
+
+def _reference_aep(design: PowerCurves, site: WindResource) -> float:
+    """Annual energy production summed bin by bin."""
+    energy = 0.0
+    for c, cluster_id in enumerate(site.cluster_ids):
+        row = list(design.profile_ids).index(cluster_id)
+        for b, wind_speed in enumerate(site.wind_speeds_m_s):
+            power = np.interp(wind_speed, design.wind_speeds_m_s, design.power_w[row], left=0.0, right=0.0)
+            energy += power * site.probability[c, b] * HOURS_PER_YEAR
+    return energy
+
+
+def test_annual_energy_production(design, sites):
+    aep = annual_energy_production(POWER_CURVES, WIND_RESOURCES[0])
+    assert aep == pytest.approx(_reference_aep(design, sites[0]), rel=1e-12)
+    assert aep == pytest.approx(38.818e6, rel=1e-4)
+    assert capacity_factor(design, sites[0]) == pytest.approx(0.0886, abs=1e-4)
+
+
+def test_annual_energy_production_of_groups(design, sites):
+    # Designs with two wind speed grids and sites with two cluster orders and bin grids
+    other_design = PowerCurves(
+        design.profile_ids[::-1], design.wind_speeds_m_s[::2], design.power_w[::-1, ::2] * 0.5,
+        nominal_power_w=design.nominal_power_w,
+    )
+    scaled_design = PowerCurves(design.profile_ids, design.wind_speeds_m_s, design.power_w * 2.0, nominal_power_w=1e5)
+    site = sites[0]
+    shifted_site = WindResource(site.cluster_ids[::-1], site.wind_speeds_m_s + 0.7, site.probability[::-1])
+    designs = [design, other_design, scaled_design]
+    all_sites = [*sites, shifted_site]
+
+    aep = annual_energy_production(designs, all_sites)
+    expected = np.array([[_reference_aep(d, s) for s in all_sites] for d in designs])
+    np.testing.assert_allclose(aep, expected, rtol=1e-12)
+    np.testing.assert_allclose(annual_energy_production(design, all_sites), expected[0], rtol=1e-12)
+    np.testing.assert_allclose(annual_energy_production(designs, site), expected[:, 0], rtol=1e-12)
+    nominal_power = np.array([d.nominal_power_w for d in designs])[:, None]
+    np.testing.assert_allclose(capacity_factor(designs, all_sites), expected / (nominal_power * HOURS_PER_YEAR), rtol=1e-12)
+
+
+def _reference_wind(site: WindResource, cluster_ids, altitudes, reference) -> tuple:
+    """Wind components interpolated point by point with `numpy.interp`."""
+    rows = [list(site.cluster_ids).index(cluster_id) for cluster_id in cluster_ids]
+    u = [np.interp(z, site.altitudes_m, site.u_normalized[row]) * r for row, z, r in zip(rows, altitudes, reference)]
+    v = [np.interp(z, site.altitudes_m, site.v_normalized[row]) * r for row, z, r in zip(rows, altitudes, reference)]
+    return np.array(u), np.array(v)
+
+
+@pytest.fixture(params=["uniform", "non_uniform"])
+def profiles(request):
+    rng = np.random.default_rng(1)
+    altitudes = np.linspace(10.0, 500.0, 50) if request.param == "uniform" else np.cumsum(rng.uniform(1.0, 30.0, 40))
+    n_clusters = 4
+    return WindResource(
+        cluster_ids=[3, 1, 4, 2], wind_speeds_m_s=[5.0], probability=np.full((n_clusters, 1), 1 / n_clusters),
+        altitudes_m=altitudes,
+        u_normalized=rng.uniform(0.5, 1.5, (n_clusters, len(altitudes))),
+        v_normalized=rng.uniform(-0.3, 0.3, (n_clusters, len(altitudes))),
+        u_ref_mean_m_s=[6.0, 7.0, 8.0, 9.0],
+    )
+
+
+def test_wind_components_at_altitudes_and_edges(profiles):
+    rng = np.random.default_rng(2)
+    grid = profiles.altitudes_m
+    # Random altitudes, the grid points (interval edges) and beyond the first and last altitude
+    altitudes = np.concatenate([rng.uniform(grid[0], grid[-1], 500), grid, [grid[0] - 50.0, 0.0, grid[-1] + 1e-9, 1e4]])
+    cluster_ids = rng.choice(profiles.cluster_ids, len(altitudes))
+    reference = rng.uniform(0.0, 25.0, len(altitudes))
+
+    u, v = profiles.wind_components(cluster_ids, altitudes, reference)
+    expected_u, expected_v = _reference_wind(profiles, cluster_ids, altitudes, reference)
+    np.testing.assert_allclose(u, expected_u, rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(v, expected_v, rtol=1e-12, atol=1e-12)
+
+    speed, direction = profiles.wind(cluster_ids, altitudes, reference)
+    np.testing.assert_allclose(speed, np.hypot(expected_u, expected_v), rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(direction, np.degrees(np.arctan2(expected_v, expected_u)), rtol=1e-12, atol=1e-9)
+
+
+def test_wind_components_broadcast(profiles):
+    altitudes = np.linspace(0.0, 2 * profiles.altitudes_m[-1], 7)
+    cluster_ids = profiles.cluster_ids[:, None]
+    u, v = profiles.wind_components(cluster_ids, altitudes)  # Mean reference wind speed of the clusters
+    assert u.shape == v.shape == (4, 7)
+    for row, cluster_id in enumerate(profiles.cluster_ids):
+        reference = np.full(len(altitudes), profiles.u_ref_mean_m_s[row])
+        expected_u, expected_v = _reference_wind(profiles, [cluster_id] * len(altitudes), altitudes, reference)
+        np.testing.assert_allclose(u[row], expected_u, rtol=1e-12)
+        np.testing.assert_allclose(v[row], expected_v, rtol=1e-12)
+    with pytest.raises(ValueError, match="No clusters for the ids \\[7\\]"):
+        profiles.wind_components([1, 7], 100.0, 10.0)
+
+
+@pytest.mark.parametrize("path", WIND_RESOURCES, ids=lambda path: path.name)
+def test_wind_of_examples(path):
+    site = WindResource.from_document(path)
+    altitudes = np.concatenate([site.altitudes_m, (site.altitudes_m[:-1] + site.altitudes_m[1:]) / 2, [1e4]])
+    for cluster_id in site.cluster_ids:
+        reference = np.full(len(altitudes), 10.0)
+        u, v = site.wind_components(cluster_id, altitudes, 10.0)
+        expected_u, expected_v = _reference_wind(site, [cluster_id] * len(altitudes), altitudes, reference)
+        np.testing.assert_allclose(u, expected_u, rtol=1e-12, atol=1e-12)
+        np.testing.assert_allclose(v, expected_v, rtol=1e-12, atol=1e-12)
+
+
+AZIMUTH_ZONES = [
+    # Wrapping around 0 deg, with a gap and overlapping restrictions
+    {
+        "azimuth_range_deg": [330, 30], "flight_allowed": True,
+        "distance_restrictions": [
+            {"distance_range_m": [0, 50], "min_height_agl_m": 20},
+            {"distance_range_m": [30, 120], "min_height_agl_m": 60},
+            {"distance_range_m": [200, 400], "min_height_agl_m": 150},
+        ],
+    },
+    {"azimuth_range_deg": [90, 135], "flight_allowed": False},
+    # Overlapping the previous zones
+    {
+        "azimuth_range_deg": [20, 100], "flight_allowed": True,
+        "distance_restrictions": [{"distance_range_m": [10, 250], "min_height_agl_m": 80}],
+    },
+]
+
+
+def _reference_min_height(azimuth_zones: list[dict], azimuth: float, distance: float) -> float:
+    """Minimum height at a point, checking every zone and restriction."""
+    azimuth %= 360
+    height = 0.0
+    for zone in azimuth_zones:
+        start, end = zone["azimuth_range_deg"]
+        start, end = start % 360, end % 360
+        if not (start <= azimuth < end if start < end else azimuth >= start or azimuth < end):
+            continue
+        if not zone["flight_allowed"]:
+            return np.inf
+        for restriction in zone.get("distance_restrictions", []):
+            distance_start, distance_end = restriction["distance_range_m"]
+            if distance_start <= distance < distance_end:
+                height = max(height, restriction["min_height_agl_m"])
+    return height
+
+
+@pytest.mark.parametrize("document", [False, True], ids=["zones", "example"])
+def test_min_allowed_height_matches_scalar_lookup(document):
+    if document:
+        constraints = TerrainConstraints.from_document(OPERATIONAL_CONSTRAINTS)
+        azimuth_zones = load_yaml(OPERATIONAL_CONSTRAINTS)["terrain_constraints"]["azimuth_zones"]
+    else:
+        azimuth_zones = AZIMUTH_ZONES
+        constraints = TerrainConstraints(azimuth_zones)
+    rng = np.random.default_rng(3)
+    edges = np.unique([
+        edge for zone in azimuth_zones for restriction in zone.get("distance_restrictions", [])
+        for edge in restriction["distance_range_m"]
+    ])
+    # Random points, and points on the azimuth and distance edges (also beyond the last one)
+    azimuths = np.concatenate([rng.uniform(-720.0, 720.0, 2000), np.repeat(constraints.azimuth_edges_deg, len(edges) + 1)])
+    distances = np.concatenate([rng.uniform(0.0, 600.0, 2000), np.tile([*edges, 1e6], len(constraints.azimuth_edges_deg))])
+
+    heights = constraints.min_allowed_height(azimuths, distances)
+    expected = [_reference_min_height(azimuth_zones, a, d) for a, d in zip(azimuths, distances)]
+    np.testing.assert_array_equal(heights, expected)
+
+
+def test_min_allowed_height_zones():
+    constraints = TerrainConstraints(AZIMUTH_ZONES)
+    # Beyond the last restriction and outside of every zone
+    np.testing.assert_array_equal(constraints.min_allowed_height([0.0, 25.0, 200.0], [400.0, 1e4, 100.0]), 0.0)
+    # No-fly zone at any distance
+    assert np.all(constraints.min_allowed_height(100.0, [0.0, 50.0, 1e6]) == np.inf)
+    # Overlapping restrictions: the highest minimum height applies
+    np.testing.assert_array_equal(constraints.min_allowed_height([0.0, 25.0], [40.0, 40.0]), [60.0, 80.0])
+    assert TerrainConstraints([]).min_allowed_height(10.0, 10.0) == 0.0
+
+
+def test_is_allowed():
+    constraints = TerrainConstraints.from_document(OPERATIONAL_CONSTRAINTS)
+    rng = np.random.default_rng(4)
+    polar = np.column_stack([rng.uniform(0.0, 360.0, 1000), rng.uniform(0.0, 600.0, 1000), rng.uniform(-10.0, 600.0, 1000)])
+    azimuth, distance, height = polar.T
+    expected = (height >= constraints.min_allowed_height(azimuth, distance)) & (height <= 500.0)
+    np.testing.assert_array_equal(constraints.is_allowed(polar, polar=True), expected)
+
+    # East, north, height, away from the azimuth edges where rounding could change the zone
+    away_from_edges = np.min(np.abs(azimuth[:, None] - constraints.azimuth_edges_deg), axis=1) > 1e-6
+    cartesian = np.column_stack([distance * np.sin(np.radians(azimuth)), distance * np.cos(np.radians(azimuth)), height])
+    np.testing.assert_array_equal(constraints.is_allowed(cartesian)[away_from_edges], expected[away_from_edges])
+    with pytest.raises(ValueError):
+        constraints.is_allowed(np.zeros((4, 2)))
+
+
+def _blocks() -> set:
+    return {path.name for path in SHM_PATH.iterdir() if path.name.startswith("psm_")}
+
+
+def test_load_sites_in_input_order(site_files):
+    sites = list(load_sites(site_files, workers=2))
+    assert [info["file"] for _, info in sites] == [str(path) for path in site_files]
+    assert all(isinstance(site, WindResource) and info["error"] is None for site, info in sites)
+
+
+@pytest.mark.skipif(os.name != "posix" or not SHM_PATH.is_dir(), reason="Needs POSIX shared memory in /dev/shm")
+@pytest.mark.parametrize("stop", ["close", "raise"])
+def test_load_sites_releases_unconsumed_blocks(site_files, stop):
+    before = _blocks()
+    if stop == "close":
+        sites = load_sites(site_files, workers=2)
+        next(sites)
+        sites.close()
+    else:
+        with pytest.raises(RuntimeError), closing(load_sites(site_files, workers=2)) as sites:
+            for _ in sites:
+                raise RuntimeError
+    assert _blocks() - before == set()
@@ -0,0 +1,99 @@
+import os
+
+import pytest
+
+import awesio.cache
+from awesio.yaml import _get_YAML, clear_cache, load_yaml
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def stores(monkeypatch):
+    """Records the files stored in the cache (i.e. parsed instead of read from the cache)."""
+    stored = []
+    set_cached = awesio.cache.set_cached
+    monkeypatch.setattr(
+        awesio.cache, "set_cached", lambda filename, *args, **kwargs: stored.append(filename.name) or set_cached(filename, *args, **kwargs)
+    )
+    return stored
+
+
+def _entries(cache_dir) -> set:
+    return set(cache_dir.glob("*.pkl"))
+
+
+def test_cache_hit(tmp_path, cache_dir, stores):
+    (tmp_path / "main.yml").write_text("values: [1.0, 2.0]\n")
+    first = load_yaml(tmp_path / "main.yml", cache=cache_dir)
+    second = load_yaml(tmp_path / "main.yml", cache=cache_dir)
+    assert first == second == {"values": [1.0, 2.0]}
+    assert stores == ["main.yml"]
+
+
+def test_cached_values_keep_their_types(tmp_path, cache_dir, stores):
+    (tmp_path / "main.yml").write_text(
+        "bool_int: [true, 2]\nbool_float: [false, 2.5]\nint_float: [1, 2.5]\nbools: [true, false]\n"
+        "ints: [[1, 2], [3, 4]]\nfloats: [0.5, 1.0]\nnested: [[true, 1], [0, 1]]\nlarge: [18446744073709551616, 1]\n"
+    )
+    uncached = load_yaml(tmp_path / "main.yml")
+    load_yaml(tmp_path / "main.yml", cache=cache_dir)
+    cached = load_yaml(tmp_path / "main.yml", cache=cache_dir)
+    assert stores == ["main.yml"]
+    assert cached == uncached
+    assert repr(cached) == repr(uncached)  # Same types, e.g. True is not 1
+
+
+def test_editing_included_file_invalidates_entry(tmp_path, cache_dir, stores):
+    (tmp_path / "main.yml").write_text("part: !include part.yml\n")
+    (tmp_path / "part.yml").write_text("value: 1\n")
+    assert load_yaml(tmp_path / "main.yml", cache=cache_dir) == {"part": {"value": 1}}
+    assert load_yaml(tmp_path / "main.yml", cache=cache_dir) == {"part": {"value": 1}}
+
+    (tmp_path / "part.yml").write_text("value: 2\n")
+    assert load_yaml(tmp_path / "main.yml", cache=cache_dir) == {"part": {"value": 2}}
+    assert stores == ["main.yml", "main.yml"]
+
+
+def test_eviction_respects_max_size(tmp_path, cache_dir, monkeypatch):
+    paths = []
+    for i in range(4):
+        paths.append(tmp_path / f"doc{i}.yml")
+        paths[-1].write_text(f"values: {list(range(100 * i, 100 * i + 100))}\n")
+    options = _get_YAML()._awesio_read_options
+    entries = [awesio.cache._entry_path(path.resolve(), options, cache_dir) for path in paths]
+
+    load_yaml(paths[0], cache=cache_dir)
+    entry_size = entries[0].stat().st_size
+    monkeypatch.setattr(awesio.cache, "CACHE_MAX_SIZE", 2 * entry_size + entry_size // 2)
+
+    for i, path in enumerate(paths):
+        load_yaml(path, cache=cache_dir)
+        # Explicit access times, as file timestamps may be too coarse to order the entries
+        os.utime(entries[i], ns=(i * 10**9, i * 10**9))
+
+    assert _entries(cache_dir) == set(entries[2:])
+    assert sum(entry.stat().st_size for entry in entries[2:]) <= awesio.cache.CACHE_MAX_SIZE
+
+
+def test_clear_cache_empties_directory(tmp_path, cache_dir):
+    for i in range(3):
+        (tmp_path / f"doc{i}.yml").write_text(f"value: {i}\n")
+        load_yaml(tmp_path / f"doc{i}.yml", cache=cache_dir)
+    assert len(_entries(cache_dir)) == 3
+
+    clear_cache(cache_dir)
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_clear_cache_default_directory(tmp_path, cache_dir, monkeypatch):
+    monkeypatch.setattr(awesio.cache, "CACHE_DIR", cache_dir)
+    (tmp_path / "doc.yml").write_text("value: 1\n")
+    load_yaml(tmp_path / "doc.yml", cache=True)
+    assert _entries(cache_dir)
+
+    clear_cache()
+    assert not _entries(cache_dir)
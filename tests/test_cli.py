@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+import shutil
+from xml.etree import ElementTree
+
+import pytest
+
+from awesio import cli
+from awesio.yaml import load_yaml, write_yaml
+
+from conftest import EXAMPLES_PATH
+
+POWER_CURVES = EXAMPLES_PATH / "ground_gen" / "soft_kite_pumping_ground_gen_power_curves.yml"
+
+
+@pytest.fixture
+def files(tmp_path):
+    """A valid and an invalid file, and a valid file in a subdirectory."""
+    valid = tmp_path / "valid.yml"
+    shutil.copy(POWER_CURVES, valid)
+    data = load_yaml(POWER_CURVES)
+    data["power_curves"][0]["profile_id"] = "first"
+    data["power_curves"][1]["cycle_power_w"] = "high"
+    invalid = tmp_path / "invalid.yml"
+    write_yaml(data, invalid)
+    (tmp_path / "nested").mkdir()
+    nested = tmp_path / "nested" / "nested.yaml"
+    shutil.copy(POWER_CURVES, nested)
+    (tmp_path / "nested" / "notes.txt").write_text("Not validated")
+    return valid, invalid, nested
+
+
+def _run(argv: list, capsys) -> tuple[int, str]:
+    code = cli.main(argv)
+    return code, capsys.readouterr().out
+
+
+def test_json_report(files, capsys):
+    valid, invalid, _ = files
+    code, output = _run(["validate", str(valid), str(invalid), "--format", "json", "-j", "1"], capsys)
+    report = json.loads(output)
+    assert code == 1
+    summary = report["summary"]
+    assert (summary["total"], summary["passed"], summary["failed"]) == (2, 1, 1)
+    assert summary["wall_time_s"] > 0 and summary["validation_time_s"] > 0
+    valid_result, invalid_result = report["results"]
+    assert valid_result["file"] == str(valid) and valid_result["passed"] and valid_result["error"] is None
+    assert valid_result["schema"] == "power_curves_schema.yml"
+    assert invalid_result["file"] == str(invalid) and not invalid_result["passed"]
+    assert invalid_result["error"].startswith("ValueError: Validation failed for schema 'power_curves_schema'")
+    assert "'power_curves.0.profile_id'" in invalid_result["error"]
+    assert "'power_curves.1.cycle_power_w'" in invalid_result["error"]
+
+    code, output = _run(["validate", str(valid), "--format", "json"], capsys)
+    assert code == 0 and json.loads(output)["summary"]["failed"] == 0
+
+
+def test_junit_report(files, tmp_path, capsys):
+    valid, invalid, _ = files
+    report_path = tmp_path / "report.xml"
+    code, output = _run(["validate", str(valid), str(invalid), "--format", "junit", "-o", str(report_path)], capsys)
+    assert code == 1 and output == ""
+
+    suite = ElementTree.parse(report_path).getroot()
+    assert suite.tag == "testsuite"
+    assert (suite.get("tests"), suite.get("failures"), suite.get("errors")) == ("2", "1", "0")
+    valid_case, invalid_case = suite.findall("testcase")
+    assert valid_case.get("name") == str(valid) and valid_case.get("classname") == "power_curves_schema.yml"
+    assert valid_case.find("failure") is None
+    failure = invalid_case.find("failure")
+    assert invalid_case.get("name") == str(invalid)
+    assert failure.get("message") == "ValueError: Validation failed for schema 'power_curves_schema':"
+    assert "profile_id" in failure.text
+
+
+def test_text_report_and_error_limits(files, capsys):
+    valid, invalid, _ = files
+    code, output = _run(["validate", str(valid), str(invalid)], capsys)
+    assert code == 1
+    assert f"[PASS] {valid}" in output and f"[FAIL] {invalid}" in output
+    assert "Total: 2 | Passed: 1 | Failed: 1" in output
+
+    code, output = _run(["validate", str(invalid), "--format", "json", "--fail-fast"], capsys)
+    assert code == 1 and json.loads(output)["results"][0]["error"].count("  - At ") == 1
+
+
+def test_paths_expansion(files, tmp_path, capsys):
+    valid, invalid, nested = files
+    assert cli.expand_paths([str(tmp_path)]) == [invalid, nested, valid]
+    assert cli.expand_paths([str(tmp_path / "*.yml"), str(valid)]) == [invalid, valid]
+    assert cli.expand_paths([str(tmp_path / "**" / "*.yaml")]) == [nested]
+    missing = tmp_path / "missing.yml"
+    assert cli.expand_paths([str(missing)]) == [missing]
+
+    code, output = _run(["validate", str(tmp_path / "nested"), str(missing), "--format", "json"], capsys)
+    results = json.loads(output)["results"]
+    assert code == 1 and [result["passed"] for result in results] == [True, False]
+    assert results[1]["error"] == f"FileNotFoundError: File not found: {missing}"
+
+    (tmp_path / "empty").mkdir()
+    assert cli.main(["validate", str(tmp_path / "empty")]) == 2
+
+
+def test_workers_keep_input_order(files, capsys):
+    paths = [str(path) for path in files] * 2
+    _, serial = _run(["validate", *paths, "--format", "json", "-j", "1"], capsys)
+    _, parallel = _run(["validate", *paths, "--format", "json", "-j", "2"], capsys)
+    keys = ("file", "schema", "passed", "error")
+    serial_results = [{key: result[key] for key in keys} for result in json.loads(serial)["results"]]
+    parallel_results = [{key: result[key] for key in keys} for result in json.loads(parallel)["results"]]
+    assert parallel_results == serial_results
+    # Duplicates are validated once
+    assert [result["file"] for result in serial_results] == [str(path) for path in files]
@@ -0,0 +1,79 @@
+import copy
+
+import pytest
+
+from awesio.document import ValidatedDocument
+
+from conftest import EXAMPLES_PATH
+
+SYSTEM = EXAMPLES_PATH / "ground_gen" / "soft_kite_pumping_ground_gen_system.yml"
+POWER_CURVES = EXAMPLES_PATH / "ground_gen" / "soft_kite_pumping_ground_gen_power_curves.yml"
+
+
+@pytest.fixture(scope="module")
+def system():
+    return ValidatedDocument(SYSTEM)
+
+
+@pytest.fixture(scope="module")
+def power_curves():
+    return ValidatedDocument(POWER_CURVES)
+
+
+def test_valid_patch_is_applied(system):
+    diameter = system.data["components"]["tether"]["structure"]["diameter_m"]
+    system.apply_patch([
+        {"op": "replace", "path": "/components/tether/structure/diameter_m", "value": diameter * 2},
+        {"op": "test", "path": "/components/tether/structure/diameter_m", "value": diameter * 2},
+    ])
+    assert system.data["components"]["tether"]["structure"]["diameter_m"] == diameter * 2
+    system.apply_patch([{"op": "replace", "path": "/components/tether/structure/diameter_m", "value": diameter}])
+
+
+@pytest.mark.parametrize("patch", [
+    # Schema error
+    [{"op": "replace", "path": "/components/tether/structure/diameter_m", "value": "thick"}],
+    # Unknown property of the restrictive schema
+    [{"op": "add", "path": "/components/tether/structure/colour", "value": "red"}],
+    # Valid operations followed by an invalid one
+    [
+        {"op": "replace", "path": "/metadata/name", "value": "Renamed"},
+        {"op": "remove", "path": "/components/tether/structure/diameter_m"},
+    ],
+    # Path errors after a valid operation
+    [
+        {"op": "replace", "path": "/metadata/name", "value": "Renamed"},
+        {"op": "replace", "path": "/components/missing/value", "value": 1},
+    ],
+    # Failed test after a valid operation
+    [
+        {"op": "replace", "path": "/metadata/name", "value": "Renamed"},
+        {"op": "test", "path": "/metadata/name", "value": "Other"},
+    ],
+], ids=["schema", "additional_property", "remove_required", "path_not_found", "test_failed"])
+def test_invalid_patch_is_rolled_back(system, patch):
+    before = copy.deepcopy(system.data)
+    with pytest.raises(ValueError):
+        system.apply_patch(patch)
+    assert system.data == before
+
+
+def test_consistency_error_is_rolled_back(power_curves):
+    before = copy.deepcopy(power_curves.data)
+    curve = power_curves.data["power_curves"][0]
+    with pytest.raises(ValueError):
+        power_curves.apply_patch([
+            {"op": "replace", "path": "/power_curves/0/probability_weight", "value": curve["probability_weight"] + 0.5},
+        ])
+    assert power_curves.data == before
+
+
+def test_list_operations_are_rolled_back(power_curves):
+    before = copy.deepcopy(power_curves.data)
+    with pytest.raises(ValueError):
+        power_curves.apply_patch([
+            {"op": "copy", "from": "/power_curves/0", "path": "/power_curves/-"},
+            {"op": "move", "from": "/power_curves/1", "path": "/power_curves/0"},
+            {"op": "remove", "path": "/power_curves/2/cycle_power_w"},
+        ])
+    assert power_curves.data == before
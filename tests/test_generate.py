@@ -0,0 +1,48 @@
+import pytest
+
+from awesio.generate import GENERATORS, generate
+from awesio.validator import validate
+from awesio.yaml import load_yaml
+
+SIZES = {
+    "wind_resource_schema": {
+        "small": {"n_clusters": 1, "n_altitudes": 2, "n_wind_speed_bins": 1, "n_wind_direction_bins": 1},
+        "large": {"n_clusters": 40, "n_altitudes": 101, "n_wind_speed_bins": 80, "n_wind_direction_bins": 72},
+    },
+    "power_curves_schema": {
+        "small": {"n_curves": 1, "n_altitudes": 2, "n_wind_speeds": 2},
+        "large": {"n_curves": 60, "n_altitudes": 101, "n_wind_speeds": 200},
+    },
+    "operational_constraints_schema": {
+        "small": {"n_azimuth_zones": 1, "n_distance_restrictions": 1},
+        "large": {"n_azimuth_zones": 36, "n_distance_restrictions": 20},
+    },
+}
+CASES = [(schema_type, size) for schema_type in GENERATORS for size in ["small", "default", "large"]]
+
+
+@pytest.mark.parametrize("schema_type, size", CASES, ids=[f"{schema_type}-{size}" for schema_type, size in CASES])
+def test_generated_documents_are_valid(schema_type, size, tmp_path):
+    sizes = SIZES[schema_type].get(size, {})
+    generate(schema_type, tmp_path / "generated.yml", seed=7, **sizes)
+    data = validate(load_yaml(tmp_path / "generated.yml", fast=True), copy=False)
+    assert data["metadata"]["schema"] == f"{schema_type}.yml"
+    for name, value in sizes.items():
+        if name in data["metadata"]:
+            assert data["metadata"][name] == value
+
+
+@pytest.mark.parametrize("schema_type", GENERATORS)
+def test_generators_are_deterministic(schema_type, tmp_path):
+    sizes = SIZES[schema_type]["small"]
+    for name, seed in [("first.yml", 3), ("second.yml", 3), ("other.yml", 4)]:
+        generate(schema_type, tmp_path / name, seed=seed, **sizes)
+    assert (tmp_path / "first.yml").read_bytes() == (tmp_path / "second.yml").read_bytes()
+    assert (tmp_path / "first.yml").read_bytes() != (tmp_path / "other.yml").read_bytes()
+
+
+def test_generate_errors(tmp_path):
+    with pytest.raises(ValueError, match="No generator for schema 'system_schema'"):
+        generate("system_schema.yml", tmp_path / "system.yml")
+    with pytest.raises(ValueError, match="Unknown sizes for schema 'power_curves_schema': n_clusters"):
+        generate("power_curves_schema", tmp_path / "power_curves.yml", n_clusters=3)
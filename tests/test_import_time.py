@@ -0,0 +1,45 @@
+"""
+Checks that importing the awesio modules does not import the heavy dependencies (see `awesio._lazy`).
+
+Each import runs in a fresh interpreter, as the test session itself has them imported already.
+``scripts/benchmark_import_time.py`` reports the same check with the import times.
+"""
+import json
+import pkgutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import awesio
+
+SRC_PATH = Path(awesio.__file__).parent.parent
+MODULES = ["awesio", *(module.name for module in pkgutil.iter_modules(awesio.__path__, "awesio."))]
+# Modules which must only be imported by the code paths using them
+HEAVY_MODULES = ["numpy", "xarray", "netCDF4", "pandas", "dask"]
+# Generous budget (the imports take 0.1-0.2 s), only meant to catch an eager heavy import
+MAX_SECONDS = 1.0
+
+_PROBE = """
+import json, sys, time
+sys.path.insert(0, {src!r})
+tic = time.perf_counter()
+import {module}
+toc = time.perf_counter()
+print(json.dumps({{"time": toc - tic, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def probe_import(module: str) -> dict:
+    """Imports ``module`` in a fresh interpreter and returns its import time and the heavy modules it imported."""
+    probe = _PROBE.format(src=str(SRC_PATH), module=module, heavy=HEAVY_MODULES)
+    output = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_import_is_lazy(module):
+    result = probe_import(module)
+    assert result["heavy"] == [], f"Importing {module} imports {', '.join(result['heavy'])}"
+    assert result["time"] < MAX_SECONDS
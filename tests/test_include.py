@@ -0,0 +1,66 @@
+import pytest
+
+import awesio.yaml
+from awesio.yaml import load_yaml
+
+
+@pytest.fixture(params=[False, True], ids=["pure", "fast"])
+def fast(request):
+    return request.param
+
+
+def _write(directory, files: dict) -> None:
+    for name, text in files.items():
+        path = directory / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+
+
+def test_included_file_is_parsed_once(tmp_path, fast, monkeypatch):
+    _write(tmp_path, {
+        "main.yml": "x: !include part.yml\ny: !include part.yml\nz: !include sub/leaf.yml\n",
+        "part.yml": "values: [1, 2]\nleaf: !include sub/leaf.yml\n",
+        "sub/leaf.yml": "a: 1\n",
+    })
+    parsed = []
+    load = awesio.yaml.load_yaml
+
+    def counting_load(filename, *args, **kwargs):
+        parsed.append(filename.relative_to(tmp_path).as_posix())
+        return load(filename, *args, **kwargs)
+
+    monkeypatch.setattr(awesio.yaml, "load_yaml", counting_load)  # Only the nested loads of the includes
+    data = load_yaml(tmp_path / "main.yml", fast=fast)
+
+    assert data == {
+        "x": {"values": [1, 2], "leaf": {"a": 1}},
+        "y": {"values": [1, 2], "leaf": {"a": 1}},
+        "z": {"a": 1},
+    }
+    assert sorted(parsed) == ["part.yml", "sub/leaf.yml"]
+    # Later includes are copies
+    data["x"]["values"].append(3)
+    assert data["y"]["values"] == [1, 2]
+    assert data["z"] is not data["x"]["leaf"]
+
+
+def test_include_cycle_raises(tmp_path, fast):
+    _write(tmp_path, {"a.yml": "b: !include b.yml\n", "b.yml": "a: !include a.yml\n"})
+    with pytest.raises(ValueError, match="Include cycle detected: .*a.yml -> .*b.yml -> .*a.yml"):
+        load_yaml(tmp_path / "a.yml", fast=fast)
+
+
+def test_self_include_raises(tmp_path, fast):
+    _write(tmp_path, {"a.yml": "a: !include a.yml\n"})
+    with pytest.raises(ValueError, match="Include cycle detected"):
+        load_yaml(tmp_path / "a.yml", fast=fast)
+
+
+def test_same_file_in_separate_branches_is_not_a_cycle(tmp_path, fast):
+    _write(tmp_path, {
+        "main.yml": "a: !include a.yml\nb: !include b.yml\n",
+        "a.yml": "leaf: !include leaf.yml\n",
+        "b.yml": "leaf: !include leaf.yml\n",
+        "leaf.yml": "value: 1\n",
+    })
+    assert load_yaml(tmp_path / "main.yml", fast=fast) == {"a": {"leaf": {"value": 1}}, "b": {"leaf": {"value": 1}}}
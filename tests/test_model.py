@@ -0,0 +1,57 @@
+import copy
+
+import numpy as np
+import pytest
+
+from awesio.model import UNSET, System, from_dict, to_dict
+from awesio.validator import validate
+
+from conftest import example_files
+
+SYSTEM_FILES = [path for path in example_files() if "system" in path.name]
+
+
+@pytest.fixture
+def system_data():
+    return validate(SYSTEM_FILES[0])
+
+
+@pytest.mark.parametrize("path", SYSTEM_FILES, ids=lambda path: path.name)
+def test_round_trip(path):
+    data = validate(path)
+    before = copy.deepcopy(data)
+    system = from_dict(data)
+    assert to_dict(system) == before
+    assert data == before
+
+
+def test_array_fields_are_arrays(system_data):
+    aerodynamics = system_data["components"]["wing"]["aerodynamics"]
+    aerodynamics["lift_polynomial"] = [0.1, 0.2, 0.3]
+    aerodynamics["drag_polynomial"] = [[1, 2], [3, 4]]
+    system = System.from_dict(system_data)
+
+    model_aerodynamics = system.components.wing.aerodynamics
+    assert isinstance(model_aerodynamics.lift_polynomial, np.ndarray)
+    assert model_aerodynamics.lift_polynomial.dtype == np.float64
+    assert isinstance(model_aerodynamics.drag_polynomial, np.ndarray)
+    assert model_aerodynamics.drag_polynomial.dtype == np.int64
+    # Mixed integers and floats stay a list, so the integers survive the round trip
+    assert model_aerodynamics.wing_airfoils.alpha_range == [-10, 31, 0.5]
+
+    result = system.to_dict()
+    assert result == system_data
+    assert type(result["components"]["wing"]["aerodynamics"]["lift_polynomial"]) is list
+
+
+def test_fields(system_data):
+    system = System.from_dict(system_data)
+    with pytest.raises(AttributeError):
+        system.components.tether.colour = "red"
+    assert not hasattr(system.components.tether, "__dict__")
+    with pytest.raises(TypeError):
+        System(system.metadata)  # Keyword-only
+    with pytest.raises(TypeError, match="colour"):
+        System(colour="red")
+    assert System().components is UNSET and System().to_dict() == {}
+    assert System.from_dict(system_data) == system
@@ -0,0 +1,62 @@
+import json
+
+import numpy as np
+import pytest
+
+from awesio.validator import validate
+from awesio.yaml import _get_YAML, load, load_netcdf, load_yaml, write, write_netcdf, write_yaml
+
+from conftest import EXAMPLES_PATH, example_files
+
+NETCDF_FILES = [
+    path for path in example_files()
+    if load_yaml(path)["metadata"]["schema"] in ("wind_resource_schema.yml", "power_curves_schema.yml")
+]
+
+
+@pytest.mark.parametrize("path", NETCDF_FILES, ids=lambda path: path.name)
+def test_round_trip(path, tmp_path):
+    data = load_yaml(path)
+    write(data, tmp_path / "document.nc")
+    loaded = load(tmp_path / "document.nc")
+    assert loaded == data
+    # Same types (integers stay integers) and key order
+    assert json.dumps(loaded) == json.dumps(data)
+
+    arrays = load_netcdf(tmp_path / "document.nc", read_numpy=True)
+    expected = load_yaml(path, _get_YAML(read_numpy=True))
+    key = "altitudes" if "altitudes" in expected else "altitudes_m"
+    assert isinstance(arrays[key], np.ndarray)
+    np.testing.assert_array_equal(arrays[key], expected[key])
+
+
+@pytest.mark.parametrize("path", NETCDF_FILES, ids=lambda path: path.name)
+def test_validate_netcdf(path, tmp_path):
+    write_netcdf(load_yaml(path), tmp_path / "document.nc")
+    assert validate(tmp_path / "document.nc") == validate(path)
+    assert validate(str(tmp_path / "document.nc")) == validate(path)
+
+
+def test_validate_invalid_netcdf(tmp_path):
+    data = load_yaml(EXAMPLES_PATH / "ground_gen" / "soft_kite_pumping_ground_gen_power_curves.yml")
+    data["power_curves"][0]["probability_weight"] += 0.5
+    write_netcdf(data, tmp_path / "invalid.nc")
+    with pytest.raises(ValueError, match="probability_weight"):
+        validate(tmp_path / "invalid.nc")
+
+
+def test_write_dispatch(tmp_path):
+    data = load_yaml(EXAMPLES_PATH / "wind_resource.yml")
+    write(data, tmp_path / "dispatched.yml")
+    write_yaml(data, tmp_path / "direct.yml")
+    assert (tmp_path / "dispatched.yml").read_bytes() == (tmp_path / "direct.yml").read_bytes()
+    assert load(tmp_path / "dispatched.yml") == data
+
+
+def test_unsupported_documents(tmp_path):
+    with pytest.raises(ValueError):
+        write_netcdf(load_yaml(EXAMPLES_PATH / "ground_gen" / "soft_kite_pumping_ground_gen_system.yml"), tmp_path / "system.nc")
+    data = load_yaml(EXAMPLES_PATH / "wind_resource.yml")
+    data["clusters"][0]["u_normalized"] = data["clusters"][0]["u_normalized"][:-1]  # Ragged
+    with pytest.raises(ValueError):
+        write_netcdf(data, tmp_path / "ragged.nc")
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+import xarray as xr
+from xarray.backends.netCDF4_ import NetCDF4ArrayWrapper
+
+from awesio.validator import validate
+from awesio.yaml import load_yaml, open_yaml, write_netcdf
+
+from conftest import EXAMPLES_PATH
+
+WIND_RESOURCE = EXAMPLES_PATH / "wind_resource.yml"
+
+
+@pytest.fixture
+def document(tmp_path):
+    """A YAML file including the wind resource example written to NetCDF, and a plain dataset."""
+    write_netcdf(load_yaml(WIND_RESOURCE), tmp_path / "wind_resource.nc")
+    xr.Dataset(
+        {"power": (("time",), np.linspace(0.0, 1.0, 5))}, coords={"time": np.arange(5)},
+    ).to_netcdf(tmp_path / "plain.nc")
+    (tmp_path / "site.yml").write_text(
+        "name: site\nresource: !include wind_resource.nc\nmeasurements: !include plain.nc\n"
+    )
+    return tmp_path / "site.yml"
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    """Names of the NetCDF variables read from disk."""
+    reads = []
+    getitem = NetCDF4ArrayWrapper._getitem
+
+    def recording_getitem(self, key):
+        reads.append(self.variable_name)
+        return getitem(self, key)
+
+    monkeypatch.setattr(NetCDF4ArrayWrapper, "_getitem", recording_getitem)
+    return reads
+
+
+def _read(value):
+    """Reads the lazily loaded arrays, as lists like an eager load."""
+    if isinstance(value, dict):
+        return {key: _read(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_read(item) for item in value]
+    if isinstance(value, xr.DataArray):
+        return value.values.tolist()
+    return value
+
+
+def test_included_data_is_read_on_access(document, reads):
+    with open_yaml(document) as data:
+        matrix = data["resource"]["probability_matrix"]["data"]
+        assert isinstance(matrix, xr.DataArray)
+        assert isinstance(data["resource"]["clusters"][0]["u_normalized"], xr.DataArray)
+        assert isinstance(data["measurements"]["power"]["data"], xr.DataArray)
+        # Only the coordinates (dimension indexes) are read when opening the files
+        assert "probability_matrix" not in reads and "power" not in reads
+
+        np.asarray(matrix)
+        assert reads.count("probability_matrix") == 1
+        np.asarray(matrix)
+        assert reads.count("probability_matrix") == 2  # Not kept in memory
+        assert "power" not in reads
+
+
+def test_lazy_values_equal_eager_load(document):
+    eager = load_yaml(document)
+    with open_yaml(document) as data:
+        assert _read(data) == eager
+        validate(data["resource"])
+    assert eager["resource"] == load_yaml(WIND_RESOURCE)
@@ -0,0 +1,55 @@
+import copy
+import hashlib
+import os
+from pathlib import Path
+
+import awesio.validator
+from awesio.schemas import (
+    _load_bundle, _source_hash, available_schema_types, build_schema_bundle, load_schema, stale_schemas,
+)
+
+
+def test_bundle_is_up_to_date():
+    # Rebuild it with: python scripts/build_schema_bundle.py
+    assert stale_schemas() == []
+
+
+def test_bundle_matches_yaml_schemas():
+    bundle = _load_bundle()
+    assert bundle == build_schema_bundle()
+    for schema_type, entry in bundle["schemas"].items():
+        assert load_schema(schema_type) == entry["schema"]
+        assert load_schema(schema_type, restrictive=True) == entry["restrictive"]
+
+
+def test_changed_source_is_stale():
+    bundle = copy.deepcopy(_load_bundle())
+    schema_type = next(iter(bundle["schemas"]))
+    bundle["schemas"][schema_type]["sha256"] = "0" * 64
+    assert stale_schemas(bundle) == [schema_type]
+    assert stale_schemas({}) == sorted(bundle["schemas"])
+
+
+def test_source_hash_is_computed_once(tmp_path, monkeypatch):
+    schema_file = tmp_path / "schema.yml"
+    schema_file.write_text("type: object\n")
+    first = _source_hash(schema_file)
+
+    reads = []
+    read_bytes = Path.read_bytes
+    monkeypatch.setattr(Path, "read_bytes", lambda path: reads.append(path) or read_bytes(path))
+    assert _source_hash(schema_file) == first and reads == []
+
+    # Same size, new mtime
+    schema_file.write_text("type: string\n")
+    os.utime(schema_file, ns=(0, schema_file.stat().st_mtime_ns + 1))
+    assert _source_hash(schema_file) == hashlib.sha256(b"type: string\n").hexdigest()
+    assert reads == [schema_file]
+
+    awesio.validator.clear_validator_cache()
+    stale_schemas()
+    reads.clear()
+    for schema_type in available_schema_types():
+        awesio.validator.get_validator(schema_type)
+        awesio.validator.get_validator(schema_type, restrictive=False, defaults=True)
+    assert reads == []  # Each schema is hashed once per process
@@ -0,0 +1,121 @@
+import copy
+
+import numpy as np
+import pytest
+
+from awesio.tables import check_columns, check_rows, is_table, read_tables, to_table
+from awesio.validator import _validate_tables, validate
+from awesio.yaml import load_yaml, write_yaml
+
+from conftest import EXAMPLES_PATH
+
+SYSTEM = EXAMPLES_PATH / "ground_gen" / "soft_kite_pumping_ground_gen_system.yml"
+HEADERS = ["id", "x", "flag", "name", "info"]
+ROWS = [
+    [1, 0.5, True, "a", {"t": 0.1}],
+    [2, 1, False, "bcd", {"t": 0.2}],
+    [3, -2.5, True, "", None],
+]
+
+
+def test_column_dtypes():
+    table = to_table(HEADERS, ROWS)
+    assert table.shape == (3,)
+    assert table.dtype["id"] == np.int64
+    assert table.dtype["x"] == np.float64  # Integers and floats mixed
+    assert table.dtype["flag"] == np.bool_
+    assert table.dtype["name"] == np.dtype("U3")
+    assert table.dtype["info"] == object
+    assert table["x"].tolist() == [0.5, 1.0, -2.5]
+    assert table["info"].tolist() == [{"t": 0.1}, {"t": 0.2}, None]
+    assert to_table(["a"], []).dtype["a"] == np.float64
+
+
+def test_int64_overflow_is_object():
+    table = to_table(["small", "large", "mixed"], [[1, 2**63, 1.5], [2, 3, 2**64]])
+    assert table.dtype["small"] == np.int64
+    assert table.dtype["large"] == object and table["large"].tolist() == [2**63, 3]
+    assert table.dtype["mixed"] == object and table["mixed"].tolist() == [1.5, 2**64]
+    assert to_table(["min"], [[-2**63]]).dtype["min"] == np.int64
+
+
+def test_rows_of_the_wrong_width():
+    rows = [[1, 2], [3], [4, 5], [6, 7, 8]]
+    message = r"Table row 1 has 1 values, expected 2 \(a, b\) \(1 more rows with the wrong width\)"
+    with pytest.raises(ValueError, match=message):
+        check_rows(["a", "b"], rows)
+    with pytest.raises(ValueError, match=message):
+        to_table(["a", "b"], rows)
+    check_rows(["a", "b"], [[1, 2]])
+
+
+def test_columns_mixing_numbers_and_strings():
+    rows = [[1, "a"], ["b", "c"]]
+    for table in [rows, to_table(["x", "y"], rows)]:
+        with pytest.raises(ValueError, match="Table column 'x' mixes numbers and strings"):
+            check_columns(["x", "y"], table)
+    check_columns(["x", "y"], [[1, "a"], [2.5, "c"]])
+    check_columns(HEADERS, to_table(HEADERS, ROWS))
+
+
+def test_structured_array_fields():
+    table = to_table(HEADERS, ROWS)
+    assert to_table(HEADERS, table) is table
+    with pytest.raises(ValueError, match="differ from the headers"):
+        to_table(["id", "x"], table)
+    array = to_table(["a", "b"], np.arange(6.0).reshape(3, 2))
+    assert array.dtype.names == ("a", "b") and array["b"].tolist() == [1.0, 3.0, 5.0]
+    with pytest.raises(ValueError, match=r"shape \(3, 2\) does not have 3 columns"):
+        to_table(["a", "b", "c"], np.arange(6.0).reshape(3, 2))
+
+
+def test_is_table():
+    assert is_table({"headers": ["a", "b"], "data": [[1, 2]]})
+    assert is_table({"headers": ["a"], "data": np.zeros((2, 1))})
+    assert not is_table({"headers": ["a", "a"], "data": [[1, 2]]})
+    assert not is_table({"headers": [], "data": []})
+    assert not is_table({"headers": ["a"], "data": [1, 2]})
+    assert not is_table([["a"], [[1]]])
+
+
+def test_validate_tables_errors():
+    system = load_yaml(SYSTEM)
+    sections = system["components"]["wing"]["structure"]["wing_sections"]
+    sections["data"][2] = sections["data"][2][:-1]
+    with pytest.raises(ValueError, match=r"At 'components.wing.structure.wing_sections': Table row 2 has 9 values"):
+        _validate_tables(system)
+
+    system = load_yaml(SYSTEM)
+    system["components"]["wing"]["structure"]["wing_sections"]["data"][1][0] = "seventeen"
+    with pytest.raises(
+        ValueError, match="At 'components.wing.structure.wing_sections': Table column 'airfoil_id' mixes numbers and strings"
+    ):
+        validate(system)
+
+
+def test_read_and_write_tables(tmp_path):
+    system = load_yaml(SYSTEM)
+    tables = load_yaml(SYSTEM, tables=True)
+    assert read_tables(copy.deepcopy(system)).keys() == tables.keys()
+    sections = tables["components"]["wing"]["structure"]["wing_sections"]["data"]
+    assert sections.dtype["airfoil_id"] == np.int64 and sections.dtype["LE_x"] == np.float64
+    np.testing.assert_array_equal(
+        read_tables(copy.deepcopy(system))["components"]["wing"]["structure"]["wing_sections"]["data"], sections
+    )
+    validate(tables)
+
+    write_yaml(tables, tmp_path / "tables.yml")
+    write_yaml(system, tmp_path / "lists.yml")
+    assert (tmp_path / "tables.yml").read_bytes() == (tmp_path / "lists.yml").read_bytes()
+    assert load_yaml(tmp_path / "tables.yml") == system
+
+    # Integers of float columns are written back as floats
+    write_yaml({"table": {"headers": HEADERS, "data": to_table(HEADERS, ROWS)}}, tmp_path / "columns.yml")
+    expected = copy.deepcopy(ROWS)
+    expected[1][1] = 1.0
+    assert load_yaml(tmp_path / "columns.yml") == {"table": {"headers": HEADERS, "data": expected}}
+    assert type(load_yaml(tmp_path / "columns.yml")["table"]["data"][1][1]) is float
+
+    # Tables with rows of the wrong width are left as lists
+    broken = {"table": {"headers": ["a", "b"], "data": [[1, 2], [3]]}}
+    assert read_tables(copy.deepcopy(broken)) == broken
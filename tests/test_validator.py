@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import copy
+import json
+import re
+
+import jsonschema
+import numpy as np
+import pytest
+
+import awesio.validator
+from awesio.overlay import Overlay
+from awesio.validator import NumericDraft7Validator, _validate_probability_matrix, extend_with_default, validate
+from awesio.yaml import load_yaml
+
+from conftest import EXAMPLES_PATH, example_files
+
+
+def test_injected_defaults_are_copies():
+    validator = extend_with_default(jsonschema.Draft7Validator)(
+        {"type": "object", "properties": {"tags": {"type": "array", "default": []}}}
+    )
+    first = {}
+    validator.validate(first)
+    first["tags"].append("modified")
+
+    second = {}
+    validator.validate(second)
+    assert second == {"tags": []}
+    assert validator.schema["properties"]["tags"]["default"] == []
+
+
+@pytest.fixture
+def defaults_schema(monkeypatch):
+    """Replaces the validators by one of a schema with defaults (the awesIO schemas have none)."""
+    schema = {
+        "$id": "defaults_schema.yml",
+        "type": "object",
+        "properties": {
+            "metadata": {"type": "object"},
+            "settings": {
+                "type": "object",
+                "properties": {
+                    "mode": {"type": "string", "default": "fast"},
+                    "options": {
+                        "type": "object",
+                        "default": {"retries": 3},
+                        "properties": {"retries": {"type": "integer"}, "tags": {"type": "array", "default": []}},
+                    },
+                },
+            },
+            "items": {
+                "type": "array",
+                "items": {"type": "object", "properties": {"weight": {"type": "number", "default": 1.0}}},
+            },
+        },
+    }
+    validator = extend_with_default(jsonschema.Draft7Validator)(schema)
+    monkeypatch.setattr(awesio.validator, "get_validator", lambda *args, **kwargs: validator)
+    return schema
+
+
+@pytest.mark.parametrize("path", example_files(), ids=lambda path: path.name)
+@pytest.mark.parametrize("defaults", [False, True], ids=["restrictive", "defaults"])
+def test_validate_without_copy_does_not_modify_input(path, defaults):
+    data = load_yaml(path, fast=True)
+    before = copy.deepcopy(data)
+    result = validate(data, defaults=defaults, copy=False)
+    assert data == before
+    if defaults:
+        assert isinstance(result, Overlay) and result.to_dict() == validate(before, defaults=True)
+    else:
+        assert result is data
+
+
+def test_validate_without_copy_injects_defaults_in_overlay(defaults_schema):
+    data = {"metadata": {"schema": "defaults_schema.yml"}, "settings": {"mode": "slow"}, "items": [{}, {"weight": 2.0}]}
+    before = copy.deepcopy(data)
+
+    result = validate(data, defaults=True, copy=False)
+    assert data == before
+    assert isinstance(result, Overlay)
+    expected = {
+        "metadata": {"schema": "defaults_schema.yml"},
+        "settings": {"mode": "slow", "options": {"retries": 3, "tags": []}},
+        "items": [{"weight": 1.0}, {"weight": 2.0}],
+    }
+    assert result.to_dict() == expected == validate(before, defaults=True)
+    # The injected defaults are copies of the schema defaults
+    result["settings"]["options"]["tags"].append("modified")
+    assert defaults_schema["properties"]["settings"]["properties"]["options"]["default"] == {"retries": 3}
+    assert validate(before, defaults=True, copy=False)["settings"]["options"]["tags"] == []
+
+
+def test_validate_without_copy_of_invalid_input(defaults_schema):
+    data = {"metadata": {"schema": "defaults_schema.yml"}, "settings": {"mode": 1}, "items": [{}]}
+    before = copy.deepcopy(data)
+    with pytest.raises(ValueError):
+        validate(data, defaults=True, copy=False)
+    assert data == before
+
+
+@pytest.fixture(scope="module")
+def wind_resource():
+    return load_yaml(EXAMPLES_PATH / "wind_resource.yml")
+
+
+def _probability_matrix_error(wind_resource, modify) -> str:
+    data = copy.deepcopy(wind_resource)
+    modify(data, data["probability_matrix"]["data"])
+    with pytest.raises(ValueError) as error:
+        _validate_probability_matrix(data)
+    return str(error.value)
+
+
+def _scale_to(total):
+    def modify(data, matrix):
+        scale = total / sum(value for cluster in matrix for row in cluster for value in row)
+        data["probability_matrix"]["data"] = [[[value * scale for value in row] for row in cluster] for cluster in matrix]
+    return modify
+
+
+@pytest.mark.parametrize("modify, message", [
+    (lambda data, matrix: matrix[0].pop(), "regular numeric"),
+    (lambda data, matrix: data["probability_matrix"].update(data=matrix[0]), "regular numeric"),
+    (lambda data, matrix: data["metadata"].update(n_clusters=data["metadata"]["n_clusters"] + 1), "n_clusters"),
+    (
+        lambda data, matrix: data["metadata"].update(n_wind_direction_bins=data["metadata"]["n_wind_direction_bins"] - 1),
+        r"metadata.n_wind_direction_bins \(\d+\) along axis 2",
+    ),
+    (lambda data, matrix: matrix[0][1].__setitem__(2, -matrix[0][1][2] - 1.0), r"non-negative, got -[\d.]+ at index \[0, 1, 2\]"),
+    (lambda data, matrix: matrix[1][0].__setitem__(0, float("nan")), r"non-negative, got nan at index \[1, 0, 0\]"),
+    (_scale_to(100.2), r"should equal 100 \(%\), got 100.2"),
+    (_scale_to(99.8), r"should equal 100 \(%\), got 99.8"),
+], ids=["ragged", "2d", "clusters", "direction_bins", "negative", "nan", "total_above", "total_below"])
+def test_probability_matrix_errors(wind_resource, modify, message):
+    assert re.search(message, _probability_matrix_error(wind_resource, modify))
+
+
+def test_probability_matrix_rule(wind_resource):
+    data = copy.deepcopy(wind_resource)
+    _scale_to(100.05)(data, data["probability_matrix"]["data"])
+    validate(data)
+    _scale_to(100.2)(data, data["probability_matrix"]["data"])
+    with pytest.raises(ValueError, match="should equal 100"):
+        validate(data)
+    del data["probability_matrix"]["data"]
+    _validate_probability_matrix(data)  # No matrix to check
+
+
+NUMERIC_SCHEMAS = {
+    "numbers": {"type": "array", "items": {"type": "number", "minimum": 0, "maximum": 10}},
+    "integers": {"type": "array", "items": {"type": "integer", "exclusiveMinimum": 0}},
+    "matrix": {
+        "type": "array",
+        "items": {"type": "array", "items": {"type": "array", "items": {"type": "number", "minimum": 0}}},
+    },
+}
+NUMERIC_INSTANCES = {
+    "numbers": {
+        "valid": [0, 2.5, 10], "string": [1.0, "2", 3.0], "bool": [1.0, True], "null": [None, 1.0],
+        "below": [1.0, -0.5, 2.0], "above": [1.0, 10.5, 11], "nan": [1.0, float("nan")], "empty": [],
+    },
+    "integers": {"valid": [1, 2, 3], "float": [1, 2.5], "zero": [3, 0, -1], "string": ["1", 2]},
+    "matrix": {
+        "valid": [[[0.0, 1.0], [2.0, 3.0]], [[4.0, 5.0], [6.0, 7.0]]],
+        "string": [[[0.0, 1.0], [2.0, "x"]], [[4.0, 5.0], [6.0, 7.0]]],
+        "negative": [[[0.0, 1.0], [2.0, 3.0]], [[4.0, -5.0], [6.0, -7.0]]],
+        "ragged": [[[0.0, 1.0], [2.0]], [[4.0], 5.0]],
+        "shallow": [[0.0, 1.0], [2.0, 3.0]],
+    },
+}
+
+
+def _errors(validator, instance) -> list:
+    return sorted(
+        (list(error.absolute_path), list(error.absolute_schema_path), error.validator, error.message)
+        for error in validator.iter_errors(instance)
+    )
+
+
+@pytest.mark.parametrize("schema_name, instance_name", [
+    (schema_name, instance_name) for schema_name, instances in NUMERIC_INSTANCES.items() for instance_name in instances
+])
+def test_numeric_arrays_report_the_same_errors(schema_name, instance_name):
+    schema = NUMERIC_SCHEMAS[schema_name]
+    instance = NUMERIC_INSTANCES[schema_name][instance_name]
+    expected = _errors(jsonschema.Draft7Validator(schema), instance)
+    assert _errors(NumericDraft7Validator(schema), instance) == expected
+    assert bool(expected) == (instance_name not in ("valid", "nan", "empty"))
+
+    # NumPy arrays of the same values report the same error locations as the lists
+    try:
+        array = np.array(instance)
+    except ValueError:  # Ragged
+        return
+    if array.dtype.kind in "iuf" and json.dumps(array.tolist()) == json.dumps(instance):
+        assert [error[:3] for error in _errors(NumericDraft7Validator(schema), array)] == [error[:3] for error in expected]
+
+
+@pytest.fixture(scope="module")
+def invalid_system():
+    """System document with 5 schema errors."""
+    data = load_yaml(EXAMPLES_PATH / "ground_gen" / "soft_kite_pumping_ground_gen_system.yml")
+    components = data["components"]
+    components["tether"]["structure"]["diameter_m"] = "thick"
+    components["tether"]["structure"]["colour"] = "red"
+    components["wing"]["structure"]["mass_kg"] = "heavy"
+    components["wing"]["name"] = 1
+    data["assembly"]["generation_type"] = 2
+    return data
+
+
+def _reported(error: pytest.ExceptionInfo) -> list[str]:
+    return [line for line in str(error.value).splitlines() if line.startswith("  - At ")]
+
+
+def test_error_modes(invalid_system):
+    with pytest.raises(ValueError) as error:
+        validate(invalid_system)
+    all_errors = _reported(error)
+    assert len(all_errors) >= 5
+
+    with pytest.raises(ValueError) as error:
+        validate(invalid_system, fail_fast=True)
+    assert _reported(error) == all_errors[:1] and "stopped after" not in str(error.value)
+
+    with pytest.raises(ValueError) as error:
+        validate(invalid_system, max_errors=3)
+    assert _reported(error) == all_errors[:3] and str(error.value).endswith("stopped after 3 errors")
+
+    with pytest.raises(ValueError) as error:
+        validate(invalid_system, max_errors=len(all_errors))
+    assert _reported(error) == all_errors and "stopped after" not in str(error.value)
+
+    validator = awesio.validator.get_validator("system_schema")
+    best = jsonschema.exceptions.best_match(validator.iter_errors(invalid_system))
+    with pytest.raises(ValueError) as error:
+        validate(invalid_system, best_match=True)
+    assert _reported(error) == [f"  - At '{'.'.join(map(str, best.path))}': {best.message}"]
+
+    with pytest.raises(ValueError, match="max_errors must be at least 1"):
+        validate(invalid_system, max_errors=0)
+
+
+def test_errors_are_consumed_lazily(invalid_system, monkeypatch):
+    consumed = []
+    validator = awesio.validator.get_validator("system_schema")
+
+    class CountingValidator:
+        schema = validator.schema
+
+        def iter_errors(self, instance):
+            for error in validator.iter_errors(instance):
+                consumed.append(error)
+                yield error
+
+    monkeypatch.setattr(awesio.validator, "get_validator", lambda *args, **kwargs: CountingValidator())
+    with pytest.raises(ValueError):
+        validate(invalid_system, fail_fast=True)
+    assert len(consumed) == 1
+
+    consumed.clear()
+    with pytest.raises(ValueError):
+        validate(invalid_system, max_errors=2)
+    assert len(consumed) == 3  # One more, to report that errors were omitted
+
+    consumed.clear()
+    with pytest.raises(ValueError):
+        validate(invalid_system)
+    assert len(consumed) >= 5
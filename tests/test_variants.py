@@ -0,0 +1,55 @@
+import copy
+
+import pytest
+
+from awesio.validator import validate
+from awesio.variants import ParameterSweep
+from awesio.yaml import load_yaml
+
+from conftest import EXAMPLES_PATH
+
+SYSTEM = EXAMPLES_PATH / "ground_gen" / "soft_kite_pumping_ground_gen_system.yml"
+GRID = {
+    "components.tether.structure.diameter_m": [0.012, 0.014, 0.016],
+    "components.wing.structure.mass_kg": [40.0, 50.0],
+}
+
+
+@pytest.fixture
+def base():
+    return load_yaml(SYSTEM)
+
+
+def test_grid_variants_are_valid(base):
+    before = copy.deepcopy(base)
+    sweep = ParameterSweep(base, GRID)
+    assert len(sweep) == 6
+
+    for index, variant in enumerate(sweep):
+        data = variant.to_dict()
+        assert data["components"]["tether"]["structure"]["diameter_m"] == GRID["components.tether.structure.diameter_m"][index // 2]
+        assert data["components"]["wing"]["structure"]["mass_kg"] == GRID["components.wing.structure.mass_kg"][index % 2]
+        validate(data)
+    assert base == before and sweep.base == before
+
+
+def test_written_variants_are_valid(base, tmp_path):
+    before = copy.deepcopy(base)
+    sweep = ParameterSweep(base, [{"components.wing.structure.mass_kg": 45.0}, {"metadata.name": "Variant"}])
+    files = sweep.write(tmp_path)
+
+    assert [path.name for path in files] == ["variant_00000.yml", "variant_00001.yml"]
+    for path, variant in zip(files, sweep):
+        assert validate(path) == variant.to_dict()
+    assert base == before
+
+
+def test_invalid_variant_raises(base):
+    before = copy.deepcopy(base)
+    sweep = ParameterSweep(base, [{"components.wing.structure.mass_kg": 45.0}, {"components.wing.structure.mass_kg": "heavy"}])
+    sweep[0]
+    with pytest.raises(ValueError, match="Variant 1"):
+        sweep[1]
+    with pytest.raises(ValueError, match="Variant 0"):
+        ParameterSweep(base, [{"components.tether.structure.colour": "red"}])[0]
+    assert base == before
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from awesio.generate import generate
+from awesio.yaml import _get_YAML, load_yaml, write_yaml
+
+from conftest import example_files
+
+
+def _assert_identical(data, tmp_path):
+    write_yaml(data, tmp_path / "default.yml")
+    write_yaml(data, tmp_path / "fast.yml", fast=True)
+    assert (tmp_path / "fast.yml").read_bytes() == (tmp_path / "default.yml").read_bytes()
+
+
+@pytest.mark.parametrize("path", example_files(), ids=lambda path: path.name)
+@pytest.mark.parametrize("read_numpy", [False, True], ids=["lists", "numpy"])
+def test_fast_write_is_byte_identical(path, read_numpy, tmp_path):
+    _assert_identical(load_yaml(path, _get_YAML(read_numpy=read_numpy, fast=True)), tmp_path)
+
+
+@pytest.mark.parametrize("schema_type", ["wind_resource_schema", "power_curves_schema", "operational_constraints_schema"])
+def test_fast_write_of_generated_documents_is_byte_identical(schema_type, tmp_path):
+    generate(schema_type, tmp_path / "generated.yml", seed=3)
+    _assert_identical(load_yaml(tmp_path / "generated.yml"), tmp_path)
+
+
+def test_fast_write_of_mixed_values_is_byte_identical(tmp_path):
+    shared = [1.0, 2.0]
+    data = {
+        "floats": [0.1, 1e-20, -3.5e300, float("inf"), float("nan")],
+        "ints": [1, -2, 2**40],
+        "mixed": [1, 2.5],
+        "nested": [[1.0, 2.0], [3.0, 4.0]],
+        "ragged": [[1.0], [2.0, 3.0]],
+        "strings": ["a", "b"],
+        "records": [{"values": shared}, {"values": shared}],
+        "array": np.arange(6, dtype=float).reshape(2, 3),
+        "empty": [],
+    }
+    _assert_identical(data, tmp_path)
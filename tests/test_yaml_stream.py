@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from awesio.generate import generate_power_curves, generate_wind_resource
+from awesio.yaml import _get_YAML, load_yaml, write_yaml
+
+from conftest import example_files
+
+
+def _assert_equal(actual, expected, path=()):
+    assert type(actual) is type(expected), path
+    if isinstance(expected, dict):
+        assert list(actual) == list(expected), path
+        for key in expected:
+            _assert_equal(actual[key], expected[key], path + (key,))
+    elif isinstance(expected, list):
+        assert len(actual) == len(expected), path
+        for i, (actual_item, expected_item) in enumerate(zip(actual, expected)):
+            _assert_equal(actual_item, expected_item, path + (i,))
+    elif isinstance(expected, np.ndarray):
+        assert (actual.dtype, actual.shape) == (expected.dtype, expected.shape), path
+        for field in expected.dtype.names or [None]:
+            actual_values = actual if field is None else actual[field]
+            expected_values = expected if field is None else expected[field]
+            if expected_values.dtype == object:
+                _assert_equal(actual_values.tolist(), expected_values.tolist(), path + (field,))
+            else:
+                np.testing.assert_array_equal(actual_values, expected_values, err_msg=str(path))
+    else:
+        assert actual == expected or actual != actual and expected != expected, path
+
+
+def _assert_stream_equal(path, fast=False, tables=False):
+    expected = load_yaml(path, _get_YAML(read_numpy=True, fast=fast, read_tables=tables))
+    _assert_equal(load_yaml(path, fast=fast, tables=tables, stream=True), expected)
+
+
+@pytest.mark.parametrize("path", example_files(), ids=lambda path: path.name)
+@pytest.mark.parametrize("fast", [False, True], ids=["pure", "fast"])
+@pytest.mark.parametrize("tables", [False, True], ids=["lists", "tables"])
+def test_stream_equals_read_numpy(path, fast, tables):
+    _assert_stream_equal(path, fast, tables)
+
+
+@pytest.mark.parametrize("generate", [generate_wind_resource, generate_power_curves])
+def test_stream_reads_generated_documents_from_events(generate, tmp_path, monkeypatch):
+    generate(tmp_path / "generated.yml", seed=5)
+    loader = _get_YAML(read_numpy=True, fast=True)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Loaded by the regular loader")
+
+    monkeypatch.setattr(loader, "load", fail)
+    stream = load_yaml(tmp_path / "generated.yml", loader, stream=True)
+    monkeypatch.undo()
+    _assert_equal(stream, load_yaml(tmp_path / "generated.yml", _get_YAML(read_numpy=True, fast=True)))
+
+
+def test_stream_of_sizes_not_matching_metadata(tmp_path):
+    generate_wind_resource(tmp_path / "generated.yml", n_clusters=3, n_wind_speed_bins=10, n_wind_direction_bins=8)
+    data = load_yaml(tmp_path / "generated.yml")
+    data["metadata"]["n_clusters"] = 4
+    data["metadata"]["n_wind_speed_bins"] = 9
+    write_yaml(data, tmp_path / "mismatched.yml")
+    _assert_stream_equal(tmp_path / "mismatched.yml")
+
+
+@pytest.mark.parametrize("content", [
+    "defaults: &defaults\n  values: [1.0, 2.0]\ncopy: *defaults\n",
+    "base: &base {a: 1, b: [1, 2]}\nmerged:\n  <<: *base\n  c: 3\n",
+    "%YAML 1.1\n---\nflags: [yes, no]\n",
+    "nested: [[1, 2], [3.5, 4]]\nragged: [[1], [2, 3]]\nmixed: [1, a]\nempty: []\n",
+    "? [complex, key]\n: value\n",
+], ids=["anchors", "merge_keys", "yaml_1_1", "sequences", "complex_key"])
+def test_stream_of_yaml_features(content, tmp_path):
+    (tmp_path / "document.yml").write_text(content)
+    for fast in [False, True]:
+        _assert_stream_equal(tmp_path / "document.yml", fast)